@@ -1,5 +1,22 @@
 from django.contrib import admin
-from .models import ContentItem
+from .models import Category, ContentItem
+from common_utility.utils.pagination_utility import EstimatedCountPaginator
 
-# Register your models here.
-admin.site.register(ContentItem)
+
+@admin.register(ContentItem)
+class ContentItemAdmin(admin.ModelAdmin):
+    """
+    Admin for content items, the unfiltered changelist uses the planner row estimate
+    instead of counting the whole table on every page.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_display = ["title", "author", "pdf_processing_status", "created_at"]
+    list_filter = ["pdf_processing_status"]
+    list_select_related = ["author"]
+
+
+@admin.register(Category)
+class CategoryAdmin(admin.ModelAdmin):
+    search_fields = ["name"]
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CmsAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'cms_app'
+
+    def ready(self):
+        # Connect the signal receivers
+        from cms_app import signals  # noqa: F401
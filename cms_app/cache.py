@@ -0,0 +1,12 @@
+from django.conf import settings
+from common_utility.utils.cache_utility import ReadThroughCache, get_cache_backend
+
+# Serialized representation of content items, keyed by id and `updated_at`
+content_item_cache = ReadThroughCache(
+    namespace="content_item",
+    backend=get_cache_backend(
+        alias=settings.CONTENT_CACHE_ALIAS,
+        max_entries=settings.CONTENT_CACHE_MAX_ENTRIES,
+    ),
+    timeout=settings.CONTENT_CACHE_TIMEOUT,
+)
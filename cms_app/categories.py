@@ -0,0 +1,121 @@
+from typing import Dict, Iterable, List, Optional
+from django.contrib.postgres.aggregates import StringAgg
+from django.db import connections
+from django.db.models import Aggregate, CharField, OuterRef, QuerySet, Subquery
+from cms_app.models import Category, ContentItem, ContentItemCategory
+from cms_app.signals import CONTENT_COUNT_CACHE_NAMESPACE
+from common_utility.utils.pagination_utility import invalidate_count_cache
+
+
+class GroupConcat(Aggregate):
+    """
+    Comma separated values of a group, in no particular order (SQLite, MySQL).
+    """
+
+    function = "GROUP_CONCAT"
+    output_field = CharField()
+
+
+def parse_categories(categories: Optional[str]) -> List[str]:
+    """
+    Split comma separated categories into unique, stripped category names.
+
+    Args:
+        categories (str): Categories as written by the author, e.g. "python, django".
+
+    Returns:
+        list: Category names in their original order.
+    """
+    if not categories:
+        return []
+    names = [name.strip()[:100] for name in categories.split(",")]
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def set_content_categories(content_items: Iterable[ContentItem]) -> None:
+    """
+    Replace the normalized categories of content items with the ones of their
+    `categories` field.
+
+    Runs a fixed number of queries whatever the number of content items, so it can be used
+    by the bulk endpoints.
+
+    Args:
+        content_items (iterable): Saved content items.
+    """
+    content_items = list(content_items)
+    if not content_items:
+        return
+
+    content_category_names = {
+        content_item.id: parse_categories(content_item.categories)
+        for content_item in content_items
+    }
+    all_names = {name for names in content_category_names.values() for name in names}
+
+    category_ids = {}
+    if all_names:
+        Category.objects.bulk_create(
+            [Category(name=name) for name in all_names], ignore_conflicts=True
+        )
+        category_ids = dict(
+            Category.objects.filter(name__in=all_names).values_list("name", "id")
+        )
+
+    ContentItemCategory.objects.filter(content_id__in=content_category_names).delete()
+    ContentItemCategory.objects.bulk_create(
+        [
+            ContentItemCategory(content_id=content_id, category_id=category_ids[name])
+            for content_id, names in content_category_names.items()
+            for name in names
+        ]
+    )
+
+    for content_item in content_items:
+        getattr(content_item, "_prefetched_objects_cache", {}).pop("category_tags", None)
+
+    # Category filtered listing totals depend on these rows
+    for author_id in {content_item.author_id for content_item in content_items}:
+        invalidate_count_cache(CONTENT_COUNT_CACHE_NAMESPACE, author_id)
+
+
+def annotate_category_names(queryset: QuerySet) -> QuerySet:
+    """
+    Annotate content items with `category_names`, the comma separated names of their
+    categories, computed by a subquery of the content query instead of a prefetch query.
+    Read them with `get_category_tags`.
+
+    Args:
+        queryset (QuerySet): Content items.
+
+    Returns:
+        QuerySet: The annotated content items.
+    """
+    content_categories = (
+        ContentItemCategory.objects.filter(content_id=OuterRef("pk"))
+        .order_by()
+        .values("content_id")
+    )
+    if connections[queryset.db].vendor == "postgresql":
+        names = StringAgg("category__name", delimiter=",", ordering="category__name")
+    else:
+        names = GroupConcat("category__name")
+    return queryset.annotate(
+        category_names=Subquery(content_categories.annotate(names=names).values("names"))
+    )
+
+
+def get_category_tags(content_items: List[ContentItem]) -> Dict[int, List[str]]:
+    """
+    Category names by content item ID of content items annotated by
+    `annotate_category_names`, ordered by name like the `category_tags` relation.
+    """
+    is_ordered = bool(content_items) and (
+        connections[content_items[0]._state.db].vendor == "postgresql"
+    )
+    category_tags = {}
+    for content_item in content_items:
+        # Category names can't contain commas, see `parse_categories`
+        names = content_item.category_names.split(",") if content_item.category_names else []
+        category_tags[content_item.id] = names if is_ordered else sorted(names)
+    return category_tags
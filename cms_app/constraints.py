@@ -0,0 +1,38 @@
+# Title unique constraint of ContentItem, deferrable where the database supports it
+TITLE_CONSTRAINT_NAME = "content_item_title_unique"
+
+# SQLite doesn't create deferrable unique constraints, the title is kept unique by an index
+SQLITE_TITLE_INDEX_SQL = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {TITLE_CONSTRAINT_NAME} "
+    "ON content_item_table (title)"
+)
+
+
+def create_sqlite_title_index(apps, schema_editor) -> None:
+    """
+    RunPython callable creating the title unique index on SQLite.
+    """
+    ensure_sqlite_title_index(schema_editor.connection, apps)
+
+
+def ensure_sqlite_title_index(connection, apps) -> None:
+    """
+    Create the title unique index on SQLite if it's missing, e.g. dropped by a migration
+    rebuilding content_item_table.
+
+    Args:
+        connection: Database connection to check.
+        apps: Migration state, the index is only created once the state declares the
+            deferrable title constraint.
+    """
+    if connection.vendor != "sqlite":
+        return
+    content_item_model = apps.get_model("cms_app", "ContentItem")
+    if not any(
+        constraint.name == TITLE_CONSTRAINT_NAME
+        and getattr(constraint, "deferrable", None) is not None
+        for constraint in content_item_model._meta.constraints
+    ):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(SQLITE_TITLE_INDEX_SQL)
@@ -0,0 +1,91 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from cms_app.models import Category, ContentItem, ContentItemCategory
+from cms_app.serializers.content_read_serializer import (
+    CONTENT_READ_COLUMNS,
+    ContentItemReadSerializer,
+    load_category_tags,
+)
+from cms_app.serializers.content_serializer import ContentItemSerializer
+from users_info.models import UserDetails
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the serialization throughput of ContentItemSerializer and "
+        "ContentItemReadSerializer. Rows are created in a transaction rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[1000, 10000], help="Items serialized."
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="Runs, the best is kept.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            author = UserDetails.objects.create(
+                email="benchmark@example.com", phone="0000000000", full_name="Benchmark"
+            )
+            category = Category.objects.create(name="benchmark")
+            content_items = ContentItem.objects.bulk_create(
+                [
+                    ContentItem(
+                        author=author,
+                        title=f"benchmark {index}",
+                        body="body " * 20,
+                        summary="summary",
+                        categories="benchmark",
+                    )
+                    for index in range(max(options["sizes"]))
+                ],
+                batch_size=1000,
+            )
+            ContentItemCategory.objects.bulk_create(
+                [
+                    ContentItemCategory(content=content_item, category=category)
+                    for content_item in content_items
+                ],
+                batch_size=1000,
+            )
+
+            queryset = ContentItem.objects.filter(author=author).order_by("id")
+            for size in options["sizes"]:
+                instances = list(queryset.prefetch_related("category_tags")[:size])
+                rows = list(queryset.values_list(*CONTENT_READ_COLUMNS)[:size])
+                category_tags = load_category_tags([row[0] for row in rows])
+
+                measures = {
+                    "ContentItemSerializer": lambda: ContentItemSerializer(
+                        instance=instances, many=True
+                    ).data,
+                    "read serializer, instances": lambda: ContentItemReadSerializer(
+                        instances
+                    ).data,
+                    "read serializer, tuples": lambda: ContentItemReadSerializer(
+                        rows, category_tags=category_tags
+                    ).data,
+                }
+
+                expected = JSONRenderer().render(measures["ContentItemSerializer"]())
+                self.stdout.write(f"{size} items")
+                baseline = None
+                for name, measure in measures.items():
+                    if JSONRenderer().render(measure()) != expected:
+                        self.stderr.write(self.style.ERROR(f"{name} output differs."))
+                        continue
+                    seconds = min(self._time(measure) for _ in range(options["repeat"]))
+                    baseline = baseline or seconds
+                    self.stdout.write(
+                        f"  {name:<28} {size / seconds:12,.0f} items/s  "
+                        f"{baseline / seconds:5.1f}x"
+                    )
+
+            transaction.set_rollback(True)
+
+    def _time(self, measure):
+        start = time.perf_counter()
+        measure()
+        return time.perf_counter() - start
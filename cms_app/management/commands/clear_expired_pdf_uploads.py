@@ -0,0 +1,48 @@
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from django.core.management.base import BaseCommand
+from cms_app.models import PdfUploadSession
+from cms_app.pdf_uploads import (
+    PDF_PARTIAL_UPLOAD_DIRECTORY,
+    get_partial_upload_storage,
+    get_upload_session_part_name,
+)
+
+
+class Command(BaseCommand):
+    help = "Delete the expired pdf upload sessions and the leftover partial pdf files."
+
+    def handle(self, *args, **options):
+        storage = get_partial_upload_storage()
+        expired_before = timezone.now() - timedelta(
+            seconds=settings.CONTENT_PDF_UPLOAD_SESSION_TIMEOUT
+        )
+
+        expired_sessions = PdfUploadSession.objects.filter(updated_at__lt=expired_before)
+        active_part_names = {
+            get_upload_session_part_name(upload_session)
+            for upload_session in PdfUploadSession.objects.filter(
+                updated_at__gte=expired_before
+            ).only("id")
+        }
+        expired_sessions_count, _ = expired_sessions.delete()
+
+        # Partial files of expired sessions and of interrupted streamed uploads
+        deleted_files_count = 0
+        if storage.exists(PDF_PARTIAL_UPLOAD_DIRECTORY):
+            _, file_names = storage.listdir(PDF_PARTIAL_UPLOAD_DIRECTORY)
+            for file_name in file_names:
+                part_name = f"{PDF_PARTIAL_UPLOAD_DIRECTORY}/{file_name}"
+                if part_name in active_part_names:
+                    continue
+                if storage.get_modified_time(part_name) < expired_before:
+                    storage.delete(part_name)
+                    deleted_files_count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {expired_sessions_count} expired pdf uploads and "
+                f"{deleted_files_count} partial files."
+            )
+        )
@@ -0,0 +1,38 @@
+from django.db.models import F, Sum
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+from cms_app.models import PdfBlob
+from cms_app.pdf_blobs import delete_orphaned_pdf_blobs, recount_pdf_blob_references
+
+
+class Command(BaseCommand):
+    help = "Delete the pdf files no content item references and report the space reclaimed."
+
+    def handle(self, *args, **options):
+        fixed_count = recount_pdf_blob_references()
+        if fixed_count:
+            self.stdout.write(
+                self.style.WARNING(f"Fixed the reference count of {fixed_count} pdf blobs.")
+            )
+
+        deleted_count, reclaimed_size = delete_orphaned_pdf_blobs()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {deleted_count} orphaned pdf files, "
+                f"{filesizeformat(reclaimed_size)} reclaimed."
+            )
+        )
+
+        # Space the duplicate uploads would take without deduplication
+        saved_size = (
+            PdfBlob.objects.filter(reference_count__gt=1).aggregate(
+                saved_size=Sum((F("reference_count") - 1) * F("size"))
+            )["saved_size"]
+            or 0
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{PdfBlob.objects.count()} pdf files stored, "
+                f"{filesizeformat(saved_size)} saved by deduplication."
+            )
+        )
@@ -0,0 +1,40 @@
+from django.db.models import Q
+from django.core.management.base import BaseCommand
+from cms_app.models import ContentItem
+from cms_app.pdf_processing import get_stale_pdf_processing_filter
+from cms_app.tasks import process_content_pdf_task
+from common_utility.utils.constants import PdfProcessingStatus
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue the processing of the content pdf files not processed yet, or whose "
+        "processing was interrupted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--failed",
+            action="store_true",
+            help="Also retry the pdf files whose processing failed.",
+        )
+
+    def handle(self, *args, **options):
+        statuses = [PdfProcessingStatus.PENDING]
+        if options["failed"]:
+            statuses.append(PdfProcessingStatus.FAILED)
+
+        queued_count = 0
+        for content_id, pdf_name in (
+            ContentItem.objects.filter(
+                Q(pdf_processing_status__in=statuses) | get_stale_pdf_processing_filter()
+            )
+            .values_list("id", "pdf_file")
+            .iterator()
+        ):
+            process_content_pdf_task.delay(content_id, pdf_name)
+            queued_count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Queued the processing of {queued_count} pdf files.")
+        )
@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from cms_app.models import ContentItem
+from cms_app.cache import content_item_cache
+from cms_app.signals import CONTENT_COUNT_CACHE_NAMESPACE
+from cms_app.tasks import summarize_content_task
+from common_utility.utils.constants import SummaryStatus
+from common_utility.utils.pagination_utility import invalidate_count_cache
+
+
+class Command(BaseCommand):
+    help = "Queue the generation of the pending summaries, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--failed",
+            action="store_true",
+            help="Also retry the summaries whose generation failed.",
+        )
+
+    def handle(self, *args, **options):
+        if options["failed"]:
+            failed_items = list(
+                ContentItem.objects.filter(summary_status=SummaryStatus.FAILED).values_list(
+                    "id", "author_id"
+                )
+            )
+            pending_count = ContentItem.objects.filter(
+                id__in=[content_id for content_id, _ in failed_items],
+                summary_status=SummaryStatus.FAILED,
+            ).update(summary_status=SummaryStatus.PENDING, updated_at=timezone.now())
+            # Queryset updates don't send post_save
+            for content_id, _ in failed_items:
+                content_item_cache.invalidate(content_id)
+            for author_id in {author_id for _, author_id in failed_items}:
+                invalidate_count_cache(CONTENT_COUNT_CACHE_NAMESPACE, author_id)
+            self.stdout.write(f"Retrying {pending_count} failed summaries.")
+
+        content_ids = list(
+            ContentItem.objects.filter(summary_status=SummaryStatus.PENDING)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        batch_size = settings.CONTENT_SUMMARY_BATCH_SIZE
+        for start in range(0, len(content_ids), batch_size):
+            summarize_content_task.delay(content_ids[start : start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Queued the generation of {len(content_ids)} summaries.")
+        )
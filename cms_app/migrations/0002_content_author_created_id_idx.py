@@ -0,0 +1,19 @@
+# Generated by Django 5.0.3 on 2026-10-16 23:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contentitem',
+            index=models.Index(fields=['author', 'created_at', 'id'], name='content_author_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.0.3 on 2026-10-17 00:01
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def rename_duplicate_titles(apps, schema_editor):
+    """
+    Make the titles unique before constraining them: titles were only checked by the
+    serializer before, concurrent requests could save the same title. The oldest content
+    item keeps its title, the others get a numbered suffix, e.g. "Title (2)".
+    """
+    ContentItem = apps.get_model("cms_app", "ContentItem")
+    max_length = ContentItem._meta.get_field("title").max_length
+
+    duplicate_titles = list(
+        ContentItem.objects.values("title")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("title", flat=True)
+    )
+    for title in duplicate_titles:
+        content_items = ContentItem.objects.filter(title=title).order_by("created_at", "id")
+        number = 1
+        for content_item in content_items[1:]:
+            while True:
+                number += 1
+                suffix = f" ({number})"
+                new_title = f"{title[: max_length - len(suffix)]}{suffix}"
+                if not ContentItem.objects.filter(title=new_title).exists():
+                    break
+            ContentItem.objects.filter(id=content_item.id).update(
+                title=new_title, updated_at=timezone.now()
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0002_content_author_created_id_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_titles, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='contentitem',
+            constraint=models.UniqueConstraint(fields=('title',), name='content_item_title_unique'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.0.3 on 2026-10-17 00:02
+
+from django.db import migrations
+from cms_app.search import run_vendor_sql
+
+# PostgreSQL: weighted tsvector kept up to date by the database as a generated column
+POSTGRESQL_FORWARD_SQL = [
+    """
+    ALTER TABLE content_item_table ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(categories, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX content_item_search_idx ON content_item_table USING GIN (search_vector)",
+]
+POSTGRESQL_REVERSE_SQL = [
+    "DROP INDEX IF EXISTS content_item_search_idx",
+    "ALTER TABLE content_item_table DROP COLUMN IF EXISTS search_vector",
+]
+
+# SQLite (development): external content FTS5 table kept up to date by triggers
+SQLITE_FORWARD_SQL = [
+    """
+    CREATE VIRTUAL TABLE content_item_fts USING fts5(
+        title, body, summary, categories,
+        content='content_item_table', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER content_item_fts_insert AFTER INSERT ON content_item_table BEGIN
+        INSERT INTO content_item_fts (rowid, title, body, summary, categories)
+        VALUES (new.id, new.title, new.body, new.summary, new.categories);
+    END
+    """,
+    """
+    CREATE TRIGGER content_item_fts_delete AFTER DELETE ON content_item_table BEGIN
+        INSERT INTO content_item_fts (content_item_fts, rowid, title, body, summary, categories)
+        VALUES ('delete', old.id, old.title, old.body, old.summary, old.categories);
+    END
+    """,
+    """
+    CREATE TRIGGER content_item_fts_update AFTER UPDATE ON content_item_table BEGIN
+        INSERT INTO content_item_fts (content_item_fts, rowid, title, body, summary, categories)
+        VALUES ('delete', old.id, old.title, old.body, old.summary, old.categories);
+        INSERT INTO content_item_fts (rowid, title, body, summary, categories)
+        VALUES (new.id, new.title, new.body, new.summary, new.categories);
+    END
+    """,
+    "INSERT INTO content_item_fts (content_item_fts) VALUES ('rebuild')",
+]
+SQLITE_REVERSE_SQL = [
+    "DROP TRIGGER IF EXISTS content_item_fts_insert",
+    "DROP TRIGGER IF EXISTS content_item_fts_delete",
+    "DROP TRIGGER IF EXISTS content_item_fts_update",
+    "DROP TABLE IF EXISTS content_item_fts",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0003_content_item_title_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_vendor_sql(POSTGRESQL_FORWARD_SQL, SQLITE_FORWARD_SQL),
+            run_vendor_sql(POSTGRESQL_REVERSE_SQL, SQLITE_REVERSE_SQL),
+        ),
+    ]
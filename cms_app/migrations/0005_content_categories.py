@@ -0,0 +1,94 @@
+# Generated by Django 5.0.3 on 2026-10-17 00:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+from cms_app.search import recreate_sqlite_search_triggers
+
+
+def split_categories(apps, schema_editor):
+    """
+    Normalize the comma separated categories of the existing content items.
+    """
+    ContentItem = apps.get_model("cms_app", "ContentItem")
+    Category = apps.get_model("cms_app", "Category")
+    ContentItemCategory = apps.get_model("cms_app", "ContentItemCategory")
+
+    content_category_names = {}
+    for content_id, categories in (
+        ContentItem.objects.exclude(categories__isnull=True)
+        .exclude(categories="")
+        .values_list("id", "categories")
+        .iterator()
+    ):
+        names = [name.strip()[:100] for name in categories.split(",")]
+        content_category_names[content_id] = list(dict.fromkeys(name for name in names if name))
+
+    all_names = {name for names in content_category_names.values() for name in names}
+    Category.objects.bulk_create(
+        [Category(name=name) for name in all_names], ignore_conflicts=True
+    )
+    category_ids = dict(
+        Category.objects.filter(name__in=all_names).values_list("name", "id")
+    )
+    ContentItemCategory.objects.bulk_create(
+        [
+            ContentItemCategory(content_id=content_id, category_id=category_ids[name])
+            for content_id, names in content_category_names.items()
+            for name in names
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0004_content_search'),
+    ]
+
+    operations = [
+        # Runs last when unapplying, after the table rebuild removing the field
+        migrations.RunPython(migrations.RunPython.noop, recreate_sqlite_search_triggers),
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Category',
+                'verbose_name_plural': 'Categories',
+                'db_table': 'content_category_table',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ContentItemCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='cms_app.category')),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='cms_app.contentitem')),
+            ],
+            options={
+                'verbose_name': 'Content Category',
+                'verbose_name_plural': 'Content Categories',
+                'db_table': 'content_item_category_table',
+            },
+        ),
+        migrations.AddField(
+            model_name='contentitem',
+            name='category_tags',
+            field=models.ManyToManyField(blank=True, related_name='content_items', through='cms_app.ContentItemCategory', to='cms_app.category'),
+        ),
+        migrations.AddIndex(
+            model_name='contentitemcategory',
+            index=models.Index(fields=['category', 'content'], name='category_content_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='contentitemcategory',
+            constraint=models.UniqueConstraint(fields=('content', 'category'), name='content_item_category_unique'),
+        ),
+        migrations.RunPython(recreate_sqlite_search_triggers, migrations.RunPython.noop),
+        migrations.RunPython(split_categories, migrations.RunPython.noop),
+    ]
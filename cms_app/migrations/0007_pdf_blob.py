@@ -0,0 +1,40 @@
+# Generated by Django 5.0.3 on 2026-10-17 00:13
+
+import cms_app.storage
+from django.db import migrations, models
+from cms_app.search import recreate_sqlite_search_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0006_pdf_upload_session'),
+    ]
+
+    operations = [
+        # Runs last when unapplying, after the table rebuild altering the field on SQLite
+        migrations.RunPython(migrations.RunPython.noop, recreate_sqlite_search_triggers),
+        migrations.CreateModel(
+            name='PdfBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(db_index=True, max_length=64)),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.PositiveBigIntegerField()),
+                ('reference_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Pdf Blob',
+                'verbose_name_plural': 'Pdf Blobs',
+                'db_table': 'pdf_blob_table',
+            },
+        ),
+        migrations.AlterField(
+            model_name='contentitem',
+            name='pdf_file',
+            field=models.FileField(blank=True, help_text='pdf file', null=True, storage=cms_app.storage.select_pdf_storage, upload_to='content_management_pdf', verbose_name='Content Pdf file'),
+        ),
+        migrations.RunPython(recreate_sqlite_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,121 @@
+# Generated by Django 5.0.3 on 2026-10-17 00:24
+
+from django.db import migrations, models
+from cms_app.search import recreate_sqlite_search_triggers, run_vendor_sql
+
+# The pdf text is added to the search indexes of 0004_content_search, with the lowest weight
+
+POSTGRESQL_DROP_SQL = [
+    "DROP INDEX IF EXISTS content_item_search_idx",
+    "ALTER TABLE content_item_table DROP COLUMN IF EXISTS search_vector",
+]
+POSTGRESQL_FORWARD_SQL = [
+    """
+    ALTER TABLE content_item_table ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(categories, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(pdf_text, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX content_item_search_idx ON content_item_table USING GIN (search_vector)",
+]
+# Index of 0004_content_search, restored when unapplying
+POSTGRESQL_PREVIOUS_SQL = [
+    """
+    ALTER TABLE content_item_table ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(categories, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX content_item_search_idx ON content_item_table USING GIN (search_vector)",
+]
+
+# The triggers are created for the columns of the table by recreate_sqlite_search_triggers
+SQLITE_DROP_SQL = [
+    "DROP TRIGGER IF EXISTS content_item_fts_insert",
+    "DROP TRIGGER IF EXISTS content_item_fts_delete",
+    "DROP TRIGGER IF EXISTS content_item_fts_update",
+    "DROP TABLE IF EXISTS content_item_fts",
+]
+SQLITE_FORWARD_SQL = [
+    """
+    CREATE VIRTUAL TABLE content_item_fts USING fts5(
+        title, body, summary, categories, pdf_text,
+        content='content_item_table', content_rowid='id'
+    )
+    """,
+]
+SQLITE_PREVIOUS_SQL = [
+    """
+    CREATE VIRTUAL TABLE content_item_fts USING fts5(
+        title, body, summary, categories,
+        content='content_item_table', content_rowid='id'
+    )
+    """,
+]
+
+
+def mark_pdfs_pending(apps, schema_editor):
+    """
+    The pdf files of the existing content items are processed by process_content_pdfs.
+    """
+    ContentItem = apps.get_model("cms_app", "ContentItem")
+    ContentItem.objects.exclude(pdf_file__isnull=True).exclude(pdf_file="").update(
+        pdf_processing_status="pending"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0007_pdf_blob'),
+    ]
+
+    operations = [
+        # Run last when unapplying, after the table rebuild removing the fields on SQLite
+        migrations.RunPython(migrations.RunPython.noop, recreate_sqlite_search_triggers),
+        migrations.RunPython(
+            migrations.RunPython.noop,
+            run_vendor_sql(POSTGRESQL_PREVIOUS_SQL, SQLITE_PREVIOUS_SQL),
+        ),
+        migrations.AddField(
+            model_name='contentitem',
+            name='pdf_page_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='contentitem',
+            name='pdf_processing_error',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='contentitem',
+            name='pdf_processing_status',
+            field=models.CharField(choices=[('none', 'No pdf file'), ('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='none', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='contentitem',
+            name='pdf_text',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='contentitem',
+            name='pdf_thumbnail',
+            field=models.FileField(blank=True, help_text='png of the first page of the pdf file', max_length=255, null=True, upload_to='content_management_pdf_thumbnail'),
+        ),
+        migrations.RunPython(
+            run_vendor_sql(
+                POSTGRESQL_DROP_SQL + POSTGRESQL_FORWARD_SQL,
+                SQLITE_DROP_SQL + SQLITE_FORWARD_SQL,
+            ),
+            run_vendor_sql(POSTGRESQL_DROP_SQL, SQLITE_DROP_SQL),
+        ),
+        migrations.RunPython(recreate_sqlite_search_triggers, migrations.RunPython.noop),
+        migrations.RunPython(mark_pdfs_pending, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.3 on 2026-10-17 00:27
+
+from django.db import migrations, models
+from cms_app.search import recreate_sqlite_search_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0008_content_pdf_processing'),
+    ]
+
+    operations = [
+        # Runs last when unapplying, after the table rebuild removing the field on SQLite
+        migrations.RunPython(migrations.RunPython.noop, recreate_sqlite_search_triggers),
+        migrations.CreateModel(
+            name='GeneratedSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('body_sha256', models.CharField(max_length=64)),
+                ('summarizer', models.CharField(max_length=100)),
+                ('summary', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Generated Summary',
+                'verbose_name_plural': 'Generated Summaries',
+                'db_table': 'generated_summary_table',
+            },
+        ),
+        migrations.AddField(
+            model_name='contentitem',
+            name='summary_status',
+            field=models.CharField(choices=[('author', 'Written by the author'), ('pending', 'Pending'), ('generated', 'Generated'), ('failed', 'Failed')], default='author', max_length=20),
+        ),
+        migrations.AddConstraint(
+            model_name='generatedsummary',
+            constraint=models.UniqueConstraint(fields=('body_sha256', 'summarizer'), name='generated_summary_body_summarizer_unique'),
+        ),
+        migrations.RunPython(recreate_sqlite_search_triggers, migrations.RunPython.noop),
+    ]
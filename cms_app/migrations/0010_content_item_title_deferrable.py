@@ -0,0 +1,32 @@
+# Generated by Django 5.0.3 on 2026-10-17 01:12
+
+import django.db.models.constraints
+from django.db import migrations, models
+from cms_app.constraints import create_sqlite_title_index
+from cms_app.search import recreate_sqlite_search_triggers
+
+# The title unique constraint of 0003_content_item_title_unique becomes deferrable, still
+# checked row by row unless a transaction defers it, see `deferred_title_constraint`.
+# SQLite doesn't create deferrable unique constraints, a unique index replaces it there.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0009_generated_summaries'),
+    ]
+
+    operations = [
+        # Runs last when unapplying, after the table rebuild restoring the constraint
+        migrations.RunPython(migrations.RunPython.noop, recreate_sqlite_search_triggers),
+        migrations.RemoveConstraint(
+            model_name='contentitem',
+            name='content_item_title_unique',
+        ),
+        migrations.AddConstraint(
+            model_name='contentitem',
+            constraint=models.UniqueConstraint(deferrable=django.db.models.constraints.Deferrable['IMMEDIATE'], fields=('title',), name='content_item_title_unique'),
+        ),
+        migrations.RunPython(create_sqlite_title_index, migrations.RunPython.noop),
+        migrations.RunPython(recreate_sqlite_search_triggers, migrations.RunPython.noop),
+    ]
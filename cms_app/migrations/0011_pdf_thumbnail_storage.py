@@ -0,0 +1,25 @@
+# Generated by Django 5.0.3 on 2026-10-17 01:08
+
+import cms_app.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_app', '0010_content_item_title_deferrable'),
+    ]
+
+    operations = [
+        # The storage isn't part of the schema, SQLite would rebuild the table and drop the
+        # search triggers of 0004_content_search
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='contentitem',
+                    name='pdf_thumbnail',
+                    field=models.FileField(blank=True, help_text='png of the first page of the pdf file', max_length=255, null=True, storage=cms_app.storage.select_pdf_thumbnail_storage, upload_to='content_management_pdf_thumbnail'),
+                ),
+            ],
+        ),
+    ]
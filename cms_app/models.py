@@ -1,20 +1,55 @@
+import uuid
 from django.db import models
 from users_info.models import UserDetails
+from cms_app.storage import select_pdf_storage, select_pdf_thumbnail_storage
+from common_utility.utils.constants import PdfProcessingStatus, SummaryStatus
 
 class ContentItem(models.Model):
     author = models.ForeignKey(UserDetails, on_delete=models.CASCADE)
     title = models.CharField(max_length=30)
     body = models.TextField(max_length=300)
     summary = models.TextField(blank=True, null=True)
+    # Empty summaries are generated in the background, see cms_app.summaries
+    summary_status = models.CharField(
+        max_length=20,
+        choices=SummaryStatus.CHOICES,
+        default=SummaryStatus.AUTHOR,
+    )
     pdf_file = models.FileField(
         upload_to="content_management_pdf",
+        storage=select_pdf_storage,
         null=True,
         blank=True,
         verbose_name="Content Pdf file",
         help_text="pdf file",
     )
+    # Comma separated categories as written by the author, normalized into `category_tags`
     categories = models.CharField(max_length=255, blank=True, null=True)
-    
+    category_tags = models.ManyToManyField(
+        "Category",
+        through="ContentItemCategory",
+        related_name="content_items",
+        blank=True,
+    )
+    # Derived from the pdf file in the background, see cms_app.tasks
+    pdf_processing_status = models.CharField(
+        max_length=20,
+        choices=PdfProcessingStatus.CHOICES,
+        default=PdfProcessingStatus.NONE,
+    )
+    pdf_processing_error = models.TextField(blank=True, null=True)
+    # Text of the pdf, indexed by the content search
+    pdf_text = models.TextField(blank=True, null=True)
+    pdf_page_count = models.PositiveIntegerField(blank=True, null=True)
+    pdf_thumbnail = models.FileField(
+        upload_to="content_management_pdf_thumbnail",
+        storage=select_pdf_thumbnail_storage,
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text="png of the first page of the pdf file",
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
     )
@@ -25,8 +60,140 @@ class ContentItem(models.Model):
         "summary",
         "pdf_file",
     ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Pdf file as loaded, to release its blob once replaced, see cms_app.signals
+        if "pdf_file" in instance.__dict__:
+            instance._loaded_pdf_name = instance.__dict__["pdf_file"] or None
+        return instance
+
     class Meta:
         db_table = "content_item_table"
         ordering = ["-created_at"]
+        constraints = [
+            # Title uniqueness is enforced by the database, see ContentItemSerializer.
+            # Checked row by row unless deferred, see `deferred_title_constraint`.
+            models.UniqueConstraint(
+                fields=["title"],
+                name="content_item_title_unique",
+                deferrable=models.Deferrable.IMMEDIATE,
+            ),
+        ]
+        indexes = [
+            # Keyset pagination of an author's content (newest first)
+            models.Index(
+                fields=["author", "created_at", "id"],
+                name="content_author_created_id_idx",
+            ),
+        ]
         verbose_name_plural = "Content Details"
         verbose_name = "Content Detail"
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        db_table = "content_category_table"
+        ordering = ["name"]
+        verbose_name_plural = "Categories"
+        verbose_name = "Category"
+
+
+class ContentItemCategory(models.Model):
+    content = models.ForeignKey(ContentItem, on_delete=models.CASCADE)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = "content_item_category_table"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content", "category"],
+                name="content_item_category_unique",
+            ),
+        ]
+        indexes = [
+            # Content of a category, used by the category filter of the listings
+            models.Index(
+                fields=["category", "content"],
+                name="category_content_idx",
+            ),
+        ]
+        verbose_name_plural = "Content Categories"
+        verbose_name = "Content Category"
+
+
+class PdfBlob(models.Model):
+    """
+    A pdf file of the content addressed pdf storage, shared by the content items having
+    the same pdf. The file is deleted once no content item references it anymore.
+    """
+
+    sha256 = models.CharField(max_length=64, db_index=True)
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField()
+    reference_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        db_table = "pdf_blob_table"
+        verbose_name_plural = "Pdf Blobs"
+        verbose_name = "Pdf Blob"
+
+
+class PdfUploadSession(models.Model):
+    """
+    Resumable upload of a large pdf file, sent in chunks to a partial file of the pdf storage
+    and attached to a content item once complete.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(UserDetails, on_delete=models.CASCADE)
+    file_name = models.CharField(max_length=255)
+    total_size = models.PositiveBigIntegerField()
+    received_size = models.PositiveBigIntegerField(default=0)
+    # Digest announced by the client, replaced by the computed one once complete
+    sha256 = models.CharField(max_length=64, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def is_complete(self):
+        return self.received_size == self.total_size
+
+    class Meta:
+        db_table = "pdf_upload_session_table"
+        verbose_name_plural = "Pdf Upload Sessions"
+        verbose_name = "Pdf Upload Session"
+
+
+class GeneratedSummary(models.Model):
+    """
+    Summary generated for a content body, keyed by the hash of the body so an unchanged
+    body is never summarized twice by the same summarizer.
+    """
+
+    body_sha256 = models.CharField(max_length=64)
+    summarizer = models.CharField(max_length=100)
+    summary = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "generated_summary_table"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["body_sha256", "summarizer"],
+                name="generated_summary_body_summarizer_unique",
+            ),
+        ]
+        verbose_name_plural = "Generated Summaries"
+        verbose_name = "Generated Summary"
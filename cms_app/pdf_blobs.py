@@ -0,0 +1,139 @@
+from collections import Counter, defaultdict
+from typing import Iterable, Optional, Tuple
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery, Count, Value
+from django.db.models.functions import Coalesce, Greatest
+from cms_app.models import ContentItem, PdfBlob
+from cms_app.pdf_processing import get_pdf_thumbnail_name, get_pdf_thumbnail_storage
+
+
+def _count_blob_names(names: Iterable[Optional[str]]) -> Counter:
+    storage = ContentItem._meta.get_field("pdf_file").storage
+    return Counter(
+        name for name in names if name and storage.get_name_sha256(name) is not None
+    )
+
+
+def _group_by_count(name_counts: Counter) -> dict:
+    names_by_count = defaultdict(list)
+    for name, count in name_counts.items():
+        names_by_count[count].append(name)
+    return names_by_count
+
+
+def add_pdf_blob_references(names: Iterable[Optional[str]]) -> None:
+    """
+    Count new references of content items to pdf files of the content addressed storage.
+    Run it in the transaction saving the content items, so their files can't be deleted
+    as orphans once referenced.
+
+    Args:
+        names (iterable): Storage names of the referenced pdf files, once per reference.
+            Empty names and files stored before the storage was content addressed are
+            ignored.
+
+    Raises:
+        FileNotFoundError: If a file was deleted as an orphan since it was saved.
+    """
+    name_counts = _count_blob_names(names)
+    if not name_counts:
+        return
+
+    storage = ContentItem._meta.get_field("pdf_file").storage
+    existing_names = set(
+        PdfBlob.objects.filter(name__in=name_counts).values_list("name", flat=True)
+    )
+    # Raises FileNotFoundError for a file deleted since it was saved
+    PdfBlob.objects.bulk_create(
+        [
+            PdfBlob(name=name, sha256=storage.get_name_sha256(name), size=storage.size(name))
+            for name in name_counts
+            if name not in existing_names
+        ],
+        ignore_conflicts=True,
+    )
+    for count, names_group in _group_by_count(name_counts).items():
+        # Locks the blobs until the references are committed, see delete_orphaned_pdf_blobs
+        updated_count = PdfBlob.objects.filter(name__in=names_group).update(
+            reference_count=F("reference_count") + count
+        )
+        if updated_count != len(names_group):
+            raise FileNotFoundError("A pdf file was deleted while being referenced.")
+
+
+def remove_pdf_blob_references(names: Iterable[Optional[str]]) -> None:
+    """
+    Release references to pdf files of the content addressed storage, the files no longer
+    referenced are deleted once the transaction is committed.
+
+    Args:
+        names (iterable): Storage names of the released pdf files, once per reference.
+    """
+    name_counts = _count_blob_names(names)
+    if not name_counts:
+        return
+
+    for count, names_group in _group_by_count(name_counts).items():
+        PdfBlob.objects.filter(name__in=names_group).update(
+            reference_count=Greatest(F("reference_count") - count, Value(0))
+        )
+    transaction.on_commit(lambda: delete_orphaned_pdf_blobs(name_counts))
+
+
+def delete_orphaned_pdf_blobs(names: Optional[Iterable[str]] = None) -> Tuple[int, int]:
+    """
+    Delete the pdf files no content item references anymore, with their thumbnail.
+
+    Args:
+        names (iterable, optional): Only consider these storage names. Defaults to None,
+            every pdf blob.
+
+    Returns:
+        tuple: Number of deleted pdf files and bytes reclaimed.
+    """
+    storage = ContentItem._meta.get_field("pdf_file").storage
+    orphaned_blobs = PdfBlob.objects.filter(reference_count=0)
+    if names is not None:
+        orphaned_blobs = orphaned_blobs.filter(name__in=list(names))
+
+    deleted_count, reclaimed_size = 0, 0
+    for pdf_blob_id in orphaned_blobs.values_list("id", flat=True):
+        with transaction.atomic():
+            # A blob referenced again in the meantime is kept. The files are deleted with
+            # the blob locked, a concurrent reference waits and finds the blob deleted.
+            pdf_blob = (
+                PdfBlob.objects.select_for_update()
+                .filter(id=pdf_blob_id, reference_count=0)
+                .only("id", "name", "size")
+                .first()
+            )
+            if pdf_blob is None:
+                continue
+            storage.delete(pdf_blob.name)
+            get_pdf_thumbnail_storage().delete(get_pdf_thumbnail_name(pdf_blob.name))
+            pdf_blob.delete()
+        deleted_count += 1
+        reclaimed_size += pdf_blob.size
+    return deleted_count, reclaimed_size
+
+
+def recount_pdf_blob_references() -> int:
+    """
+    Recompute the reference counts from the content items, fixing counts missed by
+    writes that don't send signals.
+
+    Returns:
+        int: Number of pdf blobs whose count was fixed.
+    """
+    references = (
+        ContentItem.objects.filter(pdf_file=OuterRef("name"))
+        .order_by()
+        .values("pdf_file")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    return (
+        PdfBlob.objects.annotate(actual_count=Coalesce(Subquery(references), 0))
+        .exclude(reference_count=F("actual_count"))
+        .update(reference_count=Coalesce(Subquery(references), 0))
+    )
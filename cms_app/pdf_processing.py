@@ -0,0 +1,175 @@
+import hashlib
+import posixpath
+from datetime import timedelta
+from typing import Optional
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models import Q
+from django.utils import timezone
+from cms_app.models import ContentItem
+from cms_app.cache import content_item_cache
+from cms_app.pdf_uploads import get_pdf_storage
+from common_utility.utils.constants import PdfProcessingStatus
+from common_utility.utils.pdf_utility import extract_pdf_details
+
+PDF_THUMBNAIL_DIRECTORY = "content_management_pdf_thumbnail"
+
+
+def get_pdf_thumbnail_storage():
+    """
+    Storage of the thumbnails of the content item pdf files.
+    """
+    return ContentItem._meta.get_field("pdf_thumbnail").storage
+
+
+def get_stale_pdf_processing_filter() -> Q:
+    """
+    Filter of the content items whose pdf processing was claimed more than
+    CONTENT_PDF_PROCESSING_TIMEOUT seconds ago, the worker processing them being lost.
+    """
+    timeout = timedelta(seconds=settings.CONTENT_PDF_PROCESSING_TIMEOUT)
+    return Q(
+        pdf_processing_status=PdfProcessingStatus.PROCESSING,
+        updated_at__lt=timezone.now() - timeout,
+    )
+
+
+def get_pdf_thumbnail_name(pdf_name: str) -> str:
+    """
+    Storage name of the thumbnail of a pdf file, shared by the content items having the
+    same pdf file.
+    """
+    sha256 = get_pdf_storage().get_name_sha256(pdf_name) or hashlib.sha256(
+        pdf_name.encode()
+    ).hexdigest()
+    return posixpath.join(PDF_THUMBNAIL_DIRECTORY, sha256[:2], sha256[2:4], f"{sha256}.png")
+
+
+def reset_pdf_processing(content_item: ContentItem) -> None:
+    """
+    Clear the details derived from the pdf file of a content item whose pdf file was
+    added, replaced or removed, they are extracted again once it's saved.
+    """
+    content_item.pdf_processing_status = (
+        PdfProcessingStatus.PENDING if content_item.pdf_file else PdfProcessingStatus.NONE
+    )
+    content_item.pdf_processing_error = None
+    content_item.pdf_text = None
+    content_item.pdf_page_count = None
+    content_item.pdf_thumbnail = None
+
+
+def update_pdf_processing(content_id: int, pdf_name: str, **fields) -> bool:
+    """
+    Store processing results of a content item, unless its pdf file was replaced since.
+
+    Returns:
+        bool: Whether the content item was updated.
+    """
+    updated = ContentItem.objects.filter(id=content_id, pdf_file=pdf_name).update(
+        updated_at=timezone.now(), **fields
+    )
+    if updated:
+        # Queryset updates don't send post_save
+        content_item_cache.invalidate(content_id)
+    return bool(updated)
+
+
+def _load_pdf(pdf_name: str):
+    """
+    Path of the pdf file if the storage is on the local file system, its content otherwise.
+    """
+    storage = get_pdf_storage()
+    try:
+        return storage.path(pdf_name)
+    except NotImplementedError:
+        with storage.open(pdf_name, "rb") as pdf_file:
+            return pdf_file.read()
+
+
+def process_content_pdf(content_id: int, pdf_name: str) -> Optional[str]:
+    """
+    Extract the text, page count and first page thumbnail of the pdf file of a content item.
+
+    Running it again for the same pdf file does nothing once it succeeded or while another
+    worker processes it, and the details of a pdf file already processed for another
+    content item are copied instead of being extracted again.
+
+    Args:
+        content_id (int): The ID of the content item.
+        pdf_name (str): Storage name of the pdf file to process.
+
+    Returns:
+        str: Final processing status, None if the content item was deleted, its pdf file
+            replaced, already processed or being processed.
+
+    Raises:
+        Exception: Storage errors, the processing can be retried.
+    """
+    claimed = (
+        ContentItem.objects.filter(id=content_id, pdf_file=pdf_name)
+        .filter(
+            ~Q(
+                pdf_processing_status__in=[
+                    PdfProcessingStatus.COMPLETED,
+                    PdfProcessingStatus.PROCESSING,
+                ]
+            )
+            | get_stale_pdf_processing_filter()
+        )
+        .update(
+            pdf_processing_status=PdfProcessingStatus.PROCESSING,
+            updated_at=timezone.now(),
+        )
+    )
+    if not claimed:
+        return None
+    content_item_cache.invalidate(content_id)
+
+    processed_details = (
+        ContentItem.objects.filter(
+            pdf_file=pdf_name, pdf_processing_status=PdfProcessingStatus.COMPLETED
+        )
+        .exclude(id=content_id)
+        .values("pdf_text", "pdf_page_count", "pdf_thumbnail")
+        .first()
+    )
+    if processed_details is None:
+        try:
+            pdf_details = extract_pdf_details(
+                _load_pdf(pdf_name),
+                thumbnail_width=settings.CONTENT_PDF_THUMBNAIL_WIDTH,
+                max_text_length=settings.CONTENT_PDF_MAX_TEXT_LENGTH,
+            )
+        except ValueError as e:
+            # Retrying can't fix an invalid pdf
+            update_pdf_processing(
+                content_id,
+                pdf_name,
+                pdf_processing_status=PdfProcessingStatus.FAILED,
+                pdf_processing_error=str(e),
+            )
+            return PdfProcessingStatus.FAILED
+
+        thumbnail_name = None
+        if pdf_details.thumbnail is not None:
+            thumbnail_storage = get_pdf_thumbnail_storage()
+            thumbnail_name = get_pdf_thumbnail_name(pdf_name)
+            if not thumbnail_storage.exists(thumbnail_name):
+                thumbnail_name = thumbnail_storage.save(
+                    thumbnail_name, ContentFile(pdf_details.thumbnail)
+                )
+        processed_details = {
+            "pdf_text": pdf_details.text,
+            "pdf_page_count": pdf_details.page_count,
+            "pdf_thumbnail": thumbnail_name,
+        }
+
+    update_pdf_processing(
+        content_id,
+        pdf_name,
+        pdf_processing_status=PdfProcessingStatus.COMPLETED,
+        pdf_processing_error=None,
+        **processed_details,
+    )
+    return PdfProcessingStatus.COMPLETED
@@ -0,0 +1,217 @@
+import os
+import re
+from typing import Iterable
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from rest_framework import serializers
+from cms_app.models import ContentItem, PdfUploadSession
+from common_utility.utils.upload_utility import (
+    FILE_BLOCK_SIZE,
+    PDF_MAGIC_BYTES,
+    StreamedUploadedFile,
+    StreamingUploadHandler,
+    get_file_sha256,
+)
+
+# Pdf files of the content endpoints, `pdf_file_<i>` being the files of the bulk endpoint
+PDF_FIELD_NAME_PATTERN = re.compile(r"^pdf_file(_\d+)?$")
+
+# Partial files of the uploads in progress, next to the final files so saving moves them
+PDF_PARTIAL_UPLOAD_DIRECTORY = "content_management_pdf/partial"
+
+NOT_A_PDF_MESSAGE = "Invalid pdf file."
+
+
+def get_pdf_storage():
+    """
+    Storage of the content item pdf files.
+    """
+    return ContentItem._meta.get_field("pdf_file").storage
+
+
+def get_partial_upload_storage():
+    """
+    Storage of the partial files of the uploads in progress: the pdf storage when it's on
+    the local file system, so saving a pdf moves its partial file, MEDIA_ROOT otherwise.
+    """
+    pdf_storage = get_pdf_storage()
+    if isinstance(pdf_storage, FileSystemStorage):
+        return pdf_storage
+    return FileSystemStorage()
+
+
+def build_pdf_upload_handler(request) -> StreamingUploadHandler:
+    """
+    Build the upload handler streaming the pdf files of a content request to the pdf storage.
+
+    Args:
+        request: The Django request whose body is going to be parsed.
+
+    Returns:
+        StreamingUploadHandler: Handler accepting pdf files up to the resumable threshold.
+    """
+    return StreamingUploadHandler(
+        request,
+        storage=get_partial_upload_storage(),
+        directory=PDF_PARTIAL_UPLOAD_DIRECTORY,
+        accept_field=PDF_FIELD_NAME_PATTERN.match,
+        max_size=settings.CONTENT_PDF_RESUMABLE_THRESHOLD,
+        max_size_message=(
+            f"Pdf files over {settings.CONTENT_PDF_RESUMABLE_THRESHOLD} bytes have to be "
+            "sent through a resumable upload."
+        ),
+        magic_bytes=PDF_MAGIC_BYTES,
+        magic_bytes_message=NOT_A_PDF_MESSAGE,
+    )
+
+
+def get_upload_session_part_name(upload_session: PdfUploadSession) -> str:
+    """
+    Storage name of the partial file of an upload session.
+    """
+    return os.path.join(PDF_PARTIAL_UPLOAD_DIRECTORY, f"{upload_session.id.hex}.part")
+
+
+def write_upload_session_chunk(
+    upload_session: PdfUploadSession, stream, start: int, length: int
+) -> None:
+    """
+    Write a chunk of a resumable upload to its partial file, straight from the request.
+
+    Whatever a previously interrupted chunk wrote after `start` is overwritten, the first
+    chunk is rejected as soon as its first bytes aren't the pdf magic bytes.
+
+    Args:
+        upload_session (PdfUploadSession): The upload session.
+        stream: Request body to read the chunk from.
+        start (int): Offset of the chunk in the file.
+        length (int): Size of the chunk.
+
+    Raises:
+        ValueError: If the chunk doesn't start a pdf file or is shorter than `length`.
+    """
+    full_path = get_partial_upload_storage().path(get_upload_session_part_name(upload_session))
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+    with open(full_path, "r+b" if os.path.exists(full_path) else "w+b") as part_file:
+        part_file.truncate(start)
+        part_file.seek(start)
+
+        header = b""
+        remaining = length
+        while remaining:
+            block = stream.read(min(FILE_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            if start == 0 and len(header) < len(PDF_MAGIC_BYTES):
+                header += block[: len(PDF_MAGIC_BYTES) - len(header)]
+                if not PDF_MAGIC_BYTES.startswith(header):
+                    part_file.truncate(start)
+                    raise ValueError(NOT_A_PDF_MESSAGE)
+            part_file.write(block)
+            remaining -= len(block)
+
+        if remaining:
+            part_file.truncate(start)
+            raise ValueError("Chunk is shorter than its Content-Range.")
+
+
+def complete_upload_session(upload_session: PdfUploadSession) -> PdfUploadSession:
+    """
+    Check the pdf file of an upload session whose last chunk was received and record its
+    SHA-256 digest. An invalid file is dropped so the upload can start over.
+
+    Args:
+        upload_session (PdfUploadSession): The upload session, with all its chunks received.
+
+    Returns:
+        PdfUploadSession: The upload session with its computed digest.
+
+    Raises:
+        ValueError: If the file isn't a pdf file or doesn't match the announced digest.
+    """
+    storage = get_partial_upload_storage()
+    part_name = get_upload_session_part_name(upload_session)
+    with storage.open(part_name, "rb") as part_file:
+        header = part_file.read(len(PDF_MAGIC_BYTES))
+        sha256 = get_file_sha256(part_file)
+
+    error = None
+    if header != PDF_MAGIC_BYTES:
+        error = NOT_A_PDF_MESSAGE
+    elif upload_session.sha256 and upload_session.sha256 != sha256:
+        error = "Pdf file doesn't match its sha256, upload it again."
+    if error:
+        storage.delete(part_name)
+        upload_session.received_size = 0
+        upload_session.save(update_fields=["received_size", "updated_at"])
+        raise ValueError(error)
+
+    upload_session.sha256 = sha256
+    upload_session.save(update_fields=["sha256", "updated_at"])
+    return upload_session
+
+
+def open_upload_session_file(upload_id, user) -> StreamedUploadedFile:
+    """
+    Open the pdf file of a complete upload session of a user, to be saved on a content item.
+
+    Args:
+        upload_id (UUID): Id of the upload session.
+        user: The user the upload session has to belong to.
+
+    Returns:
+        StreamedUploadedFile: The uploaded pdf file, its partial file is moved to its final
+            name when the content item is saved.
+
+    Raises:
+        serializers.ValidationError: If the upload session doesn't exist or is incomplete.
+    """
+    upload_session = PdfUploadSession.objects.filter(id=upload_id, owner=user).first()
+    if upload_session is None:
+        raise serializers.ValidationError("No pdf upload with given upload id.")
+    if not upload_session.is_complete:
+        raise serializers.ValidationError("Pdf upload is not complete.")
+
+    try:
+        file = open(
+            get_partial_upload_storage().path(get_upload_session_part_name(upload_session)),
+            "rb",
+        )
+    except FileNotFoundError:
+        raise serializers.ValidationError("Pdf upload was already used.")
+
+    uploaded_file = StreamedUploadedFile(
+        file=file,
+        name=upload_session.file_name,
+        content_type="application/pdf",
+        size=upload_session.total_size,
+        sha256=upload_session.sha256,
+        # Kept until the content item is saved so a failed request can be retried
+        delete_on_close=False,
+    )
+    uploaded_file.upload_session_id = upload_session.id
+    return uploaded_file
+
+
+def delete_used_upload_sessions(pdf_files: Iterable) -> None:
+    """
+    Delete the upload sessions of pdf files saved on content items, with their partial
+    file if it wasn't moved because the storage already had the same pdf.
+
+    Args:
+        pdf_files (iterable): Saved pdf files, the ones not coming from an upload session
+            are ignored.
+    """
+    upload_sessions = [
+        PdfUploadSession(id=pdf_file.upload_session_id)
+        for pdf_file in pdf_files
+        if getattr(pdf_file, "upload_session_id", None) is not None
+    ]
+    if not upload_sessions:
+        return
+    PdfUploadSession.objects.filter(
+        id__in=[upload_session.id for upload_session in upload_sessions]
+    ).delete()
+    for upload_session in upload_sessions:
+        get_partial_upload_storage().delete(get_upload_session_part_name(upload_session))
@@ -2,6 +2,7 @@ from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
 # Utils Imports
 from common_utility.utils.constants import Role
+from permission_app.roles import role_registry
 
 class BaseAdminPermission(BasePermission):
     """
@@ -36,10 +37,11 @@ class BaseAdminPermission(BasePermission):
             bool: True if the user has the necessary permissions, False otherwise.
         """
         user = request.user
+        role_name = role_registry.get_name(user.role_id)
 
-        if user.role.name == Role.SUPER_ADMIN and user.is_superuser and user.is_active:
+        if role_name == Role.SUPER_ADMIN and user.is_superuser and user.is_active:
             return True
-        elif user.role.name == Role.AUTHER and user.is_active:
+        elif role_name == Role.AUTHER and user.is_active:
             return True
         return False
 
@@ -73,13 +75,60 @@ class AuthorAndAdminGetUpdateDeletePermissions(BaseAdminPermission):
         user = request.user
         request_method = request.method
 
-        if request_method in ["GET", "POST", "PUT", "DELETE"]:
+        if request_method in ["GET", "HEAD", "POST", "PUT", "DELETE"]:
             # Allow superuser to have object-level permission
             if user.is_superuser and user.is_active:
                 return True
             # Allow the author to have object-level permission
-            if obj.author == user:
+            if obj.author_id == user.id:
                 return True
             return False
         
         raise PermissionDenied("You do not have permission to access this resource.")
+
+    def filter_queryset(self, request, queryset):
+        """
+        Restrict a queryset to the content the requesting user has object-level permission on.
+
+        Set-wise equivalent of `has_object_permission` for batch operations, the check is
+        applied in SQL instead of object by object.
+
+        Args:
+            request: The HTTP request object.
+            queryset: The content queryset to restrict.
+
+        Returns:
+            QuerySet: The restricted queryset.
+        """
+        user = request.user
+
+        # Allow superuser to access all the content
+        if user.is_superuser and user.is_active:
+            return queryset
+        # Allow the author to access their own content
+        return queryset.filter(author_id=user.id)
+
+
+class SuperAdminPermission(BaseAdminPermission):
+    """
+    Permission class restricting access to active super admins.
+    """
+
+    def has_permission(self, request, view):
+        """
+        Check if the requesting user is an active super admin.
+
+        Args:
+            request: The HTTP request object.
+            view: The view being accessed.
+
+        Returns:
+            bool: True if the user is an active super admin, False otherwise.
+        """
+        user = request.user
+
+        return bool(
+            role_registry.get_name(user.role_id) == Role.SUPER_ADMIN
+            and user.is_superuser
+            and user.is_active
+        )
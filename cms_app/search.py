@@ -0,0 +1,250 @@
+import re
+import html
+from typing import List, NamedTuple, Optional
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, QuerySet, TextField
+from django.db.models.expressions import RawSQL
+
+# Full-text search over ContentItem, see migrations 0004_content_search and
+# 0008_content_pdf_processing for the indexes. On SQLite the index is an FTS5 table kept up
+# to date by triggers, see `create_sqlite_search_triggers`.
+
+# The database marks the matches with private use characters, swapped for the <b> tags
+# once the text is HTML escaped
+HIGHLIGHT_START_MARKER = "\ue000"
+HIGHLIGHT_STOP_MARKER = "\ue001"
+
+
+class SearchHit(NamedTuple):
+    """
+    A content item matching a search, best matches have the highest rank.
+    """
+
+    content_id: int
+    rank: float
+    highlight: Optional[str]
+
+
+def render_highlight(snippet: Optional[str]) -> Optional[str]:
+    """
+    HTML escape a snippet of the content text, wrapping its matches in <b> tags.
+    """
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(HIGHLIGHT_START_MARKER, "<b>")
+        .replace(HIGHLIGHT_STOP_MARKER, "</b>")
+    )
+
+
+def search_content(
+    queryset: QuerySet, query: str, limit: int, offset: int = 0
+) -> List[SearchHit]:
+    """
+    Search content items by title, body, summary, categories and pdf text.
+
+    Uses the `search_vector` GIN index on PostgreSQL, the `content_item_fts` FTS5 table on
+    SQLite and falls back to a LIKE scan on other databases.
+
+    Args:
+        queryset (QuerySet): Content items the search is scoped to, e.g. the content the user
+            has permission on.
+        query (str): Search terms, all of them have to match.
+        limit (int): Maximum number of hits to return.
+        offset (int, optional): Number of hits to skip. Defaults to 0.
+
+    Returns:
+        list: `SearchHit` of the matching content items, best match first.
+    """
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return []
+
+    vendor = connections[queryset.db].vendor
+    if vendor == "postgresql":
+        return _search_postgresql(queryset, " ".join(terms), limit, offset)
+    if vendor == "sqlite":
+        return _search_sqlite(queryset, terms, limit, offset)
+    return _search_fallback(queryset, terms, limit, offset)
+
+
+def _search_postgresql(queryset, query, limit, offset):
+    ts_query = "websearch_to_tsquery('english', %s)"
+    hits = (
+        queryset.filter(
+            RawSQL(
+                f'"content_item_table"."search_vector" @@ {ts_query}',
+                [query],
+                output_field=BooleanField(),
+            )
+        )
+        .annotate(
+            search_rank=RawSQL(
+                f'ts_rank("content_item_table"."search_vector", {ts_query})',
+                [query],
+                output_field=FloatField(),
+            ),
+            search_highlight=RawSQL(
+                "ts_headline('english', "
+                "concat_ws(' ', \"content_item_table\".\"summary\", \"content_item_table\".\"body\"), "
+                f"{ts_query}, %s)",
+                [
+                    query,
+                    f"StartSel={HIGHLIGHT_START_MARKER}, StopSel={HIGHLIGHT_STOP_MARKER}, "
+                    "MaxFragments=2",
+                ],
+                output_field=TextField(),
+            ),
+        )
+        .order_by("-search_rank", "-id")
+        .values_list("id", "search_rank", "search_highlight")[offset : offset + limit]
+    )
+    return [
+        SearchHit(content_id, rank, render_highlight(highlight))
+        for content_id, rank, highlight in hits
+    ]
+
+
+def _search_sqlite(queryset, terms, limit, offset):
+    # Quote every term so user input can't use the FTS5 query syntax
+    match_query = " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+    scope_sql, scope_params = queryset.order_by().values("id").query.sql_with_params()
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            # bm25 is lower for better matches, columns weighted
+            # title > summary/categories > body > pdf text
+            f"""
+            SELECT rowid,
+                   -bm25(content_item_fts, 10.0, 1.0, 5.0, 5.0, 0.5) AS rank,
+                   snippet(content_item_fts, -1, %s, %s, '...', 16)
+            FROM content_item_fts
+            WHERE content_item_fts MATCH %s AND rowid IN ({scope_sql})
+            ORDER BY rank DESC, rowid DESC
+            LIMIT %s OFFSET %s
+            """,
+            [
+                HIGHLIGHT_START_MARKER,
+                HIGHLIGHT_STOP_MARKER,
+                match_query,
+                *scope_params,
+                limit,
+                offset,
+            ],
+        )
+        return [
+            SearchHit(content_id, rank, render_highlight(highlight))
+            for content_id, rank, highlight in cursor.fetchall()
+        ]
+
+
+def _search_fallback(queryset, terms, limit, offset):
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term)
+            | Q(body__icontains=term)
+            | Q(summary__icontains=term)
+            | Q(categories__icontains=term)
+            | Q(pdf_text__icontains=term)
+        )
+    content_ids = queryset.order_by("-created_at", "-id").values_list("id", flat=True)
+    return [SearchHit(content_id, 0.0, None) for content_id in content_ids[offset : offset + limit]]
+
+
+SQLITE_SEARCH_TRIGGER_NAMES = [
+    "content_item_fts_insert",
+    "content_item_fts_delete",
+    "content_item_fts_update",
+]
+
+
+def run_vendor_sql(postgresql_sql, sqlite_sql):
+    """
+    Build a RunPython callable executing the statements of the database vendor in use.
+    Other databases have no full-text index, search falls back to a LIKE scan there.
+    """
+
+    def run(apps, schema_editor):
+        statements = {
+            "postgresql": postgresql_sql,
+            "sqlite": sqlite_sql,
+        }.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+def get_sqlite_search_columns(connection) -> List[str]:
+    """
+    Columns of content_item_table indexed by the content_item_fts table, none if there is
+    no such table.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA table_info(content_item_fts)")
+        return [row[1] for row in cursor.fetchall()]
+
+
+def create_sqlite_search_triggers(connection) -> None:
+    """
+    (Re)create the triggers keeping the content_item_fts table up to date, for the columns
+    it indexes, and rebuild the index from content_item_table.
+
+    SQLite drops the triggers of a table it rebuilds, e.g. to alter its fields: the
+    migrations rebuilding content_item_table call this, and `ensure_sqlite_search_triggers`
+    recreates the triggers missing once migrated.
+    """
+    columns = get_sqlite_search_columns(connection)
+    if not columns:
+        return
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    insert_new = (
+        f"INSERT INTO content_item_fts (rowid, {column_list}) VALUES (new.id, {new_values});"
+    )
+    delete_old = (
+        f"INSERT INTO content_item_fts (content_item_fts, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    statements = [f"DROP TRIGGER IF EXISTS {name}" for name in SQLITE_SEARCH_TRIGGER_NAMES]
+    statements += [
+        "CREATE TRIGGER content_item_fts_insert AFTER INSERT ON content_item_table "
+        f"BEGIN {insert_new} END",
+        "CREATE TRIGGER content_item_fts_delete AFTER DELETE ON content_item_table "
+        f"BEGIN {delete_old} END",
+        "CREATE TRIGGER content_item_fts_update AFTER UPDATE ON content_item_table "
+        f"BEGIN {delete_old} {insert_new} END",
+        # Rows written while the triggers were missing
+        "INSERT INTO content_item_fts (content_item_fts) VALUES ('rebuild')",
+    ]
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def recreate_sqlite_search_triggers(apps, schema_editor) -> None:
+    """
+    RunPython callable recreating the content_item_fts triggers on SQLite, for the
+    migrations rebuilding content_item_table.
+    """
+    if schema_editor.connection.vendor == "sqlite":
+        create_sqlite_search_triggers(schema_editor.connection)
+
+
+def ensure_sqlite_search_triggers(connection) -> None:
+    """
+    Recreate the content_item_fts triggers if a table rebuild dropped them.
+    """
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master "
+            "WHERE type = 'trigger' AND name IN (%s, %s, %s)",
+            SQLITE_SEARCH_TRIGGER_NAMES,
+        )
+        (trigger_count,) = cursor.fetchone()
+    if trigger_count < len(SQLITE_SEARCH_TRIGGER_NAMES):
+        create_sqlite_search_triggers(connection)
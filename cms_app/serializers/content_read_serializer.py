@@ -0,0 +1,170 @@
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, List, Optional
+from django.db.models import QuerySet
+from cms_app.models import ContentItem, ContentItemCategory
+from common_utility.utils.date_time_util import get_date_time_dicts_in_ist
+
+# Columns the read serializer needs, in the order of the tuple rows it accepts
+CONTENT_READ_COLUMNS = [
+    "id",
+    "title",
+    "body",
+    "summary",
+    "summary_status",
+    "pdf_file",
+    "categories",
+    "pdf_processing_status",
+    "pdf_processing_error",
+    "pdf_page_count",
+    "pdf_thumbnail",
+    "created_at",
+    "updated_at",
+]
+
+FILE_FIELDS = ["pdf_file", "pdf_thumbnail"]
+DATE_TIME_FIELDS = ["created_at", "updated_at"]
+# Output fields of `ContentItemSerializer`, in its order
+OUTPUT_FIELDS = [
+    "id",
+    "title",
+    "body",
+    "summary",
+    "summary_status",
+    "pdf_file",
+    "categories",
+    "category_tags",
+    "pdf_processing_status",
+    "pdf_processing_error",
+    "pdf_page_count",
+    "pdf_thumbnail",
+    "created_at",
+    "updated_at",
+]
+
+
+class ContentItemReadSerializer:
+    """
+    Read-only serializer of content items producing the same output as
+    `ContentItemSerializer`, without its field machinery.
+
+    Content items can be given as model instances, `.values(*CONTENT_READ_COLUMNS)` dicts
+    or `.values_list(*CONTENT_READ_COLUMNS)` tuples. Field accessors are resolved once for
+    the whole list and the dates are formatted in one batch.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable,
+        category_tags: Optional[Dict[int, List[str]]] = None,
+        request=None,
+    ):
+        """
+        Args:
+            rows (iterable): The content items.
+            category_tags (dict, optional): Category names by content item ID, required for
+                dict and tuple rows. Instances use their prefetched `category_tags`.
+            request (optional): Request to build absolute file URLs with, like the
+                `request` of a serializer context.
+        """
+        self.rows = list(rows)
+        self.category_tags = category_tags
+        self.request = request
+
+    @classmethod
+    def from_queryset(cls, queryset: QuerySet, request=None) -> "ContentItemReadSerializer":
+        """
+        Serialize the content items of a queryset, loaded as tuples with their category
+        names in a second query.
+        """
+        rows = list(queryset.values_list(*CONTENT_READ_COLUMNS))
+        return cls(
+            rows,
+            category_tags=load_category_tags([row[0] for row in rows]),
+            request=request,
+        )
+
+    def _get_accessor(self, sample):
+        if isinstance(sample, dict):
+            return lambda field: itemgetter(field)
+        if isinstance(sample, tuple):
+            return lambda field: itemgetter(CONTENT_READ_COLUMNS.index(field))
+        file_name_getter = {field: attrgetter(f"{field}.name") for field in FILE_FIELDS}
+        return lambda field: file_name_getter.get(field) or attrgetter(field)
+
+    def _get_field_builders(self, get_accessor):
+        """
+        Functions computing every output field from a row, dates excluded.
+        """
+        storages = {
+            field: ContentItem._meta.get_field(field).storage for field in FILE_FIELDS
+        }
+        request = self.request
+
+        def build_url(field):
+            getter, storage = get_accessor(field), storages[field]
+
+            def get_url(row):
+                name = getter(row)
+                if not name:
+                    return None
+                url = storage.url(name)
+                return request.build_absolute_uri(url) if request is not None else url
+
+            return get_url
+
+        def build_category_tags():
+            if self.category_tags is None:
+                return lambda row: [category.name for category in row.category_tags.all()]
+            get_id, category_tags = get_accessor("id"), self.category_tags
+            return lambda row: category_tags.get(get_id(row), [])
+
+        builders = []
+        for field in OUTPUT_FIELDS:
+            if field in FILE_FIELDS:
+                builders.append((field, build_url(field)))
+            elif field == "category_tags":
+                builders.append((field, build_category_tags()))
+            elif field in DATE_TIME_FIELDS:
+                # Formatted for all the rows at once
+                builders.append((field, lambda row: None))
+            else:
+                builders.append((field, get_accessor(field)))
+        return builders
+
+    @property
+    def data(self) -> List[dict]:
+        if not self.rows:
+            return []
+
+        get_accessor = self._get_accessor(self.rows[0])
+        field_builders = self._get_field_builders(get_accessor)
+        date_time_getters = [get_accessor(field) for field in DATE_TIME_FIELDS]
+        date_time_dicts = iter(
+            get_date_time_dicts_in_ist(
+                (getter(row) for row in self.rows for getter in date_time_getters),
+                noon_format=True,
+            )
+        )
+
+        data = []
+        for row in self.rows:
+            item = {field: build(row) for field, build in field_builders}
+            for field in DATE_TIME_FIELDS:
+                item[field] = next(date_time_dicts)
+            data.append(item)
+        return data
+
+
+def load_category_tags(content_ids: List[int]) -> Dict[int, List[str]]:
+    """
+    Category names of content items in a single query, ordered by name like the
+    `category_tags` relation.
+    """
+    category_tags = {}
+    for content_id, name in (
+        ContentItemCategory.objects.filter(content_id__in=content_ids)
+        .order_by("category__name")
+        .values_list("content_id", "category__name")
+    ):
+        category_tags.setdefault(content_id, []).append(name)
+    return category_tags
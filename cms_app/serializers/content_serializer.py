@@ -1,9 +1,78 @@
 
+from contextlib import contextmanager
+from typing import Iterable, Set
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
 from rest_framework import serializers
 from cms_app.models import ContentItem
-from common_utility.utils.date_time_util import get_date_time_dict_in_ist
+from cms_app.categories import set_content_categories
+from cms_app.constraints import TITLE_CONSTRAINT_NAME
+from cms_app.pdf_uploads import delete_used_upload_sessions, open_upload_session_file
+from cms_app.summaries import update_summary_status
+from cms_app.tasks import schedule_content_summaries
+from common_utility.utils.date_time_util import (
+    IstDateTimeListSerializer,
+    IstDateTimeSerializerMixin,
+)
 
-class ContentItemSerializer(serializers.ModelSerializer):
+TITLE_EXISTS_MESSAGE = "Title already exists. Please choose a different title."
+
+
+@contextmanager
+def save_unique_title():
+    """
+    Run a content item write in a savepoint, translating a violation of the title unique
+    constraint into the title validation error.
+
+    Raises:
+        serializers.ValidationError: If the title is already used.
+    """
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError as e:
+        if not is_title_integrity_error(e):
+            raise
+        raise serializers.ValidationError({"title": [TITLE_EXISTS_MESSAGE]})
+
+
+def is_title_integrity_error(error: IntegrityError) -> bool:
+    """
+    Whether an IntegrityError is a violation of the title unique constraint, rather than
+    of another constraint involving the title (NOT NULL, ...).
+    """
+    # PostgreSQL reports the violated constraint
+    diagnostics = getattr(error.__cause__, "diag", None)
+    constraint_name = getattr(diagnostics, "constraint_name", None)
+    if constraint_name is not None:
+        return constraint_name == TITLE_CONSTRAINT_NAME
+    # SQLite reports the columns of the violated unique index
+    return str(error) == "UNIQUE constraint failed: content_item_table.title"
+
+
+@contextmanager
+def deferred_title_constraint(using: str = "default"):
+    """
+    Check the title unique constraint once the writes of the block are done instead of
+    row by row, so the items of a batch can swap titles. PostgreSQL only, where the
+    constraint is deferrable. Run it in a transaction.
+
+    Raises:
+        IntegrityError: If a title is used twice once the block is done.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"SET CONSTRAINTS {TITLE_CONSTRAINT_NAME} DEFERRED")
+    yield
+    # Checked now rather than when the outermost transaction commits
+    with connection.cursor() as cursor:
+        cursor.execute(f"SET CONSTRAINTS {TITLE_CONSTRAINT_NAME} IMMEDIATE")
+
+
+class ContentItemSerializer(IstDateTimeSerializerMixin, serializers.ModelSerializer):
     title = serializers.CharField(required=True, max_length=30)
     body = serializers.CharField(required=True, max_length=300)
     summary = serializers.CharField(required=True, allow_blank=True)
@@ -12,6 +81,12 @@ class ContentItemSerializer(serializers.ModelSerializer):
         allow_null=True,
         help_text="pdf file"
     )
+    pdf_upload_id = serializers.UUIDField(
+        required=False,
+        write_only=True,
+        help_text="id of a complete resumable pdf upload, instead of pdf_file",
+    )
+    category_tags = serializers.SerializerMethodField()
     class Meta:
         model = ContentItem
         fields = [
@@ -19,12 +94,29 @@ class ContentItemSerializer(serializers.ModelSerializer):
             'title',
             'body',
             'summary',
+            'summary_status',
             'pdf_file',
+            'pdf_upload_id',
             'categories',
+            'category_tags',
+            'pdf_processing_status',
+            'pdf_processing_error',
+            'pdf_page_count',
+            'pdf_thumbnail',
+            'created_at',
+            'updated_at',
+        ]
+        list_serializer_class = IstDateTimeListSerializer
+        read_only_fields = [
+            'author',
+            'summary_status',
+            'pdf_processing_status',
+            'pdf_processing_error',
+            'pdf_page_count',
+            'pdf_thumbnail',
             'created_at',
             'updated_at',
         ]
-        read_only_fields = ['author', 'created_at', 'updated_at']
     def get_fields(self):
         """
         Customize fields based on the request method (POST or PUT).
@@ -36,8 +128,11 @@ class ContentItemSerializer(serializers.ModelSerializer):
         if request_method == "POST":
             fields["title"].required = True
             fields["body"].required = True
-            fields["summary"].required = True
-            fields["pdf_file"].required = True
+            # Generated in the background when left out, see cms_app.summaries
+            fields["summary"].required = not settings.CONTENT_AUTO_SUMMARY
+            fields["pdf_file"].required = "pdf_upload_id" not in getattr(
+                self, "initial_data", {}
+            )
         elif request_method == "PUT":
             fields["title"].required = False
             fields["body"].required = False
@@ -53,12 +148,15 @@ class ContentItemSerializer(serializers.ModelSerializer):
         if not isinstance(value, str):
             raise serializers.ValidationError("Invalid title. Must be a string.")
          
-        # Check for title uniqueness
-        if ContentItem.objects.filter(title=value).exists():
+        # Title uniqueness is enforced by the unique constraint on insert/update, see
+        # `save_unique_title`. Bulk requests look the batch titles up in one query and pass
+        # the existing ones through the context to report them per item.
+        existing_titles = self.context.get("existing_titles")
+        if existing_titles is not None and value in existing_titles:
             # If it's an update, ensure the title is not being checked against itself
             if self.instance and self.instance.title == value:
                 return value
-            raise serializers.ValidationError("Title already exists. Please choose a different title.")
+            raise serializers.ValidationError(TITLE_EXISTS_MESSAGE)
 
         return value
 
@@ -80,32 +178,65 @@ class ContentItemSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Invalid summary. Must be a string.")
         return value
 
+    def validate(self, attrs):
+        """
+        Use the file of a resumable pdf upload as pdf file.
+        """
+        pdf_upload_id = attrs.pop("pdf_upload_id", None)
+        if pdf_upload_id is not None:
+            try:
+                attrs["pdf_file"] = open_upload_session_file(
+                    pdf_upload_id, self.context["request"].user
+                )
+            except serializers.ValidationError as e:
+                raise serializers.ValidationError({"pdf_upload_id": e.detail})
+        return attrs
+
     def create(self, validated_data):
         """
         Create a new content item instance.
         """
         validated_data['author'] = self.context['request'].user
-        content_item = ContentItem.objects.create(**validated_data)
+        content_item = ContentItem(**validated_data)
+        update_summary_status(content_item, validated_data)
+        with save_unique_title():
+            content_item.save(force_insert=True)
+            if content_item.categories:
+                set_content_categories([content_item])
+            delete_used_upload_sessions([validated_data.get("pdf_file")])
+            schedule_content_summaries([content_item])
         return content_item
 
     def update(self, instance, validated_data):
         """
         Update an existing content item instance.
         """
+        changed_fields = [
+            attr for attr, value in validated_data.items() if getattr(instance, attr) != value
+        ]
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        update_summary_status(instance, changed_fields)
+        with save_unique_title():
+            instance.save()
+            if "categories" in validated_data:
+                set_content_categories([instance])
+            delete_used_upload_sessions([validated_data.get("pdf_file")])
+            schedule_content_summaries([instance])
         return instance
 
-    def to_representation(self, instance):
+    def get_category_tags(self, instance):
         """
-        Convert model instance to representation.
+        Names of the normalized categories, prefetch `category_tags` when serializing many
+        content items.
         """
-        representation = super().to_representation(instance)
-        representation["created_at"] = get_date_time_dict_in_ist(
-            datetime_utc_object=instance.created_at, noon_format=True
-        )
-        representation["updated_at"] = get_date_time_dict_in_ist(
-            datetime_utc_object=instance.updated_at, noon_format=True
-        )
-        return representation
+        return [category.name for category in instance.category_tags.all()]
+
+
+def get_existing_titles(titles: Iterable[str]) -> Set[str]:
+    """
+    Return which of the given titles are already used, in a single query.
+    """
+    return set(
+        ContentItem.objects.filter(title__in=set(titles)).values_list("title", flat=True)
+    )
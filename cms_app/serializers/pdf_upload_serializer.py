@@ -0,0 +1,58 @@
+import re
+from django.conf import settings
+from rest_framework import serializers
+from cms_app.models import PdfUploadSession
+
+
+class PdfUploadSessionSerializer(serializers.ModelSerializer):
+    file_name = serializers.CharField(required=True, max_length=255)
+    total_size = serializers.IntegerField(required=True, min_value=1)
+    sha256 = serializers.CharField(required=False, allow_null=True, max_length=64)
+    chunk_size = serializers.SerializerMethodField()
+    is_complete = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = PdfUploadSession
+        fields = [
+            'id',
+            'file_name',
+            'total_size',
+            'received_size',
+            'sha256',
+            'chunk_size',
+            'is_complete',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = ['id', 'received_size', 'created_at', 'updated_at']
+
+    def validate_total_size(self, value):
+        """
+        Validate total size.
+        """
+        if value > settings.CONTENT_PDF_MAX_UPLOAD_SIZE:
+            raise serializers.ValidationError(
+                f"Pdf file size must not exceed {settings.CONTENT_PDF_MAX_UPLOAD_SIZE} bytes."
+            )
+        return value
+
+    def validate_sha256(self, value):
+        """
+        Validate sha256.
+        """
+        if value is not None and not re.fullmatch(r"[0-9a-fA-F]{64}", value):
+            raise serializers.ValidationError("Invalid sha256. Must be a hex digest.")
+        return value.lower() if value else value
+
+    def get_chunk_size(self, instance):
+        """
+        Maximum size of a chunk.
+        """
+        return settings.CONTENT_PDF_UPLOAD_CHUNK_SIZE
+
+    def create(self, validated_data):
+        """
+        Create a new upload session of the requesting user.
+        """
+        validated_data["owner"] = self.context["request"].user
+        return PdfUploadSession.objects.create(**validated_data)
@@ -0,0 +1,103 @@
+from django.db import connections
+from django.db.models.signals import pre_save, post_save, post_delete, post_migrate
+from django.dispatch import receiver
+from cms_app.models import ContentItem
+from cms_app.cache import content_item_cache
+from cms_app.constraints import ensure_sqlite_title_index
+from cms_app.pdf_blobs import add_pdf_blob_references, remove_pdf_blob_references
+from cms_app.pdf_processing import reset_pdf_processing
+from cms_app.search import ensure_sqlite_search_triggers
+from cms_app.tasks import schedule_pdf_processing
+from common_utility.utils.pagination_utility import invalidate_count_cache
+
+CONTENT_COUNT_CACHE_NAMESPACE = "content_count"
+
+
+@receiver(post_save, sender=ContentItem)
+@receiver(post_delete, sender=ContentItem)
+def invalidate_content_count(sender, instance, **kwargs):
+    """
+    Invalidate the cached listing totals of the author of a saved or deleted content item.
+    """
+    invalidate_count_cache(CONTENT_COUNT_CACHE_NAMESPACE, instance.author_id)
+
+
+@receiver(post_save, sender=ContentItem)
+@receiver(post_delete, sender=ContentItem)
+def invalidate_content_item_cache(sender, instance, **kwargs):
+    """
+    Drop the cached representation of a saved or deleted content item.
+    """
+    content_item_cache.invalidate(instance.id)
+
+
+@receiver(post_save, sender=ContentItem)
+def update_pdf_blob_references(sender, instance, created, **kwargs):
+    """
+    Move the pdf blob reference of a content item whose pdf file was added or replaced.
+    """
+    if created:
+        loaded_pdf_name = None
+    elif hasattr(instance, "_loaded_pdf_name"):
+        loaded_pdf_name = instance._loaded_pdf_name
+    else:
+        # Not loaded with its pdf file, see recount_pdf_blob_references
+        return
+
+    pdf_name = instance.pdf_file.name or None
+    if pdf_name != loaded_pdf_name:
+        add_pdf_blob_references([pdf_name])
+        remove_pdf_blob_references([loaded_pdf_name])
+        instance._loaded_pdf_name = pdf_name
+
+
+@receiver(post_delete, sender=ContentItem)
+def release_pdf_blob_reference(sender, instance, **kwargs):
+    """
+    Release the pdf blob of a deleted content item, deleted with the last reference.
+    """
+    remove_pdf_blob_references([instance.pdf_file.name])
+
+
+@receiver(pre_save, sender=ContentItem)
+def reset_changed_pdf_processing(sender, instance, **kwargs):
+    """
+    Clear the pdf details of a content item whose pdf file is added, replaced or removed.
+    """
+    if instance._state.adding:
+        pdf_changed = True
+    elif hasattr(instance, "_loaded_pdf_name"):
+        pdf_changed = not instance.pdf_file._committed or (
+            (instance.pdf_file.name or None) != instance._loaded_pdf_name
+        )
+    else:
+        # Not loaded with its pdf file, it isn't changed
+        return
+
+    if pdf_changed:
+        reset_pdf_processing(instance)
+        instance._pdf_processing_scheduled = False
+
+
+@receiver(post_save, sender=ContentItem)
+def process_changed_pdf(sender, instance, **kwargs):
+    """
+    Queue the processing of the new pdf file of a content item, once committed.
+    """
+    if getattr(instance, "_pdf_processing_scheduled", True):
+        return
+    instance._pdf_processing_scheduled = True
+    schedule_pdf_processing([instance])
+
+
+@receiver(post_migrate)
+def restore_sqlite_search_triggers(sender, using, apps, **kwargs):
+    """
+    Recreate the full-text search triggers and the title unique index of SQLite dropped
+    by a migration rebuilding content_item_table, see
+    `cms_app.search.create_sqlite_search_triggers`.
+    """
+    if sender.name != "cms_app":
+        return
+    ensure_sqlite_search_triggers(connections[using])
+    ensure_sqlite_title_index(connections[using], apps)
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from common_utility.utils.storage_utility import ContentAddressedFileSystemStorage
+
+
+def select_pdf_storage():
+    """
+    Storage of the content item pdf files, deduplicated by content. Files are stored in a
+    MinIO/S3 bucket when MINIO_ENDPOINT is set, in MEDIA_ROOT otherwise.
+    """
+    if settings.MINIO_ENDPOINT:
+        from common_utility.utils.minio_storage import ContentAddressedMinioStorage
+
+        return ContentAddressedMinioStorage()
+    return ContentAddressedFileSystemStorage()
+
+
+def select_pdf_thumbnail_storage():
+    """
+    Storage of the thumbnails of the pdf files, next to the pdf files: the MinIO/S3 bucket
+    when MINIO_ENDPOINT is set, MEDIA_ROOT otherwise. Thumbnails are named after their pdf
+    file, see `cms_app.pdf_processing.get_pdf_thumbnail_name`.
+    """
+    if settings.MINIO_ENDPOINT:
+        from common_utility.utils.minio_storage import MinioStorage
+
+        return MinioStorage()
+    return FileSystemStorage()
+
+
+def get_storage_url_version(storage):
+    """
+    Version of the URLs of a storage, changing when they do (presigned URLs), None if
+    its URLs don't change. Part of the cache keys and ETags of data embedding file URLs.
+    """
+    get_url_version = getattr(storage, "get_url_version", None)
+    return get_url_version() if get_url_version is not None else None
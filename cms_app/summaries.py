@@ -0,0 +1,124 @@
+import hashlib
+from functools import lru_cache
+from typing import Iterable, List
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from cms_app.models import ContentItem, GeneratedSummary
+from cms_app.cache import content_item_cache
+from common_utility.utils.constants import SummaryStatus
+from common_utility.utils.summarizer_utility import Summarizer
+
+
+@lru_cache(maxsize=None)
+def get_summarizer() -> Summarizer:
+    """
+    The summarizer of CONTENT_SUMMARIZER_BACKEND, created once per process.
+    """
+    return import_string(settings.CONTENT_SUMMARIZER_BACKEND)()
+
+
+def get_body_sha256(body: str) -> str:
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def update_summary_status(content_item: ContentItem, changed_fields: Iterable[str]) -> bool:
+    """
+    Update the summary status of a content item after its fields changed: a summary
+    written by the author is kept, an empty one or one generated for another body has
+    to be generated.
+
+    Args:
+        content_item (ContentItem): The content item, with its new values.
+        changed_fields (iterable): Names of the fields that changed.
+
+    Returns:
+        bool: Whether the status changed.
+    """
+    changed_fields = set(changed_fields)
+    summary_status = content_item.summary_status
+    if "summary" in changed_fields and content_item.summary:
+        summary_status = SummaryStatus.AUTHOR
+    elif settings.CONTENT_AUTO_SUMMARY and (
+        not content_item.summary
+        or ("body" in changed_fields and summary_status != SummaryStatus.AUTHOR)
+    ):
+        summary_status = SummaryStatus.PENDING
+
+    if summary_status == content_item.summary_status:
+        return False
+    content_item.summary_status = summary_status
+    return True
+
+
+def summarize_content(content_ids: Iterable[int]) -> int:
+    """
+    Generate the pending summaries of content items.
+
+    Summaries already generated for the same body are reused, the other bodies are sent to
+    the summarizer in batches of CONTENT_SUMMARY_BATCH_SIZE. A summary is only stored if
+    the body it was generated for wasn't changed in the meantime.
+
+    Args:
+        content_ids (iterable): IDs of the content items, those whose summary isn't
+            pending are skipped.
+
+    Returns:
+        int: Number of content items summarized.
+    """
+    summarizer = get_summarizer()
+    content_bodies = list(
+        ContentItem.objects.filter(
+            id__in=list(content_ids), summary_status=SummaryStatus.PENDING
+        ).values_list("id", "body")
+    )
+    body_hashes = {body: get_body_sha256(body) for _, body in content_bodies}
+    summaries = dict(
+        GeneratedSummary.objects.filter(
+            summarizer=summarizer.name, body_sha256__in=set(body_hashes.values())
+        ).values_list("body_sha256", "summary")
+    )
+
+    missing_bodies = [body for body, sha256 in body_hashes.items() if sha256 not in summaries]
+    batch_size = settings.CONTENT_SUMMARY_BATCH_SIZE
+    for start in range(0, len(missing_bodies), batch_size):
+        bodies = missing_bodies[start : start + batch_size]
+        generated_summaries = [
+            GeneratedSummary(
+                body_sha256=body_hashes[body], summarizer=summarizer.name, summary=summary
+            )
+            for body, summary in zip(bodies, summarizer.summarize_batch(bodies))
+        ]
+        GeneratedSummary.objects.bulk_create(generated_summaries, ignore_conflicts=True)
+        summaries.update(
+            (generated_summary.body_sha256, generated_summary.summary)
+            for generated_summary in generated_summaries
+        )
+
+    summarized_count = 0
+    for content_id, body in content_bodies:
+        updated = ContentItem.objects.filter(
+            id=content_id, body=body, summary_status=SummaryStatus.PENDING
+        ).update(
+            summary=summaries[body_hashes[body]],
+            summary_status=SummaryStatus.GENERATED,
+            updated_at=timezone.now(),
+        )
+        if updated:
+            # Queryset updates don't send post_save
+            content_item_cache.invalidate(content_id)
+            summarized_count += 1
+    return summarized_count
+
+
+def mark_summaries_failed(content_ids: List[int]) -> int:
+    """
+    Mark the pending summaries of content items as failed, they are retried by the
+    summarize_content command.
+    """
+    failed_count = ContentItem.objects.filter(
+        id__in=content_ids, summary_status=SummaryStatus.PENDING
+    ).update(summary_status=SummaryStatus.FAILED, updated_at=timezone.now())
+    for content_id in content_ids:
+        content_item_cache.invalidate(content_id)
+    return failed_count
@@ -0,0 +1,87 @@
+import traceback
+from typing import Iterable, List
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from cms_app.models import ContentItem
+from cms_app.pdf_processing import process_content_pdf, update_pdf_processing
+from cms_app.summaries import mark_summaries_failed, summarize_content
+from common_utility.utils.constants import PdfProcessingStatus, SummaryStatus
+
+
+@shared_task(bind=True, max_retries=None)
+def process_content_pdf_task(self, content_id: int, pdf_name: str):
+    """
+    Process the pdf file of a content item in the background, retried with an exponential
+    backoff on storage errors. See `cms_app.pdf_processing.process_content_pdf`.
+    """
+    try:
+        return process_content_pdf(content_id, pdf_name)
+    except Exception as e:
+        print(e, traceback.format_exc())
+        if self.request.retries < settings.CONTENT_PDF_PROCESSING_MAX_RETRIES:
+            # Released so the retry can claim it again
+            update_pdf_processing(
+                content_id, pdf_name, pdf_processing_status=PdfProcessingStatus.PENDING
+            )
+            raise self.retry(exc=e, countdown=2 ** self.request.retries * 10)
+        update_pdf_processing(
+            content_id,
+            pdf_name,
+            pdf_processing_status=PdfProcessingStatus.FAILED,
+            pdf_processing_error=str(e),
+        )
+        return PdfProcessingStatus.FAILED
+
+
+def schedule_pdf_processing(content_items: Iterable[ContentItem]) -> None:
+    """
+    Queue the processing of the pdf files of content items once the transaction saving
+    them is committed, so the task sees them.
+    """
+    tasks = [
+        (content_item.id, content_item.pdf_file.name)
+        for content_item in content_items
+        if content_item.pdf_file
+    ]
+    for content_id, pdf_name in tasks:
+        transaction.on_commit(
+            lambda content_id=content_id, pdf_name=pdf_name: process_content_pdf_task.delay(
+                content_id, pdf_name
+            )
+        )
+
+
+@shared_task(bind=True, max_retries=None)
+def summarize_content_task(self, content_ids: List[int]):
+    """
+    Generate the pending summaries of a batch of content items, retried with an
+    exponential backoff when the summarizer fails. See `cms_app.summaries.summarize_content`.
+    """
+    try:
+        return summarize_content(content_ids)
+    except Exception as e:
+        print(e, traceback.format_exc())
+        if self.request.retries < settings.CONTENT_SUMMARY_MAX_RETRIES:
+            raise self.retry(exc=e, countdown=2 ** self.request.retries * 10)
+        mark_summaries_failed(content_ids)
+        return 0
+
+
+def schedule_content_summaries(content_items: Iterable[ContentItem]) -> None:
+    """
+    Queue the generation of the pending summaries of content items once the transaction
+    saving them is committed, CONTENT_SUMMARY_BATCH_SIZE content items per task.
+    """
+    content_ids = [
+        content_item.id
+        for content_item in content_items
+        if content_item.summary_status == SummaryStatus.PENDING
+    ]
+    batch_size = settings.CONTENT_SUMMARY_BATCH_SIZE
+    for start in range(0, len(content_ids), batch_size):
+        transaction.on_commit(
+            lambda batch=content_ids[start : start + batch_size]: summarize_content_task.delay(
+                batch
+            )
+        )
@@ -1,3 +1,1063 @@
-from django.test import TestCase
+import io
+import os
+import json
+import base64
+import shutil
+import hashlib
+import tempfile
+import fitz
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connection, transaction
+from django.test import override_settings
+from django.utils import timezone
+from minio import Minio
+from minio.error import S3Error
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from cms_app.models import ContentItem, PdfBlob, PdfUploadSession
+from cms_app.pdf_blobs import (
+    add_pdf_blob_references,
+    delete_orphaned_pdf_blobs,
+    remove_pdf_blob_references,
+)
+from cms_app.pdf_processing import get_pdf_thumbnail_name, process_content_pdf
+from cms_app.pdf_uploads import PDF_PARTIAL_UPLOAD_DIRECTORY
+from cms_app.cache import content_item_cache
+from cms_app.categories import set_content_categories
+from cms_app.search import SQLITE_SEARCH_TRIGGER_NAMES, search_content
+from cms_app.signals import restore_sqlite_search_triggers
+from cms_app.serializers.content_read_serializer import (
+    CONTENT_READ_COLUMNS,
+    ContentItemReadSerializer,
+    load_category_tags,
+)
+from cms_app.serializers.content_serializer import (
+    ContentItemSerializer,
+    TITLE_EXISTS_MESSAGE,
+    is_title_integrity_error,
+)
+from permission_app.models import RoleMaster
+from users_info.models import UserDetails
+from common_utility.utils.constants import Role
+from common_utility.utils.minio_storage import ContentAddressedMinioStorage, MinioStorage
+from common_utility.utils.pagination_utility import encode_cursor
 
-# Create your tests here.
+
+# No broker in the tests, the celery tasks run in-process
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
+class AuthorTestCase(APITestCase):
+    """
+    Base test case of the content endpoints, with the client authenticated as an author.
+    """
+
+    def setUp(self):
+        cache.clear()
+        RoleMaster.objects.create(name=Role.AUTHER)
+        self.user = self.create_author("author@example.com", "9999999999")
+        self.client.force_authenticate(user=self.user)
+
+    def create_author(self, email, phone):
+        UserDetails.objects.create_user(
+            email=email, password="Author@123", phone=phone, full_name="Author"
+        )
+        # The authentication layer hands the view a user with its role loaded
+        return UserDetails.objects.select_related("role").get(email=email)
+
+
+class ContentListingQueryCountTest(AuthorTestCase):
+    """
+    Regression tests pinning the number of queries run by the content listing endpoint.
+    """
+
+    url = "/api/v1/author/content/all/"
+
+    def setUp(self):
+        super().setUp()
+        for index in range(15):
+            ContentItem.objects.create(
+                author=self.user,
+                title=f"title {index}",
+                body="body",
+                summary="summary",
+            )
+
+    def test_full_page_runs_at_most_two_queries(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"page": 1, "items": 10})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["success"]["book_content_details"]), 10)
+        self.assertEqual(response.data["success"]["user"]["role"]["name"], Role.AUTHER)
+        self.assertEqual(response.data["page_details"]["total_entries"], 15)
+        self.assertEqual(response.data["page_details"]["next_page"], 2)
+
+    @mock.patch(
+        "common_utility.utils.pagination_utility.is_shared_cache", return_value=True
+    )
+    def test_total_is_cached_until_content_changes(self, _):
+        self.client.get(self.url, {"page": 1, "items": 10})
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"page": 1, "items": 10})
+        self.assertEqual(response.data["page_details"]["total_entries"], 15)
+        self.assertFalse(response.data["page_details"]["is_total_approximate"])
+
+        ContentItem.objects.filter(author=self.user).first().delete()
+        response = self.client.get(self.url, {"page": 1, "items": 10})
+        self.assertEqual(response.data["page_details"]["total_entries"], 14)
+
+    def test_unchanged_page_is_not_modified(self):
+        response = self.client.get(self.url, {"page": 1, "items": 10})
+
+        not_modified = self.client.get(
+            self.url, {"page": 1, "items": 10}, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        ContentItem.objects.filter(author=self.user).first().save()
+        modified = self.client.get(
+            self.url, {"page": 1, "items": 10}, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+
+    def test_deleted_item_changes_the_page(self):
+        response = self.client.get(self.url, {"page": 1, "items": 10})
+        # A deletion doesn't move any updated_at forward, listings have no Last-Modified
+        self.assertNotIn("Last-Modified", response)
+
+        ContentItem.objects.filter(author=self.user).first().delete()
+        modified = self.client.get(
+            self.url,
+            {"page": 1, "items": 10},
+            HTTP_IF_NONE_MATCH=response["ETag"],
+            HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT",
+        )
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+        modified = self.client.get(
+            self.url,
+            {"page": 1, "items": 10},
+            HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT",
+        )
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+
+    def test_last_page_skips_count_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"page": 2, "items": 10})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["success"]["book_content_details"]), 5)
+        self.assertEqual(response.data["page_details"]["total_entries"], 15)
+        self.assertIsNone(response.data["page_details"]["next_page"])
+
+    def test_category_filter(self):
+        content = ContentItem.objects.filter(author=self.user).first()
+        self.client.put(
+            f"/api/v1/author/content/update/{content.id}/",
+            {"categories": "python, django"},
+            format="json",
+        )
+
+        response = self.client.get(self.url, {"category": "django"})
+
+        self.assertEqual(
+            [item["id"] for item in response.data["success"]["book_content_details"]],
+            [content.id],
+        )
+        self.assertEqual(
+            response.data["success"]["book_content_details"][0]["category_tags"],
+            ["django", "python"],
+        )
+        self.assertEqual(response.data["page_details"]["total_entries"], 1)
+
+    def test_page_out_of_range_is_invalid(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"page": 3, "items": 10})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cursor_pages_run_one_query(self):
+        with self.assertNumQueries(1):
+            first_page = self.client.get(self.url, {"cursor": "", "items": 10})
+        next_cursor = first_page.data["page_details"]["next_cursor"]
+
+        with self.assertNumQueries(1):
+            second_page = self.client.get(self.url, {"cursor": next_cursor, "items": 10})
+
+        titles = [
+            item["title"]
+            for response in (first_page, second_page)
+            for item in response.data["success"]["book_content_details"]
+        ]
+        self.assertEqual(len(set(titles)), 15)
+        self.assertIsNone(second_page.data["page_details"]["next_cursor"])
+
+    def test_invalid_cursor_and_items_are_rejected(self):
+        for params in [
+            {"cursor": "not-a-cursor"},
+            {"cursor": encode_cursor(timezone.now(), 1)[:-2]},
+            {"cursor": "", "items": 0},
+            {"cursor": "", "items": settings.CONTENT_PAGE_MAX_ITEMS + 1},
+            {"page": 1, "items": -1},
+        ]:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ContentDetailCacheTest(AuthorTestCase):
+    """
+    Tests for the read-through cache of the content details endpoint.
+    """
+
+    def setUp(self):
+        super().setUp()
+        content_item_cache.backend.clear()
+        self.content = ContentItem.objects.create(
+            author=self.user, title="title", body="body", summary="summary"
+        )
+        self.url = f"/api/v1/author/content/{self.content.id}/"
+
+    def test_cached_read_runs_one_query(self):
+        self.client.get(self.url)
+        hits = content_item_cache.hits
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["success"]["title"], "title")
+        self.assertEqual(content_item_cache.hits, hits + 1)
+
+    def test_update_is_not_served_stale(self):
+        self.client.get(self.url)
+        self.content.title = "new title"
+        self.content.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data["success"]["title"], "new title")
+
+    def test_content_deleted_before_load_is_not_found(self):
+        from_queryset = ContentItemReadSerializer.from_queryset
+        # Deleted between the permission check and the load
+        with mock.patch.object(
+            ContentItemReadSerializer,
+            "from_queryset",
+            side_effect=lambda queryset: from_queryset(queryset.none()),
+        ):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(self.url).data["success"]["title"], "title")
+
+    def test_head_is_allowed_to_the_author(self):
+        response = self.client.head(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, b"")
+
+    def test_unchanged_content_is_not_modified(self):
+        response = self.client.get(self.url)
+        hits, misses = content_item_cache.hits, content_item_cache.misses
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+        # Answered before looking up the serialized representation
+        self.assertEqual(
+            (content_item_cache.hits, content_item_cache.misses), (hits, misses)
+        )
+
+
+class ContentBulkCreateTest(AuthorTestCase):
+    """
+    Tests for the bulk content creation endpoint.
+    """
+
+    url = "/api/v1/author/content/bulk-add/"
+
+    def build_items(self, count):
+        return [
+            {
+                "title": f"title {index}",
+                "body": "body",
+                "summary": "summary",
+                "pdf_file": None,
+            }
+            for index in range(count)
+        ]
+
+    def test_batch_is_created(self):
+        response = self.client.post(self.url, {"items": self.build_items(50)}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["success"]), 50)
+        self.assertEqual(ContentItem.objects.filter(author=self.user).count(), 50)
+
+    def test_invalid_items_are_reported_and_nothing_is_created(self):
+        ContentItem.objects.create(
+            author=self.user, title="title 0", body="body", summary="summary"
+        )
+        items = self.build_items(3)
+        items.append(dict(items[2]))
+
+        response = self.client.post(self.url, {"items": items}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["index"] for error in response.data["error"]], [0, 2, 3])
+        self.assertEqual(ContentItem.objects.filter(author=self.user).count(), 1)
+
+
+class ContentBulkUpdateDeleteTest(AuthorTestCase):
+    """
+    Tests for the bulk content update and delete endpoints.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.other_user = self.create_author("other@example.com", "8888888888")
+
+        self.contents = [
+            ContentItem.objects.create(
+                author=self.user, title=f"title {index}", body="body", summary="summary"
+            )
+            for index in range(3)
+        ]
+        self.other_content = ContentItem.objects.create(
+            author=self.other_user, title="other title", body="body", summary="summary"
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "The title constraint is deferrable on PostgreSQL only")
+    def test_bulk_update_applies_changes(self):
+        items = [
+            {"id": self.contents[0].id, "title": "title 1"},
+            {"id": self.contents[1].id, "title": "title 0", "body": "new body"},
+        ]
+
+        response = self.client.put("/api/v1/author/content/bulk-update/", {"items": items}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.contents[1].refresh_from_db()
+        self.assertEqual((self.contents[1].title, self.contents[1].body), ("title 0", "new body"))
+
+    def test_bulk_update_keeps_own_title(self):
+        items = [
+            {"id": self.contents[0].id, "title": "title 0"},
+            {"id": self.contents[1].id, "title": "new title", "body": "new body"},
+        ]
+
+        response = self.client.put("/api/v1/author/content/bulk-update/", {"items": items}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.contents[1].refresh_from_db()
+        self.assertEqual((self.contents[1].title, self.contents[1].body), ("new title", "new body"))
+
+    def test_bulk_update_rejects_content_of_other_authors(self):
+        items = [
+            {"id": self.contents[0].id, "body": "new body"},
+            {"id": self.other_content.id, "body": "new body"},
+        ]
+
+        response = self.client.put("/api/v1/author/content/bulk-update/", {"items": items}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["index"] for error in response.data["error"]], [1])
+        self.contents[0].refresh_from_db()
+        self.assertEqual(self.contents[0].body, "body")
+
+    def test_bulk_delete_is_restricted_to_own_content(self):
+        response = self.client.post(
+            "/api/v1/author/content/bulk-delete/",
+            {"filter": {"author_id": self.other_user.id}},
+            format="json",
+        )
+        self.assertEqual(response.data["success"]["deleted_count"], 0)
+
+        response = self.client.post(
+            "/api/v1/author/content/bulk-delete/",
+            {"ids": [content.id for content in self.contents] + [self.other_content.id]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["success"]["deleted_count"], 3)
+        self.assertTrue(ContentItem.objects.filter(id=self.other_content.id).exists())
+
+    def test_invalid_ids_and_filters_are_rejected(self):
+        response = self.client.put(
+            "/api/v1/author/content/bulk-update/",
+            {"items": [{"id": True, "body": "new body"}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        for data in [
+            {"ids": [True]},
+            {"filter": {"author_id": "abc"}},
+            {"filter": {"author_id": False}},
+            {"filter": {"category": ["python"]}},
+        ]:
+            with self.subTest(data=data):
+                response = self.client.post(
+                    "/api/v1/author/content/bulk-delete/", data, format="json"
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ContentItem.objects.count(), 4)
+
+
+class ContentTitleUniquenessTest(AuthorTestCase):
+    """
+    Tests for the title uniqueness enforced by the database.
+    """
+
+    def setUp(self):
+        super().setUp()
+        ContentItem.objects.create(
+            author=self.user, title="title", body="body", summary="summary"
+        )
+
+    def test_duplicate_title_is_a_validation_error(self):
+        response = self.client.post(
+            "/api/v1/author/content/add/",
+            {"title": "title", "body": "body", "summary": "summary", "pdf_file": None},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], [TITLE_EXISTS_MESSAGE])
+        self.assertEqual(ContentItem.objects.count(), 1)
+
+    def test_only_title_unique_violations_are_title_errors(self):
+        with self.assertRaises(IntegrityError) as duplicate, transaction.atomic():
+            ContentItem.objects.create(
+                author=self.user, title="title", body="body", summary="summary"
+            )
+        with self.assertRaises(IntegrityError) as missing, transaction.atomic():
+            ContentItem.objects.create(
+                author=self.user, title=None, body="body", summary="summary"
+            )
+
+        self.assertTrue(is_title_integrity_error(duplicate.exception))
+        self.assertFalse(is_title_integrity_error(missing.exception))
+
+
+class ContentSearchTest(AuthorTestCase):
+    """
+    Tests for the content full-text search endpoint.
+    """
+
+    url = "/api/v1/author/content/search/"
+
+    def setUp(self):
+        super().setUp()
+        other_user = self.create_author("other@example.com", "8888888888")
+
+        ContentItem.objects.create(
+            author=self.user, title="Django tips", body="Query optimisation", summary="orm"
+        )
+        self.matching_content = ContentItem.objects.create(
+            author=self.user, title="Cooking", body="Pasta recipes", summary="Italian food"
+        )
+        ContentItem.objects.create(
+            author=other_user,
+            title="More pasta",
+            body="Pasta recipes",
+            summary="food",
+        )
+
+    def test_content_deleted_during_search_is_skipped(self):
+        search_hits = search_content(
+            ContentItem.objects.filter(author_id=self.user.id), "pasta", limit=10
+        )
+        self.matching_content.delete()
+
+        with mock.patch(
+            "cms_app.views.content_viewset.search_content", return_value=search_hits
+        ):
+            response = self.client.get(self.url, {"q": "pasta"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["success"], [])
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite full-text search triggers")
+    def test_sqlite_triggers_dropped_by_a_migration_are_restored(self):
+        with connection.cursor() as cursor:
+            for name in SQLITE_SEARCH_TRIGGER_NAMES:
+                cursor.execute(f"DROP TRIGGER {name}")
+        self.matching_content.title = "Zanzibar"
+        self.matching_content.save()
+
+        restore_sqlite_search_triggers(
+            sender=apps.get_app_config("cms_app"), using="default", apps=apps
+        )
+
+        response = self.client.get(self.url, {"q": "zanzibar"})
+        self.assertEqual(
+            [content["id"] for content in response.data["success"]],
+            [self.matching_content.id],
+        )
+
+    def test_search_is_scoped_to_own_content(self):
+        response = self.client.get(self.url, {"q": "pasta"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [content["id"] for content in response.data["success"]],
+            [self.matching_content.id],
+        )
+        self.assertIn("<b>Pasta</b>", response.data["success"][0]["search_highlight"])
+
+    def test_highlight_is_html_escaped(self):
+        self.matching_content.body = "Pasta <script>alert(1)</script> & sauce"
+        self.matching_content.save()
+
+        response = self.client.get(self.url, {"q": "pasta", "items": 1000})
+
+        highlight = response.data["success"][0]["search_highlight"]
+        self.assertIn("<b>Pasta</b>", highlight)
+        self.assertNotIn("<script>", highlight)
+        self.assertIn("&lt;script&gt;", highlight)
+        self.assertEqual(response.data["page_details"]["items"], settings.CONTENT_PAGE_MAX_ITEMS)
+
+    def test_search_follows_updates(self):
+        self.matching_content.body = "Risotto"
+        self.matching_content.summary = ""
+        self.matching_content.save()
+
+        response = self.client.get(self.url, {"q": "pasta"})
+
+        self.assertEqual(response.data["success"], [])
+
+
+class FakeMinioClient:
+    """
+    In memory stand-in of the MinIO client calls made by MinioStorage.
+    """
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, bucket_name, object_name, data, length, content_type, part_size):
+        self.objects[object_name] = data.read(length)
+
+    def stat_object(self, bucket_name, object_name):
+        if object_name not in self.objects:
+            raise S3Error("NoSuchKey", "missing", object_name, None, None, None)
+        return SimpleNamespace(
+            size=len(self.objects[object_name]), last_modified=timezone.now()
+        )
+
+    def get_object(self, bucket_name, object_name):
+        data = self.objects[object_name]
+        return SimpleNamespace(
+            stream=lambda amt: iter([data]),
+            close=lambda: None,
+            release_conn=lambda: None,
+        )
+
+    def remove_object(self, bucket_name, object_name):
+        self.objects.pop(object_name, None)
+
+
+class ContentPdfUploadTest(AuthorTestCase):
+    """
+    Tests for the streamed and resumable pdf uploads and the pdf download.
+    """
+
+    pdf_content = b"%PDF-1.4\n" + b"0" * 4000 + b"\n%%EOF\n"
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media_settings = override_settings(
+            MEDIA_ROOT=self.media_root,
+            CONTENT_PDF_RESUMABLE_THRESHOLD=5000,
+            CONTENT_PDF_UPLOAD_CHUNK_SIZE=3000,
+        )
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        super().setUp()
+
+    def add_content(self, **data):
+        return self.client.post(
+            "/api/v1/author/content/add/",
+            {"title": "title", "body": "body", "summary": "summary", **data},
+            format="multipart",
+        )
+
+    def get_partial_files(self):
+        partial_directory = os.path.join(self.media_root, PDF_PARTIAL_UPLOAD_DIRECTORY)
+        if not os.path.isdir(partial_directory):
+            return []
+        return os.listdir(partial_directory)
+
+    def test_streamed_pdf_is_saved(self):
+        response = self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        content = ContentItem.objects.get()
+        sha256 = hashlib.sha256(self.pdf_content).hexdigest()
+        self.assertEqual(
+            content.pdf_file.name,
+            f"content_management_pdf/{sha256[:2]}/{sha256[2:4]}/{sha256}.pdf",
+        )
+        with content.pdf_file.open("rb") as pdf_file:
+            self.assertEqual(pdf_file.read(), self.pdf_content)
+        self.assertEqual(self.get_partial_files(), [])
+
+    def test_duplicate_pdf_is_stored_once_and_collected(self):
+        for title in ["first", "second"]:
+            response = self.add_content(
+                title=title,
+                pdf_file=SimpleUploadedFile(f"{title}.pdf", self.pdf_content, "application/pdf"),
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        first, second = ContentItem.objects.order_by("id")
+        self.assertEqual(first.pdf_file.name, second.pdf_file.name)
+        pdf_blob = PdfBlob.objects.get()
+        self.assertEqual(pdf_blob.reference_count, 2)
+        self.assertEqual(pdf_blob.size, len(self.pdf_content))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(f"/api/v1/author/content/delete/{first.id}/")
+        pdf_blob.refresh_from_db()
+        self.assertEqual(pdf_blob.reference_count, 1)
+        self.assertTrue(second.pdf_file.storage.exists(second.pdf_file.name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(f"/api/v1/author/content/delete/{second.id}/")
+        self.assertFalse(PdfBlob.objects.exists())
+        self.assertFalse(second.pdf_file.storage.exists(second.pdf_file.name))
+
+    def test_stored_pdf_is_overwritten_under_its_name(self):
+        storage = ContentItem._meta.get_field("pdf_file").storage
+        name = storage.save("content_management_pdf/first.pdf", ContentFile(self.pdf_content))
+        # Saved concurrently, after the existence check of another save
+        with mock.patch.object(type(storage), "exists", return_value=False):
+            self.assertEqual(
+                storage.save("content_management_pdf/second.pdf", ContentFile(self.pdf_content)),
+                name,
+            )
+        stored_names = os.listdir(os.path.dirname(storage.path(name)))
+        self.assertEqual(stored_names, [os.path.basename(name)])
+
+    def test_collected_pdf_cant_be_referenced(self):
+        storage = ContentItem._meta.get_field("pdf_file").storage
+        name = storage.save("content_management_pdf/file.pdf", ContentFile(self.pdf_content))
+        add_pdf_blob_references([name])
+        remove_pdf_blob_references([name])
+        # Collected after the pdf was saved again, before it's referenced
+        delete_orphaned_pdf_blobs([name])
+
+        with self.assertRaises(FileNotFoundError):
+            add_pdf_blob_references([name])
+
+    def test_non_pdf_file_is_rejected(self):
+        response = self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", b"MZ" + b"0" * 100, "application/pdf")
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], ["Invalid pdf file."])
+        self.assertFalse(ContentItem.objects.exists())
+        self.assertEqual(self.get_partial_files(), [])
+
+    def test_pdf_over_resumable_threshold_is_rejected(self):
+        response = self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content * 2, "application/pdf")
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ContentItem.objects.exists())
+        self.assertEqual(self.get_partial_files(), [])
+
+    def test_resumable_upload(self):
+        pdf_content = self.pdf_content * 2
+        response = self.client.post(
+            "/api/v1/author/content/pdf-uploads/",
+            {
+                "file_name": "large.pdf",
+                "total_size": len(pdf_content),
+                "sha256": hashlib.sha256(pdf_content).hexdigest(),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        upload_url = f"/api/v1/author/content/pdf-uploads/{response.data['success']['id']}/"
+
+        def send_chunk(start, end):
+            return self.client.generic(
+                "PUT",
+                upload_url,
+                pdf_content[start : end + 1],
+                content_type="application/octet-stream",
+                HTTP_CONTENT_RANGE=f"bytes {start}-{end}/{len(pdf_content)}",
+            )
+
+        self.assertEqual(send_chunk(0, 2999).status_code, status.HTTP_200_OK)
+        # Resuming at a wrong offset
+        response = send_chunk(0, 2999)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["received_size"], 3000)
+        self.assertEqual(send_chunk(3000, 5999).status_code, status.HTTP_200_OK)
+        response = send_chunk(6000, len(pdf_content) - 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["success"]["is_complete"])
+
+        response = self.add_content(pdf_upload_id=response.data["success"]["id"])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        with ContentItem.objects.get().pdf_file.open("rb") as pdf_file:
+            self.assertEqual(pdf_file.read(), pdf_content)
+        self.assertFalse(PdfUploadSession.objects.exists())
+        self.assertEqual(self.get_partial_files(), [])
+
+    def download(self, **headers):
+        content = ContentItem.objects.get()
+        response = self.client.get(f"/api/v1/author/content/{content.id}/pdf/", **headers)
+        self.addCleanup(response.close)
+        return response
+
+    def test_download_head(self):
+        self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+        content = ContentItem.objects.get()
+
+        response = self.client.head(f"/api/v1/author/content/{content.id}/pdf/")
+        self.addCleanup(response.close)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Length"], str(len(self.pdf_content)))
+
+    def test_download_with_ranges(self):
+        self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+
+        response = self.download()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), self.pdf_content)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        etag = response["ETag"]
+        self.assertEqual(etag, f'"{hashlib.sha256(self.pdf_content).hexdigest()}"')
+
+        response = self.download(HTTP_RANGE="bytes=5-14", HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), self.pdf_content[5:15])
+        self.assertEqual(response["Content-Range"], f"bytes 5-14/{len(self.pdf_content)}")
+
+        response = self.download(HTTP_RANGE="bytes=-10")
+        self.assertEqual(b"".join(response.streaming_content), self.pdf_content[-10:])
+
+        # The file changed since the range was computed
+        response = self.download(HTTP_RANGE="bytes=5-14", HTTP_IF_RANGE='"outdated"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.download(HTTP_RANGE=f"bytes={len(self.pdf_content)}-")
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+
+        response = self.download(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_download_base64(self):
+        self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+
+        response = self.download(QUERY_STRING="encoding=base64")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(base64.b64decode(data["success"]["base64_string"]), self.pdf_content)
+        self.assertEqual(data["success"]["file_name"], "title")
+
+    @override_settings(CONTENT_PDF_SENDFILE_BACKEND="x-accel-redirect")
+    def test_download_through_x_accel_redirect(self):
+        self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+
+        response = self.download()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            f"/protected-media/{ContentItem.objects.get().pdf_file.name}",
+        )
+        self.assertEqual(response.content, b"")
+
+    def test_pdf_is_processed_in_background(self):
+        document = fitz.open()
+        document.new_page().insert_text((72, 72), "Zanzibar archipelago")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.add_content(
+                pdf_file=SimpleUploadedFile("file.pdf", document.tobytes(), "application/pdf")
+            )
+
+        self.assertEqual(response.data["success"]["pdf_processing_status"], "pending")
+        content = ContentItem.objects.get()
+        self.assertEqual(content.pdf_processing_status, "completed")
+        self.assertEqual(content.pdf_page_count, 1)
+        self.assertTrue(os.path.exists(content.pdf_thumbnail.path))
+        response = self.client.get("/api/v1/author/content/search/", {"q": "zanzibar"})
+        self.assertEqual([hit["id"] for hit in response.data["success"]], [content.id])
+
+    def test_pdf_thumbnail_is_stored_in_minio_bucket(self):
+        minio_client = self.use_minio_storage()
+        document = fitz.open()
+        document.new_page()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.add_content(
+                pdf_file=SimpleUploadedFile("file.pdf", document.tobytes(), "application/pdf")
+            )
+
+        content = ContentItem.objects.get()
+        self.assertEqual(
+            content.pdf_thumbnail.name, get_pdf_thumbnail_name(content.pdf_file.name)
+        )
+        self.assertEqual(
+            sorted(minio_client.objects),
+            sorted([content.pdf_file.name, content.pdf_thumbnail.name]),
+        )
+
+    def test_pdf_being_processed_is_claimed_once_stale(self):
+        with mock.patch("cms_app.tasks.process_content_pdf_task.delay"):
+            self.add_content(
+                pdf_file=SimpleUploadedFile("file.pdf", b"%PDF-1.4\n", "application/pdf")
+            )
+        content = ContentItem.objects.get()
+        ContentItem.objects.filter(id=content.id).update(pdf_processing_status="processing")
+
+        self.assertIsNone(process_content_pdf(content.id, content.pdf_file.name))
+
+        timeout = timedelta(seconds=settings.CONTENT_PDF_PROCESSING_TIMEOUT)
+        ContentItem.objects.filter(id=content.id).update(
+            updated_at=timezone.now() - timeout - timedelta(seconds=1)
+        )
+        self.assertEqual(process_content_pdf(content.id, content.pdf_file.name), "failed")
+
+    def test_invalid_pdf_processing_fails(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.add_content(
+                pdf_file=SimpleUploadedFile("file.pdf", b"%PDF-1.4\n", "application/pdf")
+            )
+
+        content = ContentItem.objects.get()
+        self.assertEqual(content.pdf_processing_status, "failed")
+        self.assertIn("Invalid pdf file", content.pdf_processing_error)
+        self.assertIsNone(content.pdf_page_count)
+
+    def use_minio_storage(self):
+        minio_client = FakeMinioClient()
+        storage_options = {
+            "bucket_name": "content",
+            "client": minio_client,
+            # Presigning is computed locally, nothing is sent to the endpoint
+            "presign_client": Minio(
+                "minio.example.com",
+                access_key="access",
+                secret_key="secret",
+                region="us-east-1",
+            ),
+            "url_expires": 3600,
+        }
+        for field, storage in [
+            ("pdf_file", ContentAddressedMinioStorage(**storage_options)),
+            ("pdf_thumbnail", MinioStorage(**storage_options)),
+        ]:
+            storage_patch = mock.patch.object(
+                ContentItem._meta.get_field(field), "storage", storage
+            )
+            storage_patch.start()
+            self.addCleanup(storage_patch.stop)
+        return minio_client
+
+    def test_pdf_is_stored_in_minio_bucket(self):
+        minio_client = self.use_minio_storage()
+
+        response = self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        name = ContentItem.objects.get().pdf_file.name
+        self.assertEqual(minio_client.objects, {name: self.pdf_content})
+        self.assertEqual(self.get_partial_files(), [])
+
+    def test_minio_download_redirects_to_stable_presigned_url(self):
+        self.use_minio_storage()
+        self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+        name = ContentItem.objects.get().pdf_file.name
+
+        first_response = self.download()
+        second_response = self.download()
+
+        self.assertEqual(first_response.status_code, status.HTTP_302_FOUND)
+        self.assertTrue(
+            first_response["Location"].startswith(f"https://minio.example.com/content/{name}?")
+        )
+        self.assertIn("X-Amz-Signature=", first_response["Location"])
+        self.assertEqual(first_response["Location"], second_response["Location"])
+
+    def test_read_serializer_presigns_minio_pdf_url(self):
+        self.use_minio_storage()
+        self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+        content = ContentItem.objects.get()
+
+        pdf_url = ContentItemReadSerializer.from_queryset(
+            ContentItem.objects.filter(id=content.id)
+        ).data[0]["pdf_file"]
+
+        self.assertTrue(
+            pdf_url.startswith(f"https://minio.example.com/content/{content.pdf_file.name}?")
+        )
+        self.assertIn("X-Amz-Signature=", pdf_url)
+        self.assertEqual(pdf_url, ContentItemSerializer(instance=content).data["pdf_file"])
+
+    def test_detail_with_presigned_pdf_url_has_no_last_modified(self):
+        self.use_minio_storage()
+        self.add_content(
+            pdf_file=SimpleUploadedFile("file.pdf", self.pdf_content, "application/pdf")
+        )
+        url = f"/api/v1/author/content/{ContentItem.objects.get().id}/"
+
+        response = self.client.get(url)
+        # Revalidated by date only, a stale presigned URL would be kept
+        not_modified = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+        )
+
+        self.assertNotIn("Last-Modified", response)
+        self.assertEqual(not_modified.status_code, status.HTTP_200_OK)
+
+
+@override_settings(CONTENT_AUTO_SUMMARY=True)
+class ContentSummaryTest(AuthorTestCase):
+    """
+    Tests for the summaries generated in the background.
+    """
+
+    body = (
+        "Django caches querysets. Caching querysets avoids repeated queries. "
+        "The weather was nice. Querysets are lazy."
+    )
+
+    def add_content(self, title, **data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                "/api/v1/author/content/add/",
+                {"title": title, "body": self.body, "pdf_file": "", **data},
+                format="multipart",
+            )
+
+    def test_missing_summary_is_generated_once_per_body(self):
+        response = self.add_content("first")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["success"]["summary_status"], "pending")
+        content = ContentItem.objects.get()
+        self.assertEqual(content.summary_status, "generated")
+        self.assertEqual(content.summary, "Django caches querysets. Querysets are lazy.")
+
+        with mock.patch(
+            "common_utility.utils.summarizer_utility.ExtractiveSummarizer.summarize_batch"
+        ) as summarize_batch:
+            self.add_content("second")
+
+        summarize_batch.assert_not_called()
+        self.assertEqual(ContentItem.objects.get(title="second").summary, content.summary)
+
+    @override_settings(CONTENT_AUTO_SUMMARY=False)
+    def test_missing_summary_is_required_by_default(self):
+        response = self.add_content("first")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ContentItem.objects.exists())
+
+    def test_author_summary_is_kept(self):
+        self.add_content("first", summary="Written by hand")
+
+        content = ContentItem.objects.get()
+        self.assertEqual(content.summary_status, "author")
+        self.assertEqual(content.summary, "Written by hand")
+
+    def test_failed_summaries_are_retried(self):
+        content = ContentItem.objects.create(
+            author=self.user, title="first", body=self.body, summary="", summary_status="failed"
+        )
+        self.client.get(f"/api/v1/author/content/{content.id}/")
+
+        with mock.patch("cms_app.tasks.summarize_content_task.delay") as delay:
+            call_command("summarize_content", "--failed", stdout=io.StringIO())
+
+        delay.assert_called_once_with([content.id])
+        retried = ContentItem.objects.get()
+        self.assertEqual(retried.summary_status, "pending")
+        self.assertGreater(retried.updated_at, content.updated_at)
+        response = self.client.get(f"/api/v1/author/content/{content.id}/")
+        self.assertEqual(response.data["success"]["summary_status"], "pending")
+
+
+class ContentReadSerializerTest(AuthorTestCase):
+    """
+    Tests for the read-only content serializer of the detail and listing endpoints.
+    """
+
+    def setUp(self):
+        super().setUp()
+        first = ContentItem.objects.create(
+            author=self.user,
+            title="first",
+            body="body",
+            summary=None,
+            categories="b, a",
+            pdf_file="content_management_pdf/file.pdf",
+        )
+        # Set once saved, saving a new pdf file clears its details
+        ContentItem.objects.filter(id=first.id).update(
+            pdf_thumbnail="content_management_pdf_thumbnail/file.png",
+            pdf_page_count=3,
+        )
+        set_content_categories([first])
+        ContentItem.objects.create(author=self.user, title="second", body="body", summary="")
+
+    def test_output_matches_content_serializer(self):
+        queryset = ContentItem.objects.order_by("id")
+        expected = JSONRenderer().render(
+            ContentItemSerializer(
+                instance=queryset.prefetch_related("category_tags"), many=True
+            ).data
+        )
+        self.assertIn(b'"pdf_page_count":3', expected)
+        rows = list(queryset.values_list(*CONTENT_READ_COLUMNS))
+        category_tags = load_category_tags([row[0] for row in rows])
+
+        for serializer in [
+            ContentItemReadSerializer(queryset.prefetch_related("category_tags")),
+            ContentItemReadSerializer(rows, category_tags=category_tags),
+            ContentItemReadSerializer(
+                queryset.values(*CONTENT_READ_COLUMNS), category_tags=category_tags
+            ),
+            ContentItemReadSerializer.from_queryset(queryset),
+        ]:
+            with self.subTest(row_type=type(serializer.rows[0]).__name__):
+                self.assertEqual(JSONRenderer().render(serializer.data), expected)
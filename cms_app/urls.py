@@ -1,6 +1,7 @@
 from django.urls import path,include
 
 from cms_app.views.content_viewset import ContentItemViewset
+from cms_app.views.pdf_upload_viewset import PdfUploadViewset
 
 urlpatterns = [
     path(
@@ -15,6 +16,14 @@ urlpatterns = [
                         }
                     ),
                 ),
+                path(
+                    "<int:content_id>/pdf/",
+                    ContentItemViewset.as_view(
+                        {
+                            "get": "download_content_pdf",
+                        }
+                    ),
+                ),
                 path(
                     "all/",
                     ContentItemViewset.as_view(
@@ -23,6 +32,22 @@ urlpatterns = [
                         }
                     ),
                 ),
+                path(
+                    "search/",
+                    ContentItemViewset.as_view(
+                        {
+                            "get": "search_content_details",
+                        }
+                    ),
+                ),
+                path(
+                    "cache-stats/",
+                    ContentItemViewset.as_view(
+                        {
+                            "get": "get_content_cache_stats",
+                        }
+                    ),
+                ),
                 path(
                     "add/",
                     ContentItemViewset.as_view(
@@ -31,6 +56,48 @@ urlpatterns = [
                         }
                     ),
                 ),
+                path(
+                    "bulk-add/",
+                    ContentItemViewset.as_view(
+                        {
+                            "post": "bulk_add_content_details",
+                        }
+                    ),
+                ),
+                path(
+                    "bulk-update/",
+                    ContentItemViewset.as_view(
+                        {
+                            "put": "bulk_update_content_details",
+                        }
+                    ),
+                ),
+                path(
+                    "bulk-delete/",
+                    ContentItemViewset.as_view(
+                        {
+                            "post": "bulk_delete_content_details",
+                        }
+                    ),
+                ),
+                path(
+                    "pdf-uploads/",
+                    PdfUploadViewset.as_view(
+                        {
+                            "post": "start_pdf_upload",
+                        }
+                    ),
+                ),
+                path(
+                    "pdf-uploads/<uuid:upload_id>/",
+                    PdfUploadViewset.as_view(
+                        {
+                            "get": "get_pdf_upload",
+                            "put": "upload_pdf_chunk",
+                            "delete": "delete_pdf_upload",
+                        }
+                    ),
+                ),
                 path(
                     "update/<int:content_id>/",
                     ContentItemViewset.as_view(
@@ -1,31 +1,122 @@
+import json
 import traceback
+from collections import Counter
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, connection, transaction
+from django.db.models import prefetch_related_objects
+from django.http import HttpResponseRedirect
+from django.utils import timezone
+from django.utils.text import slugify
+from urllib.parse import quote
 from django.contrib.auth.models import AnonymousUser
 from rest_framework import status, viewsets,status, exceptions
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from cms_app.serializers.content_serializer import ContentItemSerializer
+from users_info.authentication import CachedJWTAuthentication, get_full_user
+from cms_app.serializers.content_serializer import (
+    ContentItemSerializer,
+    TITLE_EXISTS_MESSAGE,
+    deferred_title_constraint,
+    get_existing_titles,
+    is_title_integrity_error,
+)
+from cms_app.serializers.content_read_serializer import ContentItemReadSerializer
 from users_info.serializers.user_serializers import UserSerializer
 from cms_app.permission import (
     BaseAdminPermission,
     AuthorAndAdminGetUpdateDeletePermissions,
+    SuperAdminPermission,
 )
 from common_utility.utils.serializers_errors import serializer_error
-from common_utility.utils.pagination_utility import pagination_utility
+from common_utility.utils.pagination_utility import (
+    pagination_utility,
+    cursor_pagination_utility,
+    build_count_cache_key,
+    invalidate_count_cache,
+)
+from common_utility.utils.constants import CountStrategy
+from common_utility.utils.date_time_util import convert_string_to_datetime_object
+from common_utility.utils.upload_utility import get_rejected_uploads
+from common_utility.utils.file_response_utility import (
+    build_file_response,
+    build_sendfile_response,
+)
+from common_utility.utils.storage_utility import ContentAddressedStorageMixin
+from common_utility.utils.streaming_json_utility import RawJSONString, StreamingJSONResponse
+from common_utility.utils.file_to_base64 import iter_file_base64
+from common_utility.utils.conditional_request_utility import (
+    build_strong_etag,
+    build_weak_etag,
+    get_not_modified_response,
+    set_conditional_headers,
+)
 from cms_app.models import ContentItem
-from users_info.models import UserDetails
+from cms_app.cache import content_item_cache
+from cms_app.search import search_content
+from cms_app.categories import (
+    annotate_category_names,
+    get_category_tags,
+    set_content_categories,
+)
+from cms_app.pdf_uploads import (
+    build_pdf_upload_handler,
+    delete_used_upload_sessions,
+    get_pdf_storage,
+)
+from cms_app.storage import get_storage_url_version
+from cms_app.pdf_blobs import add_pdf_blob_references
+from cms_app.pdf_processing import reset_pdf_processing
+from cms_app.summaries import update_summary_status
+from cms_app.tasks import schedule_content_summaries, schedule_pdf_processing
+from cms_app.signals import CONTENT_COUNT_CACHE_NAMESPACE
+
+# Fields a bulk update can change
+BULK_UPDATE_FIELDS = ["title", "body", "summary", "categories"]
+
+# Filters a bulk delete can select content with, mapped to their lookup
+BULK_DELETE_FILTERS = {
+    "author_id": "author_id",
+    "category": "category_tags__name",
+    "created_before": "created_at__lt",
+    "created_after": "created_at__gte",
+}
+
+# Actions receiving pdf files, streamed to the pdf storage while the request is parsed
+PDF_UPLOAD_ACTIONS = [
+    "add_content_details",
+    "bulk_add_content_details",
+    "update_content_details",
+]
+
+
+def is_json_id(value) -> bool:
+    """
+    Whether a value of a JSON body is an ID, booleans being ints in Python.
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
 
 class ContentItemViewset(viewsets.ViewSet):
     """
     ViewSet for handling ContentItem operations including retrieving, adding, updating, and deleting content items.
     """
+    def initialize_request(self, request, *args, **kwargs):
+        """
+        Override to stream the pdf files of the upload actions instead of buffering them.
+        """
+        request = super().initialize_request(request, *args, **kwargs)
+        if self.action in PDF_UPLOAD_ACTIONS:
+            request.upload_handlers.insert(0, build_pdf_upload_handler(request._request))
+        return request
+
     def get_authenticators(self):
         """
         Override to return the authentication classes based on the request method.
         """
         authentication_classes = []
-        if self.request.method in ["GET", "DELETE", "POST", "PUT"]:
-            authentication_classes = [JWTAuthentication()]
+        if self.request.method in ["GET", "HEAD", "DELETE", "POST", "PUT"]:
+            authentication_classes = [CachedJWTAuthentication()]
         return authentication_classes
 
     def get_permissions(self):
@@ -33,15 +124,41 @@ class ContentItemViewset(viewsets.ViewSet):
         Override to return the permission classes based on the action.
         """
         permission_classes = []
-        if self.action in ["add_content_details"]:
+        if self.action in ["add_content_details", "bulk_add_content_details"]:
             permission_classes += [IsAuthenticated(), BaseAdminPermission()]
-        elif self.action in ["get_content_details", "get_all_content_details", "update_content_details","delete_content_details"]:
+        elif self.action in ["get_content_details", "download_content_pdf", "get_all_content_details", "search_content_details", "update_content_details","delete_content_details", "bulk_update_content_details", "bulk_delete_content_details"]:
             permission_classes += [
                 IsAuthenticated(),
                 AuthorAndAdminGetUpdateDeletePermissions(),
             ]
+        elif self.action in ["get_content_cache_stats"]:
+            permission_classes += [IsAuthenticated(), SuperAdminPermission()]
         return permission_classes
 
+    def _get_content_page_etag(self, author, content_page, page_details):
+        """
+        Compute the ETag of a listing page without serializing it.
+
+        Listings have no Last-Modified: deleting an item or moving an older one onto the
+        page changes the page without a newer updated_at, so If-Modified-Since can't be
+        answered from the updated_at of the page.
+
+        Args:
+            author: The author whose details are part of the response.
+            content_page: The content items of the page.
+            page_details: The pagination details of the page.
+
+        Returns:
+            str: Weak ETag of the page.
+        """
+        return build_weak_etag(
+            author.id,
+            author.updated_at.isoformat(),
+            [(content.id, content.updated_at.isoformat()) for content in content_page],
+            sorted(page_details.items()),
+            get_storage_url_version(get_pdf_storage()),
+        )
+
     def get_content_details(self, request, content_id):
         """
         Retrieve the details of a specific content item.
@@ -66,10 +183,11 @@ class ContentItemViewset(viewsets.ViewSet):
                 )
 
             try:
-                content_obj = ContentItem.objects.get(
-                    id=content_id
-                )
-            except content_obj.DoesNotExist:
+                # Only the columns needed for the permission check and the cache version
+                content_obj = ContentItem.objects.only(
+                    "id", "author_id", "updated_at"
+                ).get(id=content_id)
+            except ContentItem.DoesNotExist:
                 return Response(
                     data={
                         "status": status.HTTP_400_BAD_REQUEST,
@@ -89,30 +207,198 @@ class ContentItemViewset(viewsets.ViewSet):
                     status=status.HTTP_403_FORBIDDEN,
                 )
 
-            serializer = ContentItemSerializer(
-                instance=content_obj
+            # The pdf URL of presigning storages changes with their URL version, without
+            # updated_at moving: the representation has no Last-Modified then
+            version = content_obj.updated_at.isoformat()
+            last_modified = content_obj.updated_at
+            pdf_url_version = get_storage_url_version(get_pdf_storage())
+            if pdf_url_version is not None:
+                version = f"{version}:{pdf_url_version}"
+                last_modified = None
+            etag = build_weak_etag(content_obj.id, version)
+            not_modified_response = get_not_modified_response(
+                request, etag=etag, last_modified=last_modified
             )
+            if not_modified_response is not None:
+                return not_modified_response
 
-            if serializer.data:
+            def load_content_data():
+                content_data = ContentItemReadSerializer.from_queryset(
+                    ContentItem.objects.filter(id=content_obj.id)
+                ).data
+                if not content_data:
+                    raise ContentItem.DoesNotExist
+                return content_data[0]
+
+            try:
+                content_data = content_item_cache.get_or_load(
+                    key=content_obj.id, version=version, loader=load_content_data
+                )
+            except ContentItem.DoesNotExist:
+                # Deleted since the permission check
                 return Response(
                     data={
-                        "status": status.HTTP_200_OK,
-                        "success": serializer.data,
-                        "message": "content details reterived.",
+                        "status": status.HTTP_404_NOT_FOUND,
+                        "error": "No content message with given content id.",
                     },
-                    status=status.HTTP_200_OK,
+                    status=status.HTTP_404_NOT_FOUND,
                 )
-            else:
-                serializer_errors = serializer.errors
-                error_message = serializer_error(serializer_errors)
+
+            response = Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": content_data,
+                    "message": "content details reterived.",
+                },
+                status=status.HTTP_200_OK,
+            )
+            return set_conditional_headers(response, etag=etag, last_modified=last_modified)
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def download_content_pdf(self, request, content_id):
+        """
+        Download the pdf file of a specific content item.
+
+        Supports Range requests, with If-Range to resume downloads, and conditional
+        requests. The file is sent by the web server when CONTENT_PDF_SENDFILE_BACKEND is
+        set and streamed by Django otherwise, it's never read into memory. Files of an
+        object storage (MinIO/S3) are downloaded with a redirect to a presigned URL.
+
+        Args:
+            request: The HTTP request object, `download=true` to get it as an attachment,
+                `encoding=base64` to get it Base64 encoded in a JSON response.
+            content_id: The ID of the content item whose pdf file to download.
+
+        Returns:
+            HttpResponse: The pdf file or the requested part of it, or an error message.
+        """
+        try:
+            user = request.user
+
+            if user.is_anonymous:
                 return Response(
                     data={
                         "status": status.HTTP_400_BAD_REQUEST,
-                        "error": error_message,
+                        "error": "Token not provided.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            try:
+                content_obj = ContentItem.objects.only(
+                    "id", "author_id", "title", "pdf_file"
+                ).get(id=content_id)
+            except ContentItem.DoesNotExist:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "No content with given content id.",
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
+            try:
+                self.check_object_permissions(request, content_obj)
+            except exceptions.PermissionDenied:
+                return Response(
+                    data={
+                        "status": status.HTTP_403_FORBIDDEN,
+                        "error": "You do not have permission to access this content.",
+                    },
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+
+            pdf_name = content_obj.pdf_file.name
+            storage = content_obj.pdf_file.storage
+            is_base64 = request.query_params.get("encoding") == "base64"
+            if (
+                pdf_name
+                and not is_base64
+                and get_storage_url_version(storage) is not None
+            ):
+                # Downloaded from the object storage with a presigned URL
+                return HttpResponseRedirect(storage.url(pdf_name))
+
+            try:
+                if not pdf_name:
+                    raise FileNotFoundError(pdf_name)
+                size = storage.size(pdf_name)
+                last_modified = storage.get_modified_time(pdf_name)
+            except FileNotFoundError:
+                return Response(
+                    data={
+                        "status": status.HTTP_404_NOT_FOUND,
+                        "error": "No pdf file for this content.",
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            # The name of a content addressed file is the digest of its bytes
+            sha256 = ContentAddressedStorageMixin.get_name_sha256(pdf_name)
+            etag = (
+                f'"{sha256}"'
+                if sha256
+                else build_strong_etag(pdf_name, size, last_modified.isoformat())
+            )
+            if is_base64:
+                etag = build_weak_etag(etag, "base64")
+            not_modified_response = get_not_modified_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if not_modified_response is not None:
+                return not_modified_response
+
+            if is_base64:
+                # Streamed as it's encoded, the file is never held in memory
+                response = StreamingJSONResponse(
+                    data={
+                        "status": status.HTTP_200_OK,
+                        "success": {
+                            "file_name": slugify(content_obj.title) or "content",
+                            "extension": ".pdf",
+                            "base64_string": RawJSONString(
+                                iter_file_base64(
+                                    storage.open(pdf_name, "rb"),
+                                    use_mmap=isinstance(storage, FileSystemStorage),
+                                )
+                            ),
+                        },
+                        "message": "pdf file reterived.",
+                    },
+                    status=status.HTTP_200_OK,
+                )
+                return set_conditional_headers(
+                    response, etag=etag, last_modified=last_modified
+                )
+
+            file_details = {
+                "content_type": "application/pdf",
+                "etag": etag,
+                "last_modified": last_modified,
+                "filename": f"{slugify(content_obj.title) or 'content'}.pdf",
+                "as_attachment": request.query_params.get("download") in ["1", "true"],
+            }
+            sendfile_backend = settings.CONTENT_PDF_SENDFILE_BACKEND
+            if sendfile_backend == "x-accel-redirect":
+                location = f"{settings.CONTENT_PDF_X_ACCEL_LOCATION.rstrip('/')}/{quote(pdf_name)}"
+                return build_sendfile_response(sendfile_backend, location, **file_details)
+            if sendfile_backend == "x-sendfile":
+                return build_sendfile_response(
+                    sendfile_backend, storage.path(pdf_name), **file_details
+                )
+            return build_file_response(
+                request, storage.open(pdf_name, "rb"), size, **file_details
+            )
+
         except Exception as e:
             print(e, traceback.format_exc())
             return Response(
@@ -127,6 +413,13 @@ class ContentItemViewset(viewsets.ViewSet):
         """
         Retrieve details of all content items created by the authenticated user.
 
+        Supports two pagination modes:
+            - page/items: classic numbered pages.
+            - cursor/items: keyset pagination, enabled when the `cursor` query param is
+              present (empty for the first page, then the `next_cursor` of the previous page).
+
+        The content can be filtered to a single category with the `category` query param.
+
         Args:
             request: The HTTP request object.
 
@@ -152,24 +445,82 @@ class ContentItemViewset(viewsets.ViewSet):
 
             page = 1 if page == 0 else page
             items = 10 if 0 < items <= 1 else items
+            if not 1 <= items <= settings.CONTENT_PAGE_MAX_ITEMS:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": f"items must be between 1 and {settings.CONTENT_PAGE_MAX_ITEMS}.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
             offset = (page - 1) * items
             limit = page * items
-            user = UserDetails.objects.get(id=user.id)
-            content_obj = ContentItem.objects.filter(
-                author=user
+            # The author and the category names are part of the page query so serializing
+            # the page doesn't need extra queries, the role comes from the role registry.
+            content_obj = annotate_category_names(
+                ContentItem.objects.filter(author_id=user.id)
+                .defer("pdf_text")
+                .select_related("author")
             )
-            if not content_obj.exists():
-                return Response(
+
+            category = request.query_params.get("category")
+            if category:
+                # Uses the (category_id, content_id) index of the categories table
+                content_obj = content_obj.filter(category_tags__name=category)
+
+            if "cursor" in request.query_params:
+                try:
+                    content_page, paginated_data = cursor_pagination_utility(
+                        total_entries=content_obj,
+                        cursor=request.query_params.get("cursor"),
+                        items=items,
+                    )
+                except ValueError:
+                    return Response(
+                        data={
+                            "status": status.HTTP_400_BAD_REQUEST,
+                            "error": "Invalid cursor",
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                author = content_page[0].author if content_page else get_full_user(user)
+                etag = self._get_content_page_etag(author, content_page, paginated_data)
+                not_modified_response = get_not_modified_response(request, etag=etag)
+                if not_modified_response is not None:
+                    return not_modified_response
+
+                data_to_send = {
+                    "user": UserSerializer(instance=author).data,
+                    "book_content_details": ContentItemReadSerializer(
+                        content_page, category_tags=get_category_tags(content_page)
+                    ).data,
+                }
+                response = Response(
                     data={
                         "status": status.HTTP_200_OK,
-                        "success": [],
-                        "message": "Auther currently have no content.",
+                        "success": data_to_send,
+                        "page_details": paginated_data,
+                        "message": "contents details reterived.",
                     },
                     status=status.HTTP_200_OK,
                 )
+                return set_conditional_headers(response, etag=etag)
 
-            if not content_obj[offset:limit]:
+            # Evaluate the page once, emptiness and page validity are derived from it
+            content_page = list(content_obj[offset:limit])
+
+            if not content_page:
+                if page == 1 or not content_obj.exists():
+                    return Response(
+                        data={
+                            "status": status.HTTP_200_OK,
+                            "success": [],
+                            "message": "Auther currently have no content.",
+                        },
+                        status=status.HTTP_200_OK,
+                    )
                 return Response(
                     data={
                         "status": status.HTTP_400_BAD_REQUEST,
@@ -178,40 +529,142 @@ class ContentItemViewset(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            serializer = ContentItemSerializer(
-                instance=content_obj[offset:limit], many=True
+            # A short page is the last one, so the total is known without counting
+            paginated_data = pagination_utility(
+                total_entries=content_obj,
+                page=page,
+                items=items,
+                total_entries_count=(
+                    offset + len(content_page) if len(content_page) < items else None
+                ),
+                count_strategy=CountStrategy.CACHED,
+                count_cache_key=build_count_cache_key(
+                    CONTENT_COUNT_CACHE_NAMESPACE, user.id, category=category
+                ),
             )
+            author = content_page[0].author
+            etag = self._get_content_page_etag(author, content_page, paginated_data)
+            not_modified_response = get_not_modified_response(request, etag=etag)
+            if not_modified_response is not None:
+                return not_modified_response
 
-            if serializer.data:
-                paginated_data = pagination_utility(
-                    total_entries=content_obj,
-                    page=page,
-                    items=items,
-                )
-                data_to_send = {
-                    "user": UserSerializer(instance=user).data,
-                    "book_content_details": serializer.data,
-                }
+            data_to_send = {
+                "user": UserSerializer(instance=author).data,
+                "book_content_details": ContentItemReadSerializer(
+                    content_page, category_tags=get_category_tags(content_page)
+                ).data,
+            }
+            response = Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": data_to_send,
+                    "page_details": paginated_data,
+                    "message": "contents details reterived.",
+                },
+                status=status.HTTP_200_OK,
+            )
+            return set_conditional_headers(response, etag=etag)
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def search_content_details(self, request):
+        """
+        Full-text search over the title, body, summary and categories of content items.
+
+        Authors search their own content, super admins search all the content. Hits are
+        ranked best match first and carry a highlighted snippet of the matching text.
+
+        Args:
+            request: The HTTP request object with the `q` search terms and the optional
+                `page`/`items` query params.
+
+        Returns:
+            Response: The HTTP response with the matching content items or an error message.
+        """
+        try:
+            user = request.user
+
+            if user.is_anonymous:
                 return Response(
                     data={
-                        "status": status.HTTP_200_OK,
-                        "success": data_to_send,
-                        "page_details": paginated_data,
-                        "message": "contents details reterived.",
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "Token not provided.",
                     },
-                    status=status.HTTP_200_OK,
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
-            else:
-                serializer_errors = serializer.errors
-                error_message = serializer_error(serializer_errors)
+
+            query = request.query_params.get("q", "").strip()
+            if not query:
                 return Response(
                     data={
                         "status": status.HTTP_400_BAD_REQUEST,
-                        "error": error_message,
+                        "error": "Search query is mandatory.",
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
+            try:
+                page = int(request.query_params.get("page", 1))
+                items = int(request.query_params.get("items", 10))
+            except Exception as e:
+                page, items = 1, 10
+
+            page = 1 if page < 1 else page
+            items = 10 if items < 1 else min(items, settings.CONTENT_PAGE_MAX_ITEMS)
+
+            permission = AuthorAndAdminGetUpdateDeletePermissions()
+            # Fetch one extra hit to find out whether a next page exists
+            search_hits = search_content(
+                queryset=permission.filter_queryset(request, ContentItem.objects.all()),
+                query=query,
+                limit=items + 1,
+                offset=(page - 1) * items,
+            )
+            has_next = len(search_hits) > items
+            search_hits = search_hits[:items]
+
+            content_objs = (
+                ContentItem.objects.defer("pdf_text")
+                .prefetch_related("category_tags")
+                .in_bulk([search_hit.content_id for search_hit in search_hits])
+            )
+            # Items deleted since the search are skipped
+            search_hits = [
+                search_hit
+                for search_hit in search_hits
+                if search_hit.content_id in content_objs
+            ]
+            content_page = [content_objs[search_hit.content_id] for search_hit in search_hits]
+            serializer = ContentItemSerializer(instance=content_page, many=True)
+
+            content_details = []
+            for search_hit, content_data in zip(search_hits, serializer.data):
+                content_data["search_rank"] = search_hit.rank
+                content_data["search_highlight"] = search_hit.highlight
+                content_details.append(content_data)
+
+            return Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": content_details,
+                    "page_details": {
+                        "next_page": page + 1 if has_next else None,
+                        "previous_page": page - 1 if page != 1 else 0,
+                        "items": items,
+                    },
+                    "message": "contents details reterived.",
+                },
+                status=status.HTTP_200_OK,
+            )
+
         except Exception as e:
             print(e, traceback.format_exc())
             return Response(
@@ -244,12 +697,32 @@ class ContentItemViewset(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
+            rejected_uploads = get_rejected_uploads(request)
+            if rejected_uploads:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": serializer_error(rejected_uploads),
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
             serializer = ContentItemSerializer(
                 data=request.data, context={"request": request}
             )
 
             if serializer.is_valid():
-                serializer.save()  # Save the instance first
+                try:
+                    serializer.save()  # Save the instance first
+                except exceptions.ValidationError as e:
+                    # Title already used, raised by the unique constraint
+                    return Response(
+                        data={
+                            "status": status.HTTP_400_BAD_REQUEST,
+                            "error": serializer_error(e.detail),
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
                 return Response(
                     data={
                         "status": status.HTTP_201_CREATED,
@@ -279,6 +752,168 @@ class ContentItemViewset(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def bulk_add_content_details(self, request):
+        """
+        Add a batch of content items in a single transaction.
+
+        The batch is sent as `items`, a list of content item objects (a JSON encoded string
+        for multipart requests). The pdf file of the item at index `i` is sent as the
+        `pdf_file_<i>` file of a multipart request.
+
+        Title uniqueness of the whole batch, including duplicates within the batch, is
+        checked with a single query and the items are inserted with `bulk_create`. If any
+        item is invalid nothing is inserted and the errors are reported per item index.
+
+        Args:
+            request: The HTTP request object containing the content items data.
+
+        Returns:
+            Response: The HTTP response with the added content items or the per item errors.
+        """
+        try:
+            user = request.user
+
+            if user.is_anonymous:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "Token not provided.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            rejected_uploads = get_rejected_uploads(request)
+            if rejected_uploads:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": serializer_error(rejected_uploads),
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            items = request.data.get("items")
+            if isinstance(items, str):
+                try:
+                    items = json.loads(items)
+                except ValueError:
+                    items = None
+
+            if not isinstance(items, list) or not items:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "items must be a non empty list of content details.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if len(items) > settings.CONTENT_BULK_MAX_ITEMS:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": f"A batch can't have more than {settings.CONTENT_BULK_MAX_ITEMS} items.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if not all(isinstance(item, dict) for item in items):
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "Every item must be an object of content details.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            titles = [item.get("title") for item in items]
+            title_counts = Counter(title for title in titles if isinstance(title, str))
+            existing_titles = get_existing_titles(title_counts)
+
+            content_items, pdf_files, item_errors = [], [], []
+            for index, item in enumerate(items):
+                item = dict(item)
+                pdf_file = request.FILES.get(f"pdf_file_{index}")
+                if pdf_file is not None:
+                    item["pdf_file"] = pdf_file
+
+                serializer = ContentItemSerializer(
+                    data=item,
+                    context={"request": request, "existing_titles": existing_titles},
+                )
+                errors = []
+                if not serializer.is_valid():
+                    errors = serializer_error(serializer.errors)
+                if isinstance(titles[index], str) and title_counts[titles[index]] > 1:
+                    errors.append("Title is repeated within the batch.")
+
+                if errors:
+                    item_errors.append({"index": index, "error": errors})
+                elif not item_errors:
+                    content_item = ContentItem(author=user, **serializer.validated_data)
+                    # bulk_create doesn't send pre_save
+                    reset_pdf_processing(content_item)
+                    update_summary_status(content_item, serializer.validated_data)
+                    content_items.append(content_item)
+                    pdf_files.append(serializer.validated_data.get("pdf_file"))
+
+            if item_errors:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": item_errors,
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            try:
+                with transaction.atomic():
+                    ContentItem.objects.bulk_create(
+                        content_items, batch_size=settings.CONTENT_BULK_BATCH_SIZE
+                    )
+                    set_content_categories(content_items)
+                    # bulk_create doesn't send post_save
+                    add_pdf_blob_references(
+                        [content_item.pdf_file.name for content_item in content_items]
+                    )
+                    delete_used_upload_sessions(pdf_files)
+                    schedule_pdf_processing(content_items)
+                    schedule_content_summaries(content_items)
+            except IntegrityError as e:
+                if not is_title_integrity_error(e):
+                    raise
+                # A title of the batch was taken by a concurrent request
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": [TITLE_EXISTS_MESSAGE],
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # bulk_create doesn't send post_save
+            invalidate_count_cache(CONTENT_COUNT_CACHE_NAMESPACE, user.id)
+
+            prefetch_related_objects(content_items, "category_tags")
+            serializer = ContentItemSerializer(instance=content_items, many=True)
+            return Response(
+                data={
+                    "status": status.HTTP_201_CREATED,
+                    "success": serializer.data,
+                    "message": f"{len(content_items)} content details added.",
+                },
+                status=status.HTTP_201_CREATED,
+            )
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     def update_content_details(self, request,content_id):
         """
         Update the details of a specific content item.
@@ -335,6 +970,16 @@ class ContentItemViewset(viewsets.ViewSet):
                     status=status.HTTP_403_FORBIDDEN,
                 )
 
+            rejected_uploads = get_rejected_uploads(request)
+            if rejected_uploads:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": serializer_error(rejected_uploads),
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
             serializer = ContentItemSerializer(
                 data=request.data,
                 instance=content_obj,
@@ -343,7 +988,17 @@ class ContentItemViewset(viewsets.ViewSet):
             )
 
             if serializer.is_valid():
-                serializer.save()  # Save the instance
+                try:
+                    serializer.save()  # Save the instance
+                except exceptions.ValidationError as e:
+                    # Title already used, raised by the unique constraint
+                    return Response(
+                        data={
+                            "status": status.HTTP_400_BAD_REQUEST,
+                            "error": serializer_error(e.detail),
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
                 return Response(
                     data={
                         "status": status.HTTP_200_OK,
@@ -451,3 +1106,353 @@ class ContentItemViewset(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def bulk_update_content_details(self, request):
+        """
+        Update a batch of content items.
+
+        The batch is sent as `items`, a list of objects with the `id` of the content item and
+        the fields to update (title, body, summary, categories). Pdf files are updated
+        through `update_content_details`.
+
+        The items are fetched in one query restricted in SQL to the content the user has
+        permission on, titles are checked with one query and the changes are written with
+        `bulk_update`. If any item is invalid nothing is updated and the errors are reported
+        per item index.
+
+        Args:
+            request: The HTTP request object containing the content items data.
+
+        Returns:
+            Response: The HTTP response with the updated content items or the per item errors.
+        """
+        try:
+            user = request.user
+
+            if isinstance(user, AnonymousUser):
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "Token not provided.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            items = request.data.get("items")
+            if (
+                not isinstance(items, list)
+                or not items
+                or not all(
+                    isinstance(item, dict) and is_json_id(item.get("id"))
+                    for item in items
+                )
+            ):
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "items must be a non empty list of content details with their id.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if len(items) > settings.CONTENT_BULK_MAX_ITEMS:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": f"A batch can't have more than {settings.CONTENT_BULK_MAX_ITEMS} items.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            content_ids = [item["id"] for item in items]
+            if len(set(content_ids)) != len(content_ids):
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "A content ID can only appear once in a batch.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            permission = AuthorAndAdminGetUpdateDeletePermissions()
+            content_objs = permission.filter_queryset(
+                request, ContentItem.objects.filter(id__in=content_ids)
+            ).in_bulk()
+
+            # Titles held by the items of the batch are checked against the final titles
+            # of the batch, so items can swap titles where the title constraint can be
+            # deferred. Elsewhere it's checked row by row, an item can't take a title held
+            # by another item of the batch even if that one changes its title.
+            final_titles = [
+                item.get("title", content_objs[item["id"]].title)
+                if item["id"] in content_objs
+                else item.get("title")
+                for item in items
+            ]
+            title_counts = Counter(title for title in final_titles if isinstance(title, str))
+            existing_titles = get_existing_titles(title_counts)
+            if connection.vendor == "postgresql":
+                existing_titles -= {content_obj.title for content_obj in content_objs.values()}
+
+            updated_fields, item_errors = set(), []
+            for index, item in enumerate(items):
+                content_obj = content_objs.get(item["id"])
+                if content_obj is None:
+                    item_errors.append(
+                        {
+                            "index": index,
+                            "error": [
+                                "No content with given content id or you do not have permission to update it."
+                            ],
+                        }
+                    )
+                    continue
+
+                item_data = {
+                    field: value
+                    for field, value in item.items()
+                    if field in BULK_UPDATE_FIELDS
+                }
+                serializer = ContentItemSerializer(
+                    data=item_data,
+                    instance=content_obj,
+                    partial=True,
+                    context={"request": request, "existing_titles": existing_titles},
+                )
+                errors = []
+                if not serializer.is_valid():
+                    errors = serializer_error(serializer.errors)
+                if (
+                    isinstance(final_titles[index], str)
+                    and title_counts[final_titles[index]] > 1
+                ):
+                    errors.append("Title is repeated within the batch.")
+
+                if errors:
+                    item_errors.append({"index": index, "error": errors})
+                    continue
+
+                changed_fields = [
+                    field
+                    for field, value in serializer.validated_data.items()
+                    if getattr(content_obj, field) != value
+                ]
+                for field, value in serializer.validated_data.items():
+                    setattr(content_obj, field, value)
+                updated_fields.update(serializer.validated_data)
+                if update_summary_status(content_obj, changed_fields):
+                    updated_fields.add("summary_status")
+
+            if item_errors:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": item_errors,
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            content_objs = list(content_objs.values())
+            if updated_fields:
+                # bulk_update doesn't apply auto_now nor send post_save
+                updated_at = timezone.now()
+                for content_obj in content_objs:
+                    content_obj.updated_at = updated_at
+                try:
+                    with transaction.atomic():
+                        with deferred_title_constraint():
+                            ContentItem.objects.bulk_update(
+                                content_objs,
+                                fields=sorted(updated_fields) + ["updated_at"],
+                                batch_size=settings.CONTENT_BULK_BATCH_SIZE,
+                            )
+                        if "categories" in updated_fields:
+                            set_content_categories(content_objs)
+                        schedule_content_summaries(content_objs)
+                except IntegrityError as e:
+                    if not is_title_integrity_error(e):
+                        raise
+                    # A title of the batch was taken by a concurrent request
+                    return Response(
+                        data={
+                            "status": status.HTTP_400_BAD_REQUEST,
+                            "error": [TITLE_EXISTS_MESSAGE],
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                for content_obj in content_objs:
+                    content_item_cache.invalidate(content_obj.id)
+
+            prefetch_related_objects(content_objs, "category_tags")
+            serializer = ContentItemSerializer(instance=content_objs, many=True)
+            return Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": serializer.data,
+                    "message": f"{len(content_objs)} content details updated.",
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def bulk_delete_content_details(self, request):
+        """
+        Delete a batch of content items.
+
+        The batch is selected either by `ids`, a list of content IDs, or by `filter`, an
+        object with any of:
+            - author_id: content of an author.
+            - category: content of a category.
+            - created_before / created_after: creation date, formatted as dd/mm/YYYY.
+
+        The selection is restricted in SQL to the content the user has permission on and is
+        deleted with a single queryset `delete()`.
+
+        Args:
+            request: The HTTP request object containing the ids or the filter.
+
+        Returns:
+            Response: The HTTP response with the number of deleted content items.
+        """
+        try:
+            user = request.user
+
+            if isinstance(user, AnonymousUser):
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "Token not provided.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            content_ids = request.data.get("ids")
+            content_filter = request.data.get("filter")
+
+            permission = AuthorAndAdminGetUpdateDeletePermissions()
+            content_obj = permission.filter_queryset(request, ContentItem.objects.all())
+
+            if content_ids is not None:
+                if (
+                    not isinstance(content_ids, list)
+                    or not content_ids
+                    or not all(is_json_id(content_id) for content_id in content_ids)
+                ):
+                    return Response(
+                        data={
+                            "status": status.HTTP_400_BAD_REQUEST,
+                            "error": "ids must be a non empty list of content IDs.",
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                content_obj = content_obj.filter(id__in=content_ids)
+
+            elif isinstance(content_filter, dict) and content_filter:
+                unknown_filters = set(content_filter) - set(BULK_DELETE_FILTERS)
+                if unknown_filters:
+                    return Response(
+                        data={
+                            "status": status.HTTP_400_BAD_REQUEST,
+                            "error": f"Unsupported filter: {', '.join(sorted(unknown_filters))}.",
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                for filter_name, value in content_filter.items():
+                    lookup = BULK_DELETE_FILTERS[filter_name]
+                    if filter_name == "author_id" and not is_json_id(value):
+                        return Response(
+                            data={
+                                "status": status.HTTP_400_BAD_REQUEST,
+                                "error": "author_id must be a user ID.",
+                            },
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
+                    if filter_name == "category" and not isinstance(value, str):
+                        return Response(
+                            data={
+                                "status": status.HTTP_400_BAD_REQUEST,
+                                "error": "category must be a category name.",
+                            },
+                            status=status.HTTP_400_BAD_REQUEST,
+                        )
+                    if filter_name in ["created_before", "created_after"]:
+                        value = convert_string_to_datetime_object(str(value))
+                        if value is None:
+                            return Response(
+                                data={
+                                    "status": status.HTTP_400_BAD_REQUEST,
+                                    "error": f"{filter_name} must be formatted as dd/mm/YYYY.",
+                                },
+                                status=status.HTTP_400_BAD_REQUEST,
+                            )
+                    content_obj = content_obj.filter(**{lookup: value})
+
+            else:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "ids or filter is mandatory.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            with transaction.atomic():
+                deleted_count = content_obj.delete()[1].get(ContentItem._meta.label, 0)
+
+            return Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": {"deleted_count": deleted_count},
+                    "message": "content deleted successfully.",
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def get_content_cache_stats(self, request):
+        """
+        Retrieve the hit/miss counters of the content item cache of this process.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            Response: The HTTP response with the cache counters or an error message.
+        """
+        try:
+            return Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": content_item_cache.stats(),
+                    "message": "content cache stats reterived.",
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
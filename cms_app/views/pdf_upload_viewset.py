@@ -0,0 +1,297 @@
+import re
+import traceback
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from users_info.authentication import CachedJWTAuthentication
+from cms_app.models import PdfUploadSession
+from cms_app.permission import BaseAdminPermission
+from cms_app.pdf_uploads import (
+    complete_upload_session,
+    get_partial_upload_storage,
+    get_upload_session_part_name,
+    write_upload_session_chunk,
+)
+from cms_app.serializers.pdf_upload_serializer import PdfUploadSessionSerializer
+from common_utility.utils.serializers_errors import serializer_error
+
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+class PdfUploadViewset(viewsets.ViewSet):
+    """
+    ViewSet for resumable pdf uploads: a session is started with the size of the file, its
+    chunks are sent in order with a Content-Range header and the complete upload is
+    attached to a content item with its `pdf_upload_id`.
+    """
+
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated, BaseAdminPermission]
+
+    def _get_upload_session(self, request, upload_id):
+        """
+        Return the unexpired upload session of the requesting user, None if there is none.
+        """
+        expired_before = timezone.now() - timedelta(
+            seconds=settings.CONTENT_PDF_UPLOAD_SESSION_TIMEOUT
+        )
+        return PdfUploadSession.objects.filter(
+            id=upload_id, owner=request.user, updated_at__gte=expired_before
+        ).first()
+
+    def start_pdf_upload(self, request):
+        """
+        Start a resumable pdf upload.
+
+        Args:
+            request: The HTTP request object containing the file name, total size and
+                optionally the sha256 of the pdf file.
+
+        Returns:
+            Response: The HTTP response with the upload session details or an error message.
+        """
+        try:
+            serializer = PdfUploadSessionSerializer(
+                data=request.data, context={"request": request}
+            )
+            if not serializer.is_valid():
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": serializer_error(serializer.errors),
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            serializer.save()
+            return Response(
+                data={
+                    "status": status.HTTP_201_CREATED,
+                    "success": serializer.data,
+                    "message": "pdf upload started.",
+                },
+                status=status.HTTP_201_CREATED,
+            )
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def get_pdf_upload(self, request, upload_id):
+        """
+        Get the details of a pdf upload, its `received_size` being the offset to resume from.
+
+        Args:
+            request: The HTTP request object.
+            upload_id: The ID of the upload session.
+
+        Returns:
+            Response: The HTTP response with the upload session details or an error message.
+        """
+        try:
+            upload_session = self._get_upload_session(request, upload_id)
+            if upload_session is None:
+                return Response(
+                    data={
+                        "status": status.HTTP_404_NOT_FOUND,
+                        "error": "No pdf upload with given upload id.",
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            serializer = PdfUploadSessionSerializer(instance=upload_session)
+            return Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": serializer.data,
+                    "message": "pdf upload details reterived.",
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def upload_pdf_chunk(self, request, upload_id):
+        """
+        Upload the next chunk of a pdf file.
+
+        The chunk is the raw request body, located by a `Content-Range: bytes
+        <start>-<end>/<total size>` header. It has to start at the `received_size` of the
+        upload and be at most `CONTENT_PDF_UPLOAD_CHUNK_SIZE` bytes. Once the last chunk is
+        received the file is checked against the sha256 given when starting the upload.
+
+        Args:
+            request: The HTTP request object containing the chunk.
+            upload_id: The ID of the upload session.
+
+        Returns:
+            Response: The HTTP response with the upload session details or an error message,
+                409 with the expected offset if the chunk doesn't start there.
+        """
+        try:
+            upload_session = self._get_upload_session(request, upload_id)
+            if upload_session is None:
+                return Response(
+                    data={
+                        "status": status.HTTP_404_NOT_FOUND,
+                        "error": "No pdf upload with given upload id.",
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            content_range = CONTENT_RANGE_PATTERN.match(
+                request.headers.get("Content-Range", "")
+            )
+            if content_range is None:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": "Content-Range header must be bytes <start>-<end>/<total size>.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            start, end, total_size = map(int, content_range.groups())
+            length = end - start + 1
+
+            if (
+                total_size != upload_session.total_size
+                or end >= total_size
+                or length < 1
+                or length > settings.CONTENT_PDF_UPLOAD_CHUNK_SIZE
+            ):
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": f"Invalid Content-Range, chunks are at most {settings.CONTENT_PDF_UPLOAD_CHUNK_SIZE} bytes of a {upload_session.total_size} bytes file.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if start != upload_session.received_size:
+                return Response(
+                    data={
+                        "status": status.HTTP_409_CONFLICT,
+                        "error": f"Chunk must start at byte {upload_session.received_size}.",
+                        "received_size": upload_session.received_size,
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+            try:
+                write_upload_session_chunk(upload_session, request._request, start, length)
+            except ValueError as e:
+                return Response(
+                    data={
+                        "status": status.HTTP_400_BAD_REQUEST,
+                        "error": str(e),
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # Only one of concurrent requests sending the same chunk moves the offset
+            updated = PdfUploadSession.objects.filter(
+                id=upload_session.id, received_size=start
+            ).update(received_size=start + length, updated_at=timezone.now())
+            if not updated:
+                upload_session.refresh_from_db()
+                return Response(
+                    data={
+                        "status": status.HTTP_409_CONFLICT,
+                        "error": "Chunk was already received.",
+                        "received_size": upload_session.received_size,
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+            upload_session.received_size = start + length
+
+            if upload_session.is_complete:
+                try:
+                    complete_upload_session(upload_session)
+                except ValueError as e:
+                    return Response(
+                        data={
+                            "status": status.HTTP_400_BAD_REQUEST,
+                            "error": str(e),
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+            serializer = PdfUploadSessionSerializer(instance=upload_session)
+            return Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": serializer.data,
+                    "message": "pdf chunk uploaded.",
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def delete_pdf_upload(self, request, upload_id):
+        """
+        Abort a pdf upload and delete its partial file.
+
+        Args:
+            request: The HTTP request object.
+            upload_id: The ID of the upload session.
+
+        Returns:
+            Response: The HTTP response indicating the success or failure of the deletion.
+        """
+        try:
+            upload_session = self._get_upload_session(request, upload_id)
+            if upload_session is None:
+                return Response(
+                    data={
+                        "status": status.HTTP_404_NOT_FOUND,
+                        "error": "No pdf upload with given upload id.",
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            get_partial_upload_storage().delete(get_upload_session_part_name(upload_session))
+            upload_session.delete()
+            return Response(
+                data={
+                    "status": status.HTTP_200_OK,
+                    "success": [],
+                    "message": "pdf upload deleted successfully.",
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
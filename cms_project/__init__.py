@@ -0,0 +1,4 @@
+# Loaded with Django so shared tasks use this app
+from cms_project.celery import app as celery_app
+
+__all__ = ("celery_app",)
@@ -0,0 +1,9 @@
+import os
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cms_project.settings")
+
+app = Celery("cms_project")
+# Configured by the CELERY_* settings
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
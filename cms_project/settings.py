@@ -118,6 +118,124 @@ DATABASES = (
         }
     }
 )
+# SQLite keeps the deferrable title constraint as a plain unique index, see cms_app.constraints
+SILENCED_SYSTEM_CHECKS = ["models.W038"]
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+
+# Read-through cache of serialized content items. Uses an in-process LRU cache unless a
+# Django cache alias is given (e.g. "default" when REDIS_URL is set).
+CONTENT_CACHE_ALIAS = os.getenv("CONTENT_CACHE_ALIAS") or None
+CONTENT_CACHE_MAX_ENTRIES = int(os.getenv("CONTENT_CACHE_MAX_ENTRIES") or 1024)
+CONTENT_CACHE_TIMEOUT = int(os.getenv("CONTENT_CACHE_TIMEOUT") or 3600)
+
+# Cached snapshots of the authenticated users (users_info.authentication). Saves and
+# deletes invalidate the snapshots of the process, the other processes of a local cache
+# see them after AUTH_USER_CACHE_TIMEOUT seconds.
+AUTH_USER_CACHE_ALIAS = os.getenv("AUTH_USER_CACHE_ALIAS") or None
+AUTH_USER_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_USER_CACHE_MAX_ENTRIES") or 4096)
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_CACHE_TIMEOUT") or 60)
+
+# Seconds the role registry (permission_app.roles) is kept before being reloaded, to pick
+# up the role changes made by other processes
+ROLE_REGISTRY_TIMEOUT = int(os.getenv("ROLE_REGISTRY_TIMEOUT") or 300)
+
+# Bloom filter of the blacklisted refresh tokens checked on refresh (users_info.blacklist),
+# sized for TOKEN_BLACKLIST_FILTER_CAPACITY unexpired blacklisted tokens. Local to the
+# process unless a Redis URL is given, a local filter sees the tokens blacklisted by the
+# other processes once rebuilt, every TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL seconds.
+# The blacklisted tokens are cached in an in-process LRU cache unless a Django cache
+# alias is given.
+TOKEN_BLACKLIST_FILTER_REDIS_URL = os.getenv("TOKEN_BLACKLIST_FILTER_REDIS_URL") or None
+TOKEN_BLACKLIST_FILTER_CAPACITY = int(os.getenv("TOKEN_BLACKLIST_FILTER_CAPACITY") or 100000)
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = float(
+    os.getenv("TOKEN_BLACKLIST_FILTER_ERROR_RATE") or 0.001
+)
+TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL = int(
+    os.getenv("TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL") or 60
+)
+TOKEN_BLACKLIST_CACHE_ALIAS = os.getenv("TOKEN_BLACKLIST_CACHE_ALIAS") or None
+TOKEN_BLACKLIST_CACHE_MAX_ENTRIES = int(
+    os.getenv("TOKEN_BLACKLIST_CACHE_MAX_ENTRIES") or 4096
+)
+TOKEN_BLACKLIST_CACHE_TIMEOUT = int(os.getenv("TOKEN_BLACKLIST_CACHE_TIMEOUT") or 300)
+
+# Largest page of the content listing endpoints
+CONTENT_PAGE_MAX_ITEMS = int(os.getenv("CONTENT_PAGE_MAX_ITEMS") or 100)
+
+# Limits of the bulk content endpoints
+CONTENT_BULK_MAX_ITEMS = int(os.getenv("CONTENT_BULK_MAX_ITEMS") or 1000)
+CONTENT_BULK_BATCH_SIZE = int(os.getenv("CONTENT_BULK_BATCH_SIZE") or 500)
+
+# Pdf uploads (bytes / seconds). Files over the resumable threshold have to be sent in
+# chunks of at most CONTENT_PDF_UPLOAD_CHUNK_SIZE through an upload session.
+CONTENT_PDF_MAX_UPLOAD_SIZE = int(os.getenv("CONTENT_PDF_MAX_UPLOAD_SIZE") or 100 * 1024 * 1024)
+CONTENT_PDF_RESUMABLE_THRESHOLD = int(os.getenv("CONTENT_PDF_RESUMABLE_THRESHOLD") or 10 * 1024 * 1024)
+CONTENT_PDF_UPLOAD_CHUNK_SIZE = int(os.getenv("CONTENT_PDF_UPLOAD_CHUNK_SIZE") or 5 * 1024 * 1024)
+CONTENT_PDF_UPLOAD_SESSION_TIMEOUT = int(os.getenv("CONTENT_PDF_UPLOAD_SESSION_TIMEOUT") or 24 * 3600)
+
+# Pdf downloads are sent by the web server when set: "x-accel-redirect" (nginx, with an
+# internal location aliasing MEDIA_ROOT) or "x-sendfile" (Apache mod_xsendfile).
+CONTENT_PDF_SENDFILE_BACKEND = os.getenv("CONTENT_PDF_SENDFILE_BACKEND") or None
+CONTENT_PDF_X_ACCEL_LOCATION = os.getenv("CONTENT_PDF_X_ACCEL_LOCATION") or "/protected-media/"
+
+# MinIO/S3 storage of the pdf files, MEDIA_ROOT is used when MINIO_ENDPOINT (host:port) is
+# empty. Clients download pdf files with presigned URLs of MINIO_PUBLIC_ENDPOINT, or of
+# MINIO_ENDPOINT when the endpoint is reachable by them.
+MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT") or None
+MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY")
+MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY")
+MINIO_SECURE = os.environ.get("MINIO_SECURE", "True").lower() == "true"
+MINIO_REGION = os.getenv("MINIO_REGION") or "us-east-1"
+MINIO_BUCKET_NAME = os.getenv("MINIO_BUCKET_NAME") or "content-management"
+MINIO_PUBLIC_ENDPOINT = os.getenv("MINIO_PUBLIC_ENDPOINT") or None
+MINIO_PUBLIC_SECURE = os.environ.get("MINIO_PUBLIC_SECURE", "True").lower() == "true"
+MINIO_POOL_SIZE = int(os.getenv("MINIO_POOL_SIZE") or 10)
+# Files larger than a part (at least 5 MiB) are sent as multipart uploads
+MINIO_MULTIPART_PART_SIZE = int(os.getenv("MINIO_MULTIPART_PART_SIZE") or 16 * 1024 * 1024)
+MINIO_PRESIGNED_URL_EXPIRES = int(os.getenv("MINIO_PRESIGNED_URL_EXPIRES") or 3600)
+
+# Background pdf processing (text, page count, thumbnail), see cms_app.tasks
+CONTENT_PDF_THUMBNAIL_WIDTH = int(os.getenv("CONTENT_PDF_THUMBNAIL_WIDTH") or 320)
+# Characters of pdf text indexed by the search
+CONTENT_PDF_MAX_TEXT_LENGTH = int(os.getenv("CONTENT_PDF_MAX_TEXT_LENGTH") or 1000000)
+CONTENT_PDF_PROCESSING_MAX_RETRIES = int(os.getenv("CONTENT_PDF_PROCESSING_MAX_RETRIES") or 3)
+# Seconds after which a pdf still being processed is considered lost and processed again
+CONTENT_PDF_PROCESSING_TIMEOUT = int(os.getenv("CONTENT_PDF_PROCESSING_TIMEOUT") or 3600)
+
+# Summaries generated for the content items posted without one, see cms_app.summaries
+CONTENT_AUTO_SUMMARY = os.environ.get("CONTENT_AUTO_SUMMARY", "False").lower() == "true"
+# Summarizer class, e.g. common_utility.utils.summarizer_utility.OpenAISummarizer
+CONTENT_SUMMARIZER_BACKEND = (
+    os.getenv("CONTENT_SUMMARIZER_BACKEND")
+    or "common_utility.utils.summarizer_utility.ExtractiveSummarizer"
+)
+# Content items summarized per summarizer call
+CONTENT_SUMMARY_BATCH_SIZE = int(os.getenv("CONTENT_SUMMARY_BATCH_SIZE") or 20)
+CONTENT_SUMMARY_MAX_SENTENCES = int(os.getenv("CONTENT_SUMMARY_MAX_SENTENCES") or 2)
+CONTENT_SUMMARY_MAX_RETRIES = int(os.getenv("CONTENT_SUMMARY_MAX_RETRIES") or 3)
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_SUMMARY_MODEL = os.getenv("OPENAI_SUMMARY_MODEL") or "gpt-3.5-turbo"
+OPENAI_TIMEOUT = int(os.getenv("OPENAI_TIMEOUT") or 60)
+
+# Celery. CELERY_TASK_ALWAYS_EAGER runs the tasks in-process, for development without a
+# broker; it is never implied by a missing broker URL, which would run them in the request
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL") or REDIS_URL
+CELERY_TASK_ALWAYS_EAGER = os.environ.get("CELERY_TASK_ALWAYS_EAGER", "False").lower() == "true"
+CELERY_TASK_IGNORE_RESULT = True
+# Long tasks are acknowledged once done, a task of a lost worker runs again
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 
 # Password validation
@@ -169,16 +287,34 @@ STATIC_ROOT = os.path.join(Path("__file__").resolve().parent, "static/")
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # RestFrameWork Configuration
 REST_FRAMEWORK = {
+    # orjson based, falling back to the stdlib json module when orjson isn't installed
+    "DEFAULT_RENDERER_CLASSES": (
+        "common_utility.utils.json_utility.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_PARSER_CLASSES": (
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
-        "rest_framework.parsers.JSONParser",
+        "common_utility.utils.json_utility.ORJSONParser",
     ),
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users_info.authentication.CachedJWTAuthentication",
     ],
 }
 
+# Seconds a cached listing total stays valid (CountStrategy.CACHED, only cached when the
+# default cache is shared by the workers, e.g. REDIS_URL is set)
+PAGINATION_COUNT_CACHE_TIMEOUT = int(os.getenv("PAGINATION_COUNT_CACHE_TIMEOUT") or 300)
+
+# JWT signing algorithm: HS256 signs with SECRET_KEY (SIMPLE_JWT), RS256/RS384/RS512 or
+# EdDSA sign with the active `<kid>.pem` private key of JWT_KEYS_DIR, the newest kid
+# unless JWT_ACTIVE_KID is set, and publish the public keys on the JWKS endpoint so
+# other services verify the tokens locally (users_info.jwt_keys).
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM") or "HS256"
+JWT_KEYS_DIR = os.getenv("JWT_KEYS_DIR") or os.path.join(BASE_DIR, "jwt_keys")
+JWT_ACTIVE_KID = os.getenv("JWT_ACTIVE_KID") or None
+# Seconds the clients may cache the JWKS document
+JWKS_CACHE_TIMEOUT = int(os.getenv("JWKS_CACHE_TIMEOUT") or 300)
 
 # JWT Configuration
 SIMPLE_JWT = {
@@ -186,6 +322,9 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_REFRESH_SERIALIZER": (
+        "users_info.serializers.token_refresh_serializer.TokenRefreshSerializer"
+    ),
     "UPDATE_LAST_LOGIN": False,
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
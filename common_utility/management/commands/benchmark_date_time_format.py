@@ -0,0 +1,90 @@
+import timeit
+from datetime import datetime, timedelta, timezone as dt_timezone
+import pytz
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from common_utility.utils.date_time_util import (
+    _format_timestamp,
+    get_date_time_dict_in_ist,
+    get_date_time_dicts_in_ist,
+)
+
+
+def strftime_date_time_dict(datetime_utc_object, default_timezone):
+    """
+    The formatting `get_date_time_dict_in_ist` used to do for every call: the timezone
+    looked up by pytz and three strftime calls.
+    """
+    ist_datetime_object = datetime_utc_object.astimezone(pytz.timezone(default_timezone))
+    return {
+        "date": ist_datetime_object.strftime("%d/%m/%Y"),
+        "time": ist_datetime_object.strftime("%I:%M:%S")
+        + " "
+        + ist_datetime_object.strftime("%p"),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the date/time formatting of serialized listings with the cached and "
+        "batch formatters against per call strftime formatting."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items", type=int, default=100, help="Items of a listing page."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=200, help="Pages formatted per measure."
+        )
+        parser.add_argument(
+            "--timezone", default=settings.TIME_ZONE, help="Timezone formatted to."
+        )
+
+    def handle(self, *args, **options):
+        zone_name = options["timezone"]
+        start = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+        # created_at and updated_at of every item of a page
+        datetimes = [
+            start + timedelta(seconds=index * 37, microseconds=index)
+            for index in range(options["items"] * 2)
+        ]
+
+        expected = [strftime_date_time_dict(value, zone_name) for value in datetimes]
+        actual = get_date_time_dicts_in_ist(
+            datetimes, noon_format=True, default_timezone=zone_name
+        )
+        if actual != expected:
+            self.stderr.write(self.style.ERROR("The formatters disagree."))
+            return
+
+        measures = {
+            "strftime per call": lambda: [
+                strftime_date_time_dict(value, zone_name) for value in datetimes
+            ],
+            "cached per call (cold)": lambda: (
+                _format_timestamp.cache_clear(),
+                [
+                    get_date_time_dict_in_ist(
+                        value, noon_format=True, default_timezone=zone_name
+                    )
+                    for value in datetimes
+                ],
+            ),
+            "cached per call (warm)": lambda: [
+                get_date_time_dict_in_ist(value, noon_format=True, default_timezone=zone_name)
+                for value in datetimes
+            ],
+            "batch (warm)": lambda: get_date_time_dicts_in_ist(
+                datetimes, noon_format=True, default_timezone=zone_name
+            ),
+        }
+
+        baseline = None
+        for name, measure in measures.items():
+            seconds = min(timeit.repeat(measure, number=options["repeat"], repeat=3))
+            per_page = seconds / options["repeat"] * 1e6
+            baseline = baseline or per_page
+            self.stdout.write(
+                f"{name:<24} {per_page:10.1f} us/page  {baseline / per_page:5.1f}x"
+            )
@@ -0,0 +1,84 @@
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from common_utility.utils.date_time_util import get_date_time_dicts_in_ist
+from common_utility.utils.json_utility import ORJSONRenderer, orjson
+
+
+def build_listing_page(items: int) -> dict:
+    """
+    Response data shaped like a content listing page: nested dicts with date/time dicts,
+    file URLs, lists of names, and a UUID, Decimal and datetime per item.
+    """
+    start = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+    date_time_dicts = get_date_time_dicts_in_ist(
+        [start + timedelta(minutes=index) for index in range(items * 2)], noon_format=True
+    )
+    results = [
+        {
+            "id": index,
+            "uuid": uuid.UUID(int=index),
+            "title": f"Content item {index}",
+            "body": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20,
+            "summary": "Lorem ipsum dolor sit amet – ünïcödé summary.",
+            "pdf_file": f"http://testserver/media/content_management_pdf/{index:064x}.pdf",
+            "categories": [1, 2, 3],
+            "category_tags": ["django", "python", "performance"],
+            "pdf_page_count": index % 40,
+            "score": Decimal("12.50") + index,
+            "indexed_at": start + timedelta(seconds=index, microseconds=123456),
+            "created_at": date_time_dicts[index * 2],
+            "updated_at": date_time_dicts[index * 2 + 1],
+        }
+        for index in range(items)
+    ]
+    return {
+        "status": True,
+        "success": {"count": items, "next": None, "previous": None, "results": results},
+        "message": "Content items fetched successfully",
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the render time and output size of a listing page with the orjson "
+        "renderer against DRF's JSONRenderer."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items", type=int, default=100, help="Items of a listing page."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=100, help="Pages rendered per measure."
+        )
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stderr.write(
+                self.style.WARNING("orjson isn't installed, both renderers use json.")
+            )
+        data = build_listing_page(options["items"])
+        renderers = {
+            "JSONRenderer": JSONRenderer(),
+            "ORJSONRenderer": ORJSONRenderer(),
+        }
+        outputs = {name: renderer.render(data) for name, renderer in renderers.items()}
+        if len(set(outputs.values())) != 1:
+            self.stderr.write(self.style.ERROR("The renderers disagree."))
+            return
+
+        baseline = None
+        for name, renderer in renderers.items():
+            seconds = min(
+                timeit.repeat(lambda: renderer.render(data), number=options["repeat"], repeat=3)
+            )
+            per_page = seconds / options["repeat"] * 1e6
+            baseline = baseline or per_page
+            self.stdout.write(
+                f"{name:<16} {per_page:10.1f} us/page  {baseline / per_page:5.1f}x  "
+                f"{len(outputs[name]):>8} bytes"
+            )
@@ -1,3 +1,234 @@
-from django.test import TestCase
+import base64
+import io
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from common_utility.utils.file_to_base64 import iter_file_base64
+from common_utility.utils.date_time_util import (
+    get_date_time_dict_in_ist,
+    get_date_time_dicts_in_ist,
+)
+from common_utility.management.commands.benchmark_date_time_format import (
+    strftime_date_time_dict,
+)
+from common_utility.utils.streaming_json_utility import RawJSONString, iter_json
+from common_utility.utils.json_utility import ORJSONParser, ORJSONRenderer
+from common_utility.utils.bloom_filter_utility import BloomFilter
+from common_utility.utils.pagination_utility import (
+    build_count_cache_key,
+    decode_cursor,
+    encode_cursor,
+    get_total_entries_count,
+    invalidate_count_cache,
+)
+from common_utility.utils.constants import CountStrategy
+from common_utility.management.commands.benchmark_json_renderer import build_listing_page
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
 
-# Create your tests here.
+
+class IterFileBase64Test(SimpleTestCase):
+    """
+    Tests for the streaming Base64 encoder.
+    """
+
+    def encode(self, content, **kwargs):
+        with tempfile.NamedTemporaryFile() as file:
+            file.write(content)
+            file.flush()
+            return b"".join(iter_file_base64(file.name, **kwargs))
+
+    def test_chunks_join_to_the_file_encoding(self):
+        for size in [0, 1, 2, 3, 4, 100, 1001]:
+            content = (bytes(range(256)) * 4)[:size]
+            for kwargs in [
+                {"chunk_size": 7},
+                {"chunk_size": 9},
+                {"chunk_size": 9, "use_mmap": True},
+            ]:
+                with self.subTest(size=size, **kwargs):
+                    self.assertEqual(self.encode(content, **kwargs), base64.b64encode(content))
+
+    def test_streamed_json(self):
+        data = {"success": {"base64_string": RawJSONString(iter([b"QUJD", b"REVG"])), "size": 6}}
+
+        self.assertEqual(
+            b"".join(iter_json(data)),
+            b'{"success": {"base64_string": "QUJDREVG", "size": 6}}',
+        )
+
+
+class DateTimeFormatTest(SimpleTestCase):
+    """
+    Tests for the cached date/time formatting of the serializers.
+    """
+
+    datetimes = [
+        datetime(2024, 1, 1, 0, 0, 0, tzinfo=dt_timezone.utc)
+        + timedelta(hours=hours, minutes=29, seconds=59, microseconds=999999)
+        for hours in range(0, 48, 5)
+    ]
+
+    def test_matches_strftime_formatting(self):
+        for zone_name in ["UTC", "Asia/Kolkata", "America/New_York"]:
+            with self.subTest(zone_name=zone_name):
+                expected = [
+                    strftime_date_time_dict(value, zone_name) for value in self.datetimes
+                ]
+                self.assertEqual(
+                    [
+                        get_date_time_dict_in_ist(
+                            value, noon_format=True, default_timezone=zone_name
+                        )
+                        for value in self.datetimes
+                    ],
+                    expected,
+                )
+                self.assertEqual(
+                    get_date_time_dicts_in_ist(
+                        self.datetimes, noon_format=True, default_timezone=zone_name
+                    ),
+                    expected,
+                )
+
+    def test_batch_options(self):
+        self.assertEqual(
+            get_date_time_dicts_in_ist(
+                [self.datetimes[0], None], need_time=False, date_format="%Y-%m-%d"
+            ),
+            [{"date": "2024-01-01"}, None],
+        )
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    """
+    Tests for the orjson renderer and parser.
+    """
+
+    def test_renders_like_json_renderer(self):
+        data = build_listing_page(3)
+        data["success"]["results"][0].update({1: "integer key", "separators": "\u2028\u2029"})
+        for accepted_media_type in [None, "application/json; indent=2"]:
+            with self.subTest(accepted_media_type=accepted_media_type):
+                self.assertEqual(
+                    ORJSONRenderer().render(data, accepted_media_type),
+                    JSONRenderer().render(data, accepted_media_type),
+                )
+        # Beyond 64 bits, rendered by the stdlib
+        self.assertEqual(ORJSONRenderer().render({"huge": 2**70}), b'{"huge":%d}' % 2**70)
+
+    def test_non_finite_floats_render_like_json_renderer(self):
+        data = {"summary": None, "scores": [1.5, float("nan")]}
+        with self.assertRaises(ValueError):
+            ORJSONRenderer().render(data)
+
+        with mock.patch.object(ORJSONRenderer, "strict", False):
+            self.assertEqual(
+                ORJSONRenderer().render(data), b'{"summary":null,"scores":[1.5,NaN]}'
+            )
+
+    def test_nulls_without_non_finite_numbers_are_rendered_by_orjson(self):
+        data = build_listing_page(3)
+        data["success"]["results"][0].update({"summary": None, "scores": [1.5, None]})
+
+        with mock.patch.object(JSONRenderer, "render") as json_renderer_render:
+            rendered = ORJSONRenderer().render(data)
+
+        json_renderer_render.assert_not_called()
+        self.assertEqual(rendered, JSONRenderer().render(data))
+
+    def test_parses(self):
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO('{"title": "ünïcödé", "ids": [1, 2]}'.encode())),
+            {"title": "ünïcödé", "ids": [1, 2]},
+        )
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"title": NaN}'))
+
+
+class BloomFilterTest(SimpleTestCase):
+    """
+    Tests for the bloom filter.
+    """
+
+    def test_membership(self):
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"item-{index}" for index in range(1000)]
+        bloom_filter.add(items)
+
+        self.assertTrue(all(item in bloom_filter for item in items))
+        false_positives = sum(f"other-{index}" in bloom_filter for index in range(10000))
+        self.assertLess(false_positives, 200)
+
+        copy = BloomFilter(capacity=1000, error_rate=0.01, bits=bloom_filter.to_bytes())
+        self.assertTrue(all(item in copy for item in items))
+        with self.assertRaises(ValueError):
+            BloomFilter(capacity=2000, error_rate=0.01, bits=bloom_filter.to_bytes())
+
+
+class CursorTest(SimpleTestCase):
+    """
+    Tests for the keyset pagination cursors.
+    """
+
+    def test_round_trip(self):
+        created_at = datetime(2024, 3, 1, 10, 30, 15, 123456, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(decode_cursor(encode_cursor(created_at, 42)), (created_at, 42))
+
+    def test_invalid_cursors(self):
+        cursor = encode_cursor(datetime(2024, 3, 1, tzinfo=dt_timezone.utc), 42)
+        for invalid_cursor in [
+            "",
+            "not-a-cursor",
+            cursor[:-2],
+            base64.urlsafe_b64encode(b'["2024-03-01", "x"]').decode(),
+            base64.urlsafe_b64encode(b'{"id": 42}').decode(),
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        ]:
+            with self.subTest(cursor=invalid_cursor):
+                self.assertIsNone(decode_cursor(invalid_cursor))
+
+
+class CountCacheKeyTest(SimpleTestCase):
+    """
+    Tests for the versioned cache keys of the listing totals.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_evicted_version_does_not_reuse_old_keys(self):
+        first_key = build_count_cache_key("content_count", 1, category=None)
+        self.assertEqual(build_count_cache_key("content_count", 1, category=None), first_key)
+
+        invalidate_count_cache("content_count", 1)
+        second_key = build_count_cache_key("content_count", 1, category=None)
+        self.assertNotEqual(second_key, first_key)
+
+        # The version was evicted, the totals cached under the previous versions survived
+        cache.delete("content_count:version:1")
+        third_key = build_count_cache_key("content_count", 1, category=None)
+        self.assertNotIn(third_key, [first_key, second_key])
+
+    def count_twice(self):
+        total_entries = mock.Mock()
+        total_entries.count.side_effect = [3, 4]
+        return [
+            get_total_entries_count(
+                total_entries, count_strategy=CountStrategy.CACHED, count_cache_key="total"
+            )
+            for _ in range(2)
+        ]
+
+    def test_cached_count_with_a_shared_cache(self):
+        with mock.patch(
+            "common_utility.utils.pagination_utility.is_shared_cache", return_value=True
+        ):
+            self.assertEqual(self.count_twice(), [(3, False), (3, False)])
+
+    def test_cached_count_falls_back_to_exact_with_a_local_cache(self):
+        # The test settings use the default LocMemCache, private to each worker
+        self.assertEqual(self.count_twice(), [(3, False), (4, False)])
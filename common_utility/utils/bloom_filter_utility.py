@@ -0,0 +1,149 @@
+import math
+import hashlib
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+# Sets the bits of a Redis filter only if it exists: SETBIT on a missing key would create a
+# filter missing the items added before
+REDIS_ADD_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+for _, offset in ipairs(ARGV) do
+    redis.call("SETBIT", KEYS[1], offset, 1)
+end
+return 1
+"""
+
+
+def get_bloom_filter_size(capacity: int, error_rate: float) -> Tuple[int, int]:
+    """
+    Number of bits and of hash functions of a bloom filter holding `capacity` items with
+    a false positive rate of `error_rate`.
+    """
+    size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    # Whole bytes, the bits are stored and shared as bytes
+    size = max(8, size + -size % 8)
+    hash_count = max(1, round(size / capacity * math.log(2)))
+    return size, hash_count
+
+
+def get_bloom_filter_offsets(item: str, size: int, hash_count: int) -> List[int]:
+    """
+    Bit offsets of an item, by double hashing one 128 bits blake2b digest.
+    """
+    digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+    first, second = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big")
+    return [(first + index * second) % size for index in range(hash_count)]
+
+
+class BloomFilter:
+    """
+    Thread safe, in-process bloom filter of strings: membership tests have no false
+    negatives and `error_rate` false positives at `capacity` items.
+
+    Bit `offset` is the `0x80 >> offset % 8` bit of byte `offset // 8`, the Redis bit
+    order, so the bytes can be copied to a `RedisBloomFilter`.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, bits: Optional[bytes] = None):
+        self.size, self.hash_count = get_bloom_filter_size(capacity, error_rate)
+        self._bits = bytearray(bits) if bits is not None else bytearray(self.size // 8)
+        if len(self._bits) != self.size // 8:
+            raise ValueError("The bits don't match the size of the filter.")
+        self._lock = threading.Lock()
+
+    def add(self, items: Iterable[str]) -> None:
+        offsets = [
+            offset
+            for item in items
+            for offset in get_bloom_filter_offsets(item, self.size, self.hash_count)
+        ]
+        with self._lock:
+            for offset in offsets:
+                self._bits[offset >> 3] |= 0x80 >> (offset & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(
+            bits[offset >> 3] & (0x80 >> (offset & 7))
+            for offset in get_bloom_filter_offsets(item, self.size, self.hash_count)
+        )
+
+    def to_bytes(self) -> bytes:
+        with self._lock:
+            return bytes(self._bits)
+
+
+class RedisBloomFilter:
+    """
+    Bloom filter stored in a Redis string and shared by all the processes, with the
+    layout of `BloomFilter`.
+
+    A missing key isn't an empty filter: membership tests return None until the filter is
+    built, callers have to check the source of truth meanwhile.
+    """
+
+    def __init__(self, client, key: str, capacity: int, error_rate: float):
+        """
+        Args:
+            client: A redis-py client.
+            key (str): Key of the Redis string holding the bits.
+            capacity (int): Items the filter is sized for.
+            error_rate (float): False positive rate at `capacity` items.
+        """
+        self.client = client
+        self.key = key
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size, self.hash_count = get_bloom_filter_size(capacity, error_rate)
+        self._add_script = client.register_script(REDIS_ADD_SCRIPT)
+
+    def add(self, items: Iterable[str]) -> None:
+        """
+        Add items to the filter, if it's built.
+        """
+        offsets = [
+            offset
+            for item in items
+            for offset in get_bloom_filter_offsets(item, self.size, self.hash_count)
+        ]
+        if offsets:
+            self._add_script(keys=[self.key], args=offsets)
+
+    def contains(self, item: str) -> Optional[bool]:
+        """
+        Whether an item may be in the filter, None if the filter isn't built.
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.exists(self.key)
+        for offset in get_bloom_filter_offsets(item, self.size, self.hash_count):
+            pipeline.getbit(self.key, offset)
+        exists, *bits = pipeline.execute()
+        if not exists:
+            return None
+        return all(bits)
+
+    def replace(self, bloom_filter: BloomFilter, timeout: Optional[int] = None) -> None:
+        """
+        Atomically replace the filter with the bits of a local filter of the same size.
+
+        Args:
+            bloom_filter (BloomFilter): The new filter.
+            timeout (int, optional): Seconds after which the filter expires and has to be
+                built again.
+        """
+        if (bloom_filter.size, bloom_filter.hash_count) != (self.size, self.hash_count):
+            raise ValueError("The filters don't have the same size.")
+        building_key = f"{self.key}:building"
+        pipeline = self.client.pipeline()
+        pipeline.set(building_key, bloom_filter.to_bytes(), ex=timeout)
+        pipeline.rename(building_key, self.key)
+        pipeline.execute()
+
+    def acquire_build_lock(self, timeout: int) -> bool:
+        """
+        Whether this process should build the filter, at most one process every `timeout`
+        seconds.
+        """
+        return bool(self.client.set(f"{self.key}:lock", 1, nx=True, ex=timeout))
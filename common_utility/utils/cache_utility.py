@@ -0,0 +1,163 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread safe, in-process least recently used cache with an optional per entry timeout.
+
+    Exposes the subset of the Django cache API used by `ReadThroughCache`, so both can be
+    swapped through `get_cache_backend`.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def get_cache_backend(alias: Optional[str] = None, max_entries: int = 1024):
+    """
+    Return the cache backend to use for a read-through cache.
+
+    Args:
+        alias (str, optional): Alias of a configured Django cache (`CACHES`), e.g. a Redis
+            cache shared by all the workers. Defaults to None.
+        max_entries (int, optional): Size of the local LRU cache used when no alias is
+            given. Defaults to 1024.
+
+    Returns:
+        A Django cache backend or a local `LRUCache`.
+    """
+    if alias:
+        return caches[alias]
+    return LRUCache(max_entries=max_entries)
+
+
+def is_shared_cache(backend) -> bool:
+    """
+    Whether a cache backend is shared by all the workers, i.e. an entry set by a worker is
+    seen, and invalidated, by the others.
+
+    Args:
+        backend: A Django cache backend or a local `LRUCache`.
+
+    Returns:
+        bool: False for the in-process caches (LocMemCache, DummyCache, LRUCache).
+    """
+    return not isinstance(backend, (LocMemCache, DummyCache, LRUCache))
+
+
+class ReadThroughCache:
+    """
+    Read-through cache of computed values keyed by an id and a version.
+
+    A stored entry is only served while its version matches the version the caller
+    expects (e.g. the `updated_at` of a row), so an entry can't outlive the data it was
+    built from even when invalidation is missed by another process.
+
+    Attributes:
+        namespace (str): Prefix of the cache keys.
+        backend: Local `LRUCache` or Django cache backend.
+        timeout (int): Seconds an entry is kept, None to keep it until evicted.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to call the loader.
+    """
+
+    def __init__(self, namespace: str, backend, timeout: Optional[int] = None):
+        self.namespace = namespace
+        self.backend = backend
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def make_key(self, key) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get_or_load(self, key, version: str, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value of `key` at `version`, calling `loader` on a miss.
+
+        Args:
+            key: Id of the cached value.
+            version (str): Version the cached value must have.
+            loader (callable): Builds the value on a miss.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        cache_key = self.make_key(key)
+        entry = self.backend.get(cache_key)
+        if entry is not None and entry["version"] == version:
+            self._record(hit=True)
+            return entry["value"]
+
+        self._record(hit=False)
+        value = loader()
+        self.backend.set(cache_key, {"version": version, "value": value}, self.timeout)
+        return value
+
+    def invalidate(self, key) -> None:
+        """
+        Drop the cached value of `key`.
+        """
+        self.backend.delete(self.make_key(key))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters of this process, for monitoring.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _record(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
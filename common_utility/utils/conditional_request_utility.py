@@ -0,0 +1,91 @@
+import hashlib
+import calendar
+from datetime import datetime
+from typing import Optional
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def build_weak_etag(*parts) -> str:
+    """
+    Build a weak ETag from the values identifying a representation.
+
+    Args:
+        *parts: Values the representation depends on, e.g. id and updated_at.
+
+    Returns:
+        str: Weak ETag, e.g. W/"0cc175b9c0f1b6a831c399e269772661".
+    """
+    digest = hashlib.md5(
+        ":".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def build_strong_etag(*parts) -> str:
+    """
+    Build a strong ETag from the values identifying the exact bytes of a representation,
+    e.g. a file name, size and modification time. Required to resume downloads (If-Range).
+
+    Args:
+        *parts: Values the representation bytes depend on.
+
+    Returns:
+        str: Strong ETag, e.g. "0cc175b9c0f1b6a831c399e269772661".
+    """
+    return build_weak_etag(*parts)[2:]
+
+
+def get_timestamp(datetime_object: Optional[datetime]) -> Optional[int]:
+    """
+    Convert an aware datetime to a UNIX timestamp as used by HTTP dates.
+    """
+    if datetime_object is None:
+        return None
+    return calendar.timegm(datetime_object.utctimetuple())
+
+
+def get_not_modified_response(
+    request, etag: str, last_modified: Optional[datetime] = None
+) -> Optional[HttpResponseBase]:
+    """
+    Evaluate the conditional request headers (If-None-Match, If-Modified-Since, ...).
+
+    Args:
+        request: The HTTP request object.
+        etag (str): ETag of the current representation.
+        last_modified (datetime, optional): Last modification of the representation.
+
+    Returns:
+        HttpResponseBase: 304 (or 412) response to return as is, None if the full
+            representation has to be sent.
+    """
+    response = get_conditional_response(
+        request, etag=etag, last_modified=get_timestamp(last_modified)
+    )
+    if response is not None:
+        set_conditional_headers(response, etag=etag, last_modified=last_modified)
+    return response
+
+
+def set_conditional_headers(
+    response: HttpResponseBase, etag: str, last_modified: Optional[datetime] = None
+) -> HttpResponseBase:
+    """
+    Set the validators of a response so clients can revalidate it with a conditional GET.
+
+    Args:
+        response (HttpResponseBase): Response to update.
+        etag (str): ETag of the representation.
+        last_modified (datetime, optional): Last modification of the representation.
+
+    Returns:
+        HttpResponseBase: The updated response.
+    """
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(get_timestamp(last_modified))
+    # Authenticated data, clients may keep it but have to revalidate it
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -5,7 +5,51 @@ class Role:
 
     SUPER_ADMIN = "SUPER_ADMIN_ROLE"
     AUTHER = "AUTHER_ROLE"
-    
 
 
+class CountStrategy:
+    """
+    Constants defining how paginated listings compute their total entries.
+    """
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+
+
+class PdfProcessingStatus:
+    """
+    Constants defining the state of the background processing of a content pdf file.
+    """
+
+    NONE = "none"
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    CHOICES = [
+        (NONE, "No pdf file"),
+        (PENDING, "Pending"),
+        (PROCESSING, "Processing"),
+        (COMPLETED, "Completed"),
+        (FAILED, "Failed"),
+    ]
+
+
+class SummaryStatus:
+    """
+    Constants defining where the summary of a content item comes from.
+    """
+
+    AUTHOR = "author"
+    PENDING = "pending"
+    GENERATED = "generated"
+    FAILED = "failed"
 
+    CHOICES = [
+        (AUTHOR, "Written by the author"),
+        (PENDING, "Pending"),
+        (GENERATED, "Generated"),
+        (FAILED, "Failed"),
+    ]
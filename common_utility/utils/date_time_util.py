@@ -1,21 +1,77 @@
-import pytz
+import math
 import traceback
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Iterable, List, Tuple
+from zoneinfo import ZoneInfo
 
+from django.db import models
 from django.utils import timezone
 from datetime import datetime, time
 from django.conf import settings
+from rest_framework import serializers
 
 TIME_ZONE = settings.TIME_ZONE
 
 
+DEFAULT_DATE_FORMAT = "%d/%m/%Y"
+DEFAULT_TIME_FORMAT = "%I:%M:%S"
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str) -> ZoneInfo:
+    """
+    Return the timezone of a name, resolved once per process.
+    """
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(
+    timestamp: int,
+    zone_name: str,
+    need_date: bool,
+    need_time: bool,
+    noon_format: bool,
+    date_format: str,
+    time_format: str,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Format a timestamp truncated to the second, the same second is formatted once.
+    The default formats are built by hand, faster than strftime.
+    """
+    local_datetime = datetime.fromtimestamp(timestamp, get_zone(zone_name))
+
+    date_string = None
+    if need_date:
+        if date_format == DEFAULT_DATE_FORMAT:
+            date_string = (
+                f"{local_datetime.day:02d}/{local_datetime.month:02d}/{local_datetime.year:04d}"
+            )
+        else:
+            date_string = local_datetime.strftime(date_format)
+
+    time_string = None
+    if need_time:
+        if time_format == DEFAULT_TIME_FORMAT:
+            time_string = (
+                f"{local_datetime.hour % 12 or 12:02d}:"
+                f"{local_datetime.minute:02d}:{local_datetime.second:02d}"
+            )
+        else:
+            time_string = local_datetime.strftime(time_format)
+        if noon_format:
+            time_string += " AM" if local_datetime.hour < 12 else " PM"
+
+    return date_string, time_string
+
+
 def get_date_time_dict_in_ist(
     datetime_utc_object: datetime,
     need_date: bool = True,
     need_time: bool = True,
     noon_format: bool = False,
-    date_format: str = "%d/%m/%Y",
-    time_format: str = "%I:%M:%S",
+    date_format: str = DEFAULT_DATE_FORMAT,
+    time_format: str = DEFAULT_TIME_FORMAT,
     default_timezone: Optional[str] = TIME_ZONE,
     *args,
     **kwargs,
@@ -23,6 +79,9 @@ def get_date_time_dict_in_ist(
     """
     Returns the formatted date and time dictionary in IST timezone.
 
+    Formatted strings are cached per second, use `get_date_time_dicts_in_ist` to format
+    the datetimes of a whole list.
+
     Args:
         datetime_utc_object (datetime): The datetime object in UTC timezone.
         need_date (bool, optional): Whether to include date in the dictionary. Defaults to True.
@@ -36,34 +95,127 @@ def get_date_time_dict_in_ist(
         Dict[str, str]: The formatted date and time dictionary.
     """
     try:
-        # Convert UTC datetime to IST timezone
-        ist_timezone = pytz.timezone(default_timezone)
-        ist_datetime_object = datetime_utc_object.astimezone(ist_timezone)
+        if "%f" in date_format or "%f" in time_format:
+            # Sub-second formats can't use the per second cache
+            local_datetime = datetime_utc_object.astimezone(get_zone(default_timezone))
+            date_string = local_datetime.strftime(date_format) if need_date else None
+            time_string = local_datetime.strftime(time_format) if need_time else None
+            if need_time and noon_format:
+                time_string += " " + local_datetime.strftime("%p")
+        else:
+            date_string, time_string = _format_timestamp(
+                math.floor(datetime_utc_object.timestamp()),
+                default_timezone,
+                need_date,
+                need_time,
+                noon_format,
+                date_format,
+                time_format,
+            )
 
-        # Initialize empty dictionary
         date_time_dict = {}
-
-        # Format date if needed
         if need_date:
-            date_string = ist_datetime_object.strftime(date_format)
             date_time_dict["date"] = date_string
-
-        # Format time if needed
         if need_time:
-            time_string = ist_datetime_object.strftime(time_format)
-
-            # Add AM/PM if requested
-            if noon_format:
-                noon_string = ist_datetime_object.strftime("%p")
-                time_string += " " + noon_string
-
             date_time_dict["time"] = time_string
-
         return date_time_dict
     except Exception as e:
         print(e, traceback.format_exc())
 
 
+def get_date_time_dicts_in_ist(
+    datetime_utc_objects: Iterable[Optional[datetime]],
+    need_date: bool = True,
+    need_time: bool = True,
+    noon_format: bool = False,
+    date_format: str = DEFAULT_DATE_FORMAT,
+    time_format: str = DEFAULT_TIME_FORMAT,
+    default_timezone: Optional[str] = TIME_ZONE,
+) -> List[Optional[Dict[str, str]]]:
+    """
+    Format many datetimes at once, e.g. the `created_at` of a page of a listing. The
+    options are checked once for the whole list instead of once per datetime.
+
+    Args:
+        datetime_utc_objects (iterable): The datetime objects, may contain None.
+        Other arguments: Options of `get_date_time_dict_in_ist`.
+
+    Returns:
+        list: The formatted date and time dictionary of every datetime, None for None.
+    """
+    options = (need_date, need_time, noon_format, date_format, time_format)
+    if "%f" in date_format or "%f" in time_format:
+        return [
+            get_date_time_dict_in_ist(value, *options, default_timezone)
+            if value is not None
+            else None
+            for value in datetime_utc_objects
+        ]
+
+    date_time_dicts = []
+    for value in datetime_utc_objects:
+        if value is None:
+            date_time_dicts.append(None)
+            continue
+        date_string, time_string = _format_timestamp(
+            math.floor(value.timestamp()), default_timezone, *options
+        )
+        date_time_dict = {}
+        if need_date:
+            date_time_dict["date"] = date_string
+        if need_time:
+            date_time_dict["time"] = time_string
+        date_time_dicts.append(date_time_dict)
+    return date_time_dicts
+
+
+class IstDateTimeListSerializer(serializers.ListSerializer):
+    """
+    List serializer formatting the date/time fields of all its items at once, see
+    `IstDateTimeSerializerMixin`.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        representations = super().to_representation(items)
+
+        fields = self.child.ist_date_time_fields
+        date_time_dicts = iter(
+            get_date_time_dicts_in_ist(
+                (getattr(item, field) for item in items for field in fields),
+                **self.child.ist_date_time_options,
+            )
+        )
+        for representation in representations:
+            for field in fields:
+                representation[field] = next(date_time_dicts)
+        return representations
+
+
+class IstDateTimeSerializerMixin:
+    """
+    Serializer mixin representing datetime fields as IST date and time dictionaries, set
+    `IstDateTimeListSerializer` as `list_serializer_class` to format lists in one batch.
+    """
+
+    ist_date_time_fields = ("created_at", "updated_at")
+    ist_date_time_options = {"noon_format": True}
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        if isinstance(self.parent, IstDateTimeListSerializer):
+            # Formatted by the list serializer for the whole list
+            return representation
+
+        date_time_dicts = get_date_time_dicts_in_ist(
+            (getattr(instance, field) for field in self.ist_date_time_fields),
+            **self.ist_date_time_options,
+        )
+        for field, date_time_dict in zip(self.ist_date_time_fields, date_time_dicts):
+            representation[field] = date_time_dict
+        return representation
+
+
 def convert_string_to_datetime_object(
     string_date: str,
     date_format: str = "%d/%m/%Y",
@@ -0,0 +1,196 @@
+import re
+from datetime import datetime
+from typing import Optional, Tuple
+from django.http import FileResponse, HttpResponse, HttpResponseBase
+from django.utils.http import content_disposition_header, parse_http_date_safe
+from common_utility.utils.conditional_request_utility import (
+    get_timestamp,
+    set_conditional_headers,
+)
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+SENDFILE_HEADERS = {
+    "x-accel-redirect": "X-Accel-Redirect",
+    "x-sendfile": "X-Sendfile",
+}
+
+
+class RangeFile:
+    """
+    Read-only view of a byte range of a file, so a partial response is streamed block by
+    block like a whole file. It has no `fileno`, servers can't sendfile past the range.
+    """
+
+    def __init__(self, file, start: int, length: int):
+        self.file = file
+        self.file.seek(start)
+        self.remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def parse_range_header(
+    range_header: Optional[str], size: int
+) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single byte range of a Range header.
+
+    Args:
+        range_header (str): Value of the Range header, e.g. "bytes=0-1023".
+        size (int): Size of the file.
+
+    Returns:
+        tuple: First and last byte of the range, None if the whole file has to be sent
+            (no header, several ranges or a header that can't be parsed).
+
+    Raises:
+        ValueError: If the range is outside of the file.
+    """
+    match = RANGE_PATTERN.match((range_header or "").strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range, the last bytes of the file
+        if int(last) == 0 or size == 0:
+            raise ValueError("Unsatisfiable range.")
+        return max(size - int(last), 0), size - 1
+
+    first = int(first)
+    last = min(int(last), size - 1) if last else size - 1
+    if first >= size or first > last:
+        raise ValueError("Unsatisfiable range.")
+    return first, last
+
+
+def is_if_range_matched(
+    request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Whether the representation still matches the If-Range validator of the request, a
+    Range is only honoured in that case. Weak ETags never match (RFC 9110).
+    """
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return not etag.startswith("W/") and if_range == etag
+    if_range_timestamp = parse_http_date_safe(if_range)
+    return (
+        if_range_timestamp is not None
+        and last_modified is not None
+        and if_range_timestamp == get_timestamp(last_modified)
+    )
+
+
+def build_file_response(
+    request,
+    file,
+    size: int,
+    content_type: str,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    filename: Optional[str] = None,
+    as_attachment: bool = False,
+) -> HttpResponseBase:
+    """
+    Stream a file or the byte range requested by the Range header.
+
+    Whole files are sent with `FileResponse`, which lets the server use its file wrapper
+    (sendfile), ranges are read block by block. The file is never read into memory.
+
+    Args:
+        request: The HTTP request object.
+        file: File object opened in binary mode, closed with the response.
+        size (int): Size of the file.
+        content_type (str): Content type of the file.
+        etag (str): ETag of the file, a strong one lets clients resume downloads.
+        last_modified (datetime, optional): Last modification of the file.
+        filename (str, optional): File name of the Content-Disposition header.
+        as_attachment (bool, optional): Whether the file is downloaded rather than
+            displayed. Defaults to False.
+
+    Returns:
+        HttpResponseBase: 200, 206 or 416 response.
+    """
+    byte_range = None
+    if is_if_range_matched(request, etag, last_modified):
+        try:
+            byte_range = parse_range_header(request.headers.get("Range"), size)
+        except ValueError:
+            file.close()
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            response["Accept-Ranges"] = "bytes"
+            return response
+
+    if byte_range is None:
+        response = FileResponse(
+            file,
+            content_type=content_type,
+            as_attachment=as_attachment,
+            filename=filename or "",
+        )
+        response["Content-Length"] = size
+    else:
+        first, last = byte_range
+        response = FileResponse(
+            RangeFile(file, first, last - first + 1),
+            status=206,
+            content_type=content_type,
+            as_attachment=as_attachment,
+            filename=filename or "",
+        )
+        response["Content-Length"] = last - first + 1
+        response["Content-Range"] = f"bytes {first}-{last}/{size}"
+
+    response["Accept-Ranges"] = "bytes"
+    return set_conditional_headers(response, etag=etag, last_modified=last_modified)
+
+
+def build_sendfile_response(
+    backend: str,
+    location: str,
+    content_type: str,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    filename: Optional[str] = None,
+    as_attachment: bool = False,
+) -> HttpResponseBase:
+    """
+    Delegate sending a file to the web server, which also handles Range requests.
+
+    Args:
+        backend (str): "x-accel-redirect" (nginx) or "x-sendfile" (Apache, lighttpd).
+        location (str): Internal URI (nginx) or path of the file on disk (X-Sendfile).
+        content_type (str): Content type of the file.
+        etag (str): ETag of the file.
+        last_modified (datetime, optional): Last modification of the file.
+        filename (str, optional): File name of the Content-Disposition header.
+        as_attachment (bool, optional): Whether the file is downloaded rather than
+            displayed. Defaults to False.
+
+    Returns:
+        HttpResponseBase: Empty response carrying the sendfile header.
+    """
+    response = HttpResponse(content_type=content_type)
+    response[SENDFILE_HEADERS[backend]] = location
+    if filename or as_attachment:
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment, filename or ""
+        )
+    return set_conditional_headers(response, etag=etag, last_modified=last_modified)
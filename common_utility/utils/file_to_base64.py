@@ -1,13 +1,67 @@
 import os
+import mmap
 import base64
 import traceback
-from typing import Dict
+from typing import Dict, Iterator
+
+# Bytes encoded at once, a multiple of 3 so chunks are encoded without padding
+BASE64_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def iter_file_base64(
+    file, chunk_size: int = BASE64_CHUNK_SIZE, use_mmap: bool = False
+) -> Iterator[bytes]:
+    """
+    Encode a file to Base64 chunk by chunk, at constant memory whatever the file size.
+
+    The chunks are encoded from blocks aligned to 3 bytes, so joining them gives the
+    Base64 encoding of the whole file.
+
+    Args:
+        file: Path of the file or file object opened in binary mode, closed once encoded.
+        chunk_size (int, optional): Bytes encoded at once, rounded down to a multiple
+            of 3. Defaults to 768 KiB.
+        use_mmap (bool, optional): Encode from a memory map of the file instead of
+            reading it, saving a copy of every block. Defaults to False.
+
+    Yields:
+        bytes: Base64 encoded chunks.
+    """
+    chunk_size = max(chunk_size - chunk_size % 3, 3)
+    if isinstance(file, (str, os.PathLike)):
+        file = open(file, "rb")
+
+    try:
+        if use_mmap and os.fstat(file.fileno()).st_size:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                with memoryview(mapped_file) as view:
+                    for start in range(0, len(view), chunk_size):
+                        yield base64.b64encode(view[start : start + chunk_size])
+            return
+
+        remainder = b""
+        while True:
+            block = file.read(chunk_size)
+            if not block:
+                break
+            block = remainder + block
+            aligned_size = len(block) - len(block) % 3
+            remainder = block[aligned_size:]
+            if aligned_size:
+                yield base64.b64encode(block[:aligned_size])
+        if remainder:
+            yield base64.b64encode(remainder)
+    finally:
+        file.close()
 
 
 def file_to_base64(file_path: str) -> Dict[str, str]:
     """
     Convert a file to Base64 string.
 
+    The whole encoded file is held in memory, embed `iter_file_base64` in a
+    `StreamingJSONResponse` to send large files.
+
     Args:
         file_path (str): Path to the file to be converted.
 
@@ -19,19 +73,16 @@ def file_to_base64(file_path: str) -> Dict[str, str]:
         # Extract file name and extension from file path
         file_name, file_extension = os.path.splitext(os.path.basename(file_path))
 
-        with open(file_path, "rb") as file:
-            # Read file data
-            file_data = file.read()
-            # Encode file data as Base64
-            base64_encoded = base64.b64encode(file_data)
-            # Decode bytes to string (Python 3)
-            base64_encoded_string = base64_encoded.decode("utf-8")
-
-            return {
-                "file_name": file_name,
-                "extension": file_extension,
-                "base64_string": base64_encoded_string,
-            }
+        # Encode the file chunk by chunk instead of reading it whole first
+        base64_encoded_string = "".join(
+            chunk.decode("ascii") for chunk in iter_file_base64(file_path)
+        )
+
+        return {
+            "file_name": file_name,
+            "extension": file_extension,
+            "base64_string": base64_encoded_string,
+        }
     except Exception as e:
         print(e, traceback.format_exc())
         return None
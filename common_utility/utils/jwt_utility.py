@@ -0,0 +1,158 @@
+import time
+import threading
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import jwt
+import requests
+
+# Asymmetric algorithms whose tokens can be verified with the published public keys
+ASYMMETRIC_ALGORITHMS = ("RS256", "RS384", "RS512", "EdDSA")
+
+
+class TokenVerification(NamedTuple):
+    """
+    Result of the verification of a token: its claims if valid, the error otherwise.
+    """
+
+    claims: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+
+def fetch_jwks(url: str, timeout: float = 5) -> Dict[str, Any]:
+    """
+    Fetch a JWKS document, e.g. from the JWKS endpoint of the user app.
+    """
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+class CachedKeyVerifier:
+    """
+    Local verifier of JWTs signed with the keys of a JWKS document, for services that
+    don't share the signing secret and shouldn't call the token verify endpoint.
+
+    The signing keys of the document whose `alg` is accepted are parsed once and cached
+    by `kid` for `cache_timeout` seconds. A token signed with an unknown `kid` (a rotated
+    in key) fetches the key set again, at most once per `min_refresh_interval` seconds.
+
+    Attributes:
+        get_jwks (callable): Returns the JWKS document.
+        algorithms (list): Accepted signing algorithms.
+        audience (str, optional): Expected `aud` claim.
+        issuer (str, optional): Expected `iss` claim.
+        leeway (int): Seconds of clock skew tolerated on the time claims.
+    """
+
+    def __init__(
+        self,
+        get_jwks: Callable[[], Dict[str, Any]],
+        algorithms: Iterable[str] = ASYMMETRIC_ALGORITHMS,
+        audience: Optional[str] = None,
+        issuer: Optional[str] = None,
+        leeway: int = 0,
+        cache_timeout: int = 300,
+        min_refresh_interval: int = 30,
+    ):
+        self.get_jwks = get_jwks
+        self.algorithms = list(algorithms)
+        self.audience = audience
+        self.issuer = issuer
+        self.leeway = leeway
+        self.cache_timeout = cache_timeout
+        self.min_refresh_interval = min_refresh_interval
+        # Algorithm and key by kid
+        self._keys: Dict[str, Tuple[str, jwt.PyJWK]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 5, **kwargs) -> "CachedKeyVerifier":
+        """
+        Verifier of the keys published at a JWKS URL.
+        """
+        return cls(lambda: fetch_jwks(url, timeout=timeout), **kwargs)
+
+    def _refresh(self, force: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded_at is not None and now - self._loaded_at < (
+                self.min_refresh_interval if force else self.cache_timeout
+            ):
+                return
+            keys = {}
+            for jwk in self.get_jwks().get("keys", []):
+                algorithm = jwk.get("alg")
+                if (
+                    jwk.get("use", "sig") != "sig"
+                    or "kid" not in jwk
+                    or algorithm not in self.algorithms
+                ):
+                    continue
+                try:
+                    keys[jwk["kid"]] = (algorithm, jwt.PyJWK(jwk, algorithm))
+                except (jwt.PyJWKError, jwt.InvalidKeyError):
+                    # Key of an algorithm or type this verifier can't use
+                    continue
+            self._keys = keys
+            self._loaded_at = now
+
+    def get_key(self, kid: Optional[str]) -> Optional[Tuple[str, jwt.PyJWK]]:
+        """
+        The algorithm and cached key with a `kid`, fetching the key set again if it's
+        unknown.
+        """
+        self._refresh()
+        key = self._keys.get(kid)
+        if key is None:
+            self._refresh(force=True)
+            key = self._keys.get(kid)
+        return key
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Verify the signature and claims of a token.
+
+        Returns:
+            dict: The claims of the token.
+
+        Raises:
+            jwt.InvalidTokenError: If the token is malformed, expired, or not signed by
+                one of the keys.
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        algorithm_key = self.get_key(kid)
+        if algorithm_key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key {kid!r}.")
+        algorithm, key = algorithm_key
+        return jwt.decode(
+            token,
+            key.key,
+            # The algorithm of the key, never the one claimed by the token
+            algorithms=[algorithm],
+            audience=self.audience,
+            issuer=self.issuer,
+            leeway=self.leeway,
+            options={"verify_aud": self.audience is not None},
+        )
+
+    def verify_many(self, tokens: Iterable[str]) -> List[TokenVerification]:
+        """
+        Verify a batch of tokens with the cached keys, each distinct token is verified
+        once.
+
+        Args:
+            tokens (iterable): The tokens to verify.
+
+        Returns:
+            list: The `TokenVerification` of every token, in the same order.
+        """
+        tokens = list(tokens)
+        results: Dict[str, TokenVerification] = {}
+        for token in tokens:
+            if token in results:
+                continue
+            try:
+                results[token] = TokenVerification(self.verify(token), None)
+            except jwt.InvalidTokenError as e:
+                results[token] = TokenVerification(None, str(e))
+        return [results[token] for token in tokens]
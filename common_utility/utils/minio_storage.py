@@ -0,0 +1,204 @@
+import time
+import tempfile
+import mimetypes
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from typing import Optional
+import urllib3
+from minio import Minio
+from minio.error import S3Error
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import Storage
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+from common_utility.utils.upload_utility import FILE_BLOCK_SIZE
+from common_utility.utils.storage_utility import ContentAddressedStorageMixin
+
+# Error codes of a missing object
+NOT_FOUND_ERROR_CODES = {"NoSuchKey", "NoSuchObject", "ResourceNotFound"}
+
+
+@lru_cache(maxsize=None)
+def get_minio_client(
+    endpoint: str,
+    access_key: Optional[str],
+    secret_key: Optional[str],
+    secure: bool,
+    region: str,
+    pool_size: int,
+) -> Minio:
+    """
+    Return the MinIO client of an endpoint, shared by the process so its connection pool
+    is reused across requests.
+
+    Args:
+        endpoint (str): Host and port of the S3/MinIO endpoint.
+        access_key (str): Access key.
+        secret_key (str): Secret key.
+        secure (bool): Whether to use HTTPS.
+        region (str): Region of the buckets, given so presigning doesn't look it up.
+        pool_size (int): Maximum connections kept open to the endpoint.
+
+    Returns:
+        Minio: The client.
+    """
+    http_client = urllib3.PoolManager(
+        maxsize=pool_size,
+        block=False,
+        timeout=urllib3.Timeout(connect=5, read=60),
+        retries=urllib3.Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+        ),
+    )
+    return Minio(
+        endpoint,
+        access_key=access_key,
+        secret_key=secret_key,
+        secure=secure,
+        region=region,
+        http_client=http_client,
+    )
+
+
+@deconstructible
+class MinioStorage(Storage):
+    """
+    Storage of files in a bucket of an S3 compatible endpoint (MinIO, AWS S3, ...).
+
+    Files over the multipart part size are uploaded in parts, `url` returns presigned GET
+    URLs so clients download files from the endpoint directly.
+
+    Presigned URLs are signed for the start of the current renewal interval (half of their
+    lifetime), so the URL of a file stays the same during an interval and responses
+    embedding it can be cached, see `get_url_version`.
+    """
+
+    def __init__(
+        self,
+        bucket_name: Optional[str] = None,
+        client: Optional[Minio] = None,
+        presign_client: Optional[Minio] = None,
+        multipart_part_size: Optional[int] = None,
+        url_expires: Optional[int] = None,
+    ):
+        self.bucket_name = bucket_name or settings.MINIO_BUCKET_NAME
+        self._client = client
+        self._presign_client = presign_client
+        self.multipart_part_size = multipart_part_size or settings.MINIO_MULTIPART_PART_SIZE
+        self.url_expires = url_expires or settings.MINIO_PRESIGNED_URL_EXPIRES
+
+    @property
+    def client(self) -> Minio:
+        if self._client is None:
+            self._client = get_minio_client(
+                settings.MINIO_ENDPOINT,
+                settings.MINIO_ACCESS_KEY,
+                settings.MINIO_SECRET_KEY,
+                settings.MINIO_SECURE,
+                settings.MINIO_REGION,
+                settings.MINIO_POOL_SIZE,
+            )
+        return self._client
+
+    @property
+    def presign_client(self) -> Minio:
+        """
+        Client presigning the URLs, for the endpoint as reachable by the clients. Signing
+        is done locally, it doesn't connect to the endpoint.
+        """
+        if self._presign_client is None:
+            if settings.MINIO_PUBLIC_ENDPOINT:
+                self._presign_client = get_minio_client(
+                    settings.MINIO_PUBLIC_ENDPOINT,
+                    settings.MINIO_ACCESS_KEY,
+                    settings.MINIO_SECRET_KEY,
+                    settings.MINIO_PUBLIC_SECURE,
+                    settings.MINIO_REGION,
+                    settings.MINIO_POOL_SIZE,
+                )
+            else:
+                self._presign_client = self.client
+        return self._presign_client
+
+    def _open(self, name, mode="rb"):
+        if "w" in mode:
+            raise ValueError("MinioStorage files can't be opened for writing.")
+
+        # Spooled to disk past FILE_UPLOAD_MAX_MEMORY_SIZE
+        file = tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+        response = self.client.get_object(self.bucket_name, name)
+        try:
+            for chunk in response.stream(FILE_BLOCK_SIZE):
+                file.write(chunk)
+        finally:
+            response.close()
+            response.release_conn()
+        file.seek(0)
+        return File(file, name)
+
+    def _save(self, name, content):
+        content.seek(0)
+        content_type = getattr(content, "content_type", None) or (
+            mimetypes.guess_type(name)[0] or "application/octet-stream"
+        )
+        # Uploaded as a multipart upload when larger than the part size
+        self.client.put_object(
+            self.bucket_name,
+            name,
+            content,
+            length=content.size,
+            content_type=content_type,
+            part_size=self.multipart_part_size,
+        )
+        return name
+
+    def _stat(self, name):
+        try:
+            return self.client.stat_object(self.bucket_name, name)
+        except S3Error as e:
+            if e.code in NOT_FOUND_ERROR_CODES:
+                raise FileNotFoundError(name) from e
+            raise
+
+    def exists(self, name):
+        try:
+            self._stat(name)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def delete(self, name):
+        # Deleting a missing object succeeds
+        self.client.remove_object(self.bucket_name, name)
+
+    def size(self, name):
+        return self._stat(name).size
+
+    def get_modified_time(self, name):
+        last_modified = self._stat(name).last_modified
+        if not settings.USE_TZ:
+            return timezone.make_naive(last_modified, dt_timezone.utc)
+        return last_modified
+
+    def get_url_version(self) -> int:
+        """
+        Index of the current presigned URL renewal interval, the URLs change with it.
+        """
+        return int(time.time()) // max(self.url_expires // 2, 1)
+
+    def url(self, name):
+        renewal_interval = max(self.url_expires // 2, 1)
+        request_date = datetime.fromtimestamp(
+            self.get_url_version() * renewal_interval, dt_timezone.utc
+        )
+        return self.presign_client.presigned_get_object(
+            self.bucket_name,
+            name,
+            expires=timedelta(seconds=self.url_expires),
+            request_date=request_date,
+        )
+
+
+class ContentAddressedMinioStorage(ContentAddressedStorageMixin, MinioStorage):
+    pass
@@ -1,10 +1,31 @@
+import json
 import math
+import time
+import base64
+import hashlib
 import traceback
-from django.db.models import QuerySet
-from typing_extensions import Dict
+from datetime import datetime
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from typing_extensions import Dict, List, Optional, Tuple
+from common_utility.utils.cache_utility import is_shared_cache
+from common_utility.utils.constants import CountStrategy
 
+COUNT_CACHE_TIMEOUT = getattr(settings, "PAGINATION_COUNT_CACHE_TIMEOUT", 300)
 
-def pagination_utility(total_entries: QuerySet, page: int, items: int) -> Dict:
+
+def pagination_utility(
+    total_entries: QuerySet,
+    page: int,
+    items: int,
+    total_entries_count: Optional[int] = None,
+    count_strategy: str = CountStrategy.EXACT,
+    count_cache_key: Optional[str] = None,
+) -> Dict:
     """
     Custom pagination utility function.
 
@@ -12,12 +33,24 @@ def pagination_utility(total_entries: QuerySet, page: int, items: int) -> Dict:
         total_entries (QuerySet): QuerySet containing total entries.
         page (int): Current page number.
         items (int): Number of items per page.
+        total_entries_count (int, optional): Total already known by the caller, skips the
+            count query when given. Defaults to None.
+        count_strategy (str, optional): One of `CountStrategy`, used when the total has to
+            be computed. Defaults to CountStrategy.EXACT.
+        count_cache_key (str, optional): Cache key of the total, required by
+            CountStrategy.CACHED. See `build_count_cache_key`.
 
     Returns:
         dict: Paginated data along with page details.
     """
     try:
-        total_entries_count = total_entries.count()
+        is_total_approximate = False
+        if total_entries_count is None:
+            total_entries_count, is_total_approximate = get_total_entries_count(
+                total_entries=total_entries,
+                count_strategy=count_strategy,
+                count_cache_key=count_cache_key,
+            )
         total_pages = math.ceil(total_entries_count / items)
 
         return {
@@ -26,6 +59,212 @@ def pagination_utility(total_entries: QuerySet, page: int, items: int) -> Dict:
             "total_pages": total_pages,
             "items": items,
             "total_entries": total_entries_count,
+            "is_total_approximate": is_total_approximate,
         }
     except Exception as e:
         print(e, traceback.format_exc())
+
+
+def get_total_entries_count(
+    total_entries: QuerySet,
+    count_strategy: str = CountStrategy.EXACT,
+    count_cache_key: Optional[str] = None,
+) -> Tuple[int, bool]:
+    """
+    Count the entries of a queryset with the given strategy.
+
+    - EXACT: `count()` query.
+    - CACHED: exact count stored in the cache under `count_cache_key`, kept until the
+      owner of the key invalidates it with `invalidate_count_cache`. Only when the default
+      cache is shared by the workers (e.g. Redis), an in-process cache would serve the
+      other workers a stale total, so they count exactly instead.
+    - ESTIMATE: planner row estimate of the table, only for unfiltered querysets on
+      PostgreSQL. Other querysets fall back to an exact count.
+
+    Args:
+        total_entries (QuerySet): QuerySet to count.
+        count_strategy (str, optional): One of `CountStrategy`. Defaults to CountStrategy.EXACT.
+        count_cache_key (str, optional): Cache key used by CountStrategy.CACHED.
+
+    Returns:
+        tuple: The total and whether it is an approximation.
+    """
+    use_cache = count_strategy == CountStrategy.CACHED and count_cache_key
+    if use_cache and is_shared_cache(caches[DEFAULT_CACHE_ALIAS]):
+        total_entries_count = cache.get(count_cache_key)
+        if total_entries_count is None:
+            total_entries_count = total_entries.count()
+            cache.set(count_cache_key, total_entries_count, COUNT_CACHE_TIMEOUT)
+        return total_entries_count, False
+
+    if count_strategy == CountStrategy.ESTIMATE:
+        estimated_count = get_estimated_count(total_entries)
+        if estimated_count is not None:
+            return estimated_count, True
+
+    return total_entries.count(), False
+
+
+def get_estimated_count(total_entries: QuerySet) -> Optional[int]:
+    """
+    Read the planner row estimate (`pg_class.reltuples`) of an unfiltered queryset's table.
+
+    Args:
+        total_entries (QuerySet): QuerySet to estimate.
+
+    Returns:
+        int: Estimated number of rows, or None when no estimate is available (filtered
+            queryset, non PostgreSQL database or table never analyzed).
+    """
+    connection = connections[total_entries.db]
+    if connection.vendor != "postgresql" or total_entries.query.where:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [total_entries.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    # reltuples is -1 for tables that were never vacuumed or analyzed
+    if not row or row[0] < 0:
+        return None
+    return row[0]
+
+
+def build_count_cache_key(namespace: str, scope, **filters) -> str:
+    """
+    Build the cache key of a listing total.
+
+    The key embeds a version number per (namespace, scope), bumping it with
+    `invalidate_count_cache` invalidates the totals of every filter of that scope at once.
+    The version starts at the current time in nanoseconds rather than at 1, so a version
+    evicted from the cache never starts again at a version whose totals are still cached.
+
+    Args:
+        namespace (str): Name of the listing, e.g. "content_count".
+        scope: Owner of the listing, e.g. the author id.
+        **filters: Filters applied to the listing.
+
+    Returns:
+        str: Cache key.
+    """
+    version = cache.get_or_set(f"{namespace}:version:{scope}", time.time_ns, timeout=None)
+    filters_digest = hashlib.md5(
+        json.dumps(filters, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"{namespace}:{scope}:{version}:{filters_digest}"
+
+
+def invalidate_count_cache(namespace: str, scope) -> None:
+    """
+    Invalidate all the cached totals of a (namespace, scope).
+
+    Args:
+        namespace (str): Name of the listing, e.g. "content_count".
+        scope: Owner of the listing, e.g. the author id.
+    """
+    try:
+        cache.incr(f"{namespace}:version:{scope}")
+    except ValueError:
+        # No version yet, nothing has been cached for this scope
+        pass
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator using the planner row estimate for unfiltered querysets.
+
+    Meant for admin changelists of large tables, where the exact `count()` dominates the
+    cost of every page.
+    """
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            estimated_count = get_estimated_count(self.object_list)
+            if estimated_count is not None:
+                return estimated_count
+        return super().count
+
+
+def encode_cursor(created_at: datetime, entry_id: int) -> str:
+    """
+    Encode the keyset position of an entry into an opaque cursor string.
+
+    Args:
+        created_at (datetime): Creation timestamp of the last entry on the page.
+        entry_id (int): Primary key of the last entry on the page.
+
+    Returns:
+        str: URL safe cursor string.
+    """
+    position = json.dumps([created_at.isoformat(), entry_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(position.encode("utf-8")).decode("utf-8").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """
+    Decode a cursor string produced by `encode_cursor`.
+
+    Args:
+        cursor (str): Cursor string received from the client.
+
+    Returns:
+        tuple: (created_at, id) of the last entry seen, or None if the cursor is invalid.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        created_at, entry_id = position
+        return datetime.fromisoformat(created_at), int(entry_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def cursor_pagination_utility(
+    total_entries: QuerySet, cursor: Optional[str], items: int
+) -> Tuple[List, Dict]:
+    """
+    Keyset pagination over entries ordered by newest first.
+
+    Entries are ordered by (created_at, id) descending and the page is selected with a
+    `WHERE (created_at, id) < cursor` condition instead of an OFFSET, so every page costs
+    the same index range scan regardless of its depth.
+
+    Args:
+        total_entries (QuerySet): QuerySet containing total entries.
+        cursor (str): Cursor of the previous page, empty or None for the first page.
+        items (int): Number of items per page.
+
+    Returns:
+        tuple: Entries of the page and the page details.
+
+    Raises:
+        ValueError: If the cursor can not be decoded.
+    """
+    entries = total_entries.order_by("-created_at", "-id")
+    if cursor:
+        position = decode_cursor(cursor)
+        if position is None:
+            raise ValueError("Invalid cursor")
+        created_at, entry_id = position
+        entries = entries.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=entry_id)
+        )
+
+    # Fetch one extra row to find out whether a next page exists
+    page_entries = list(entries[: items + 1])
+    has_next = len(page_entries) > items
+    page_entries = page_entries[:items]
+
+    next_cursor = None
+    if has_next:
+        last_entry = page_entries[-1]
+        next_cursor = encode_cursor(last_entry.created_at, last_entry.id)
+
+    return page_entries, {
+        "next_cursor": next_cursor,
+        "items": items,
+    }
@@ -0,0 +1,67 @@
+from typing import NamedTuple, Optional, Union
+import fitz
+
+
+class PdfDetails(NamedTuple):
+    """
+    Details extracted from a pdf file.
+    """
+
+    text: str
+    page_count: int
+    thumbnail: Optional[bytes]
+
+
+def extract_pdf_details(
+    pdf: Union[str, bytes], thumbnail_width: int = 320, max_text_length: Optional[int] = None
+) -> PdfDetails:
+    """
+    Extract the text, page count and a png thumbnail of the first page of a pdf file.
+
+    Pages are loaded one at a time, the text extraction stops once `max_text_length`
+    characters were extracted.
+
+    Args:
+        pdf (str | bytes): Path of the pdf file or its content.
+        thumbnail_width (int, optional): Width of the thumbnail in pixels. Defaults to 320.
+        max_text_length (int, optional): Maximum number of characters of text extracted.
+            Defaults to None, the whole text.
+
+    Returns:
+        PdfDetails: Text, page count and thumbnail (None for a pdf without pages).
+
+    Raises:
+        ValueError: If the file isn't a valid pdf.
+    """
+    try:
+        if isinstance(pdf, bytes):
+            document = fitz.open(stream=pdf, filetype="pdf")
+        else:
+            document = fitz.open(pdf, filetype="pdf")
+        with document:
+            return _read_pdf_details(document, thumbnail_width, max_text_length)
+    except (RuntimeError, fitz.mupdf.FzErrorBase) as e:
+        raise ValueError(f"Invalid pdf file: {e}") from e
+
+
+def _read_pdf_details(document, thumbnail_width, max_text_length):
+    texts, text_length = [], 0
+    for page in document:
+        if max_text_length is not None and text_length >= max_text_length:
+            break
+        page_text = page.get_text().strip()
+        if page_text:
+            texts.append(page_text)
+            text_length += len(page_text) + 1
+    text = "\n".join(texts)
+    if max_text_length is not None:
+        text = text[:max_text_length]
+
+    thumbnail = None
+    if document.page_count:
+        first_page = document[0]
+        zoom = thumbnail_width / max(first_page.rect.width, 1)
+        pixmap = first_page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        thumbnail = pixmap.tobytes("png")
+
+    return PdfDetails(text=text, page_count=document.page_count, thumbnail=thumbnail)
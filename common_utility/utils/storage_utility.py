@@ -0,0 +1,80 @@
+import os
+import re
+import uuid
+import hashlib
+import posixpath
+from typing import Optional
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+CONTENT_ADDRESSED_NAME_PATTERN = re.compile(
+    r"(?:^|/)[0-9a-f]{2}/[0-9a-f]{2}/(?P<sha256>[0-9a-f]{64})(?:\.\w+)?$"
+)
+
+
+class ContentAddressedStorageMixin:
+    """
+    Storage mixin naming files after the SHA-256 of their content, so a content saved
+    several times is only stored once.
+
+    A file is stored as `<directory>/<aa>/<bb>/<sha256><extension>`, the directory and
+    extension coming from the name it's saved with (e.g. the `upload_to` of a FileField).
+    Saving a content that is already stored returns the name of the stored file without
+    writing anything. Files uploaded through `StreamedUploadedFile` aren't read again,
+    their digest was computed while they were received.
+
+    Concurrent saves of a content write the same file: storages have to overwrite it
+    atomically instead of picking another name. A stored file may be deleted once no
+    content references it, references are checked by `cms_app.pdf_blobs`.
+    """
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        sha256 = getattr(content, "sha256", None) or self.get_content_sha256(content)
+        directory, file_name = posixpath.split(name.replace("\\", "/"))
+        extension = posixpath.splitext(file_name)[1].lower()
+        name = posixpath.join(directory, sha256[:2], sha256[2:4], f"{sha256}{extension}")
+
+        # Only saves a write, a file saved or deleted concurrently is handled by the
+        # overwrite and by the reference check
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length=max_length)
+
+    def get_available_name(self, name, max_length=None):
+        # The name of a content is the same whether it's stored or not
+        return name
+
+    def get_content_sha256(self, content) -> str:
+        sha256 = hashlib.sha256()
+        for chunk in content.chunks():
+            sha256.update(chunk)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def get_name_sha256(name: Optional[str]) -> Optional[str]:
+        """
+        Return the SHA-256 a file name was built from, None for other names.
+        """
+        match = CONTENT_ADDRESSED_NAME_PATTERN.search(name or "")
+        return match["sha256"] if match else None
+
+
+class ContentAddressedFileSystemStorage(ContentAddressedStorageMixin, FileSystemStorage):
+    def _save(self, name, content):
+        # Written to a temporary file renamed over the stored file, so concurrent saves of
+        # a content don't write into the same file and it's never read partially written
+        directory, file_name = posixpath.split(name)
+        temporary_name = super()._save(
+            posixpath.join(directory, f".{uuid.uuid4().hex}.{file_name}.part"), content
+        )
+        try:
+            os.replace(self.path(temporary_name), self.path(name))
+        except OSError:
+            self.delete(temporary_name)
+            raise
+        return name
@@ -0,0 +1,57 @@
+import json
+from typing import Iterable, Iterator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+
+class RawJSONString:
+    """
+    JSON string value streamed from chunks that don't need escaping, e.g. Base64 chunks
+    of `iter_file_base64`.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = chunks
+
+
+def iter_json(value) -> Iterator[bytes]:
+    """
+    Encode a value to JSON piece by piece, streaming the `RawJSONString` it contains.
+
+    Args:
+        value: JSON serializable value (DjangoJSONEncoder), dicts and lists may contain
+            `RawJSONString` values.
+
+    Yields:
+        bytes: Pieces of the JSON document.
+    """
+    if isinstance(value, RawJSONString):
+        yield b'"'
+        yield from value.chunks
+        yield b'"'
+    elif isinstance(value, dict):
+        yield b"{"
+        for index, (key, item) in enumerate(value.items()):
+            yield (", " if index else "").encode() + json.dumps(str(key)).encode() + b": "
+            yield from iter_json(item)
+        yield b"}"
+    elif isinstance(value, (list, tuple)):
+        yield b"["
+        for index, item in enumerate(value):
+            if index:
+                yield b", "
+            yield from iter_json(item)
+        yield b"]"
+    else:
+        yield json.dumps(value, cls=DjangoJSONEncoder).encode()
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    JSON response streamed as it's encoded, to embed large values (e.g. a file in Base64)
+    at constant memory.
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(streaming_content=iter_json(data), **kwargs)
@@ -0,0 +1,122 @@
+import re
+import json
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import List, Optional
+from django.conf import settings
+
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+WORD_PATTERN = re.compile(r"\w+")
+
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be but by for from has have he her his i in is it its of on or
+    our she that the their them they this to was we were will with you your
+    """.split()
+)
+
+
+class Summarizer(ABC):
+    """
+    Backend summarizing texts, several texts at once so remote models are called once
+    per batch.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """
+        Identifies the backend and its options, summaries are cached per name.
+        """
+
+    @abstractmethod
+    def summarize_batch(self, texts: List[str]) -> List[str]:
+        """
+        Summarize texts.
+
+        Args:
+            texts (list): Texts to summarize.
+
+        Returns:
+            list: The summary of every text, in the same order.
+        """
+
+
+class ExtractiveSummarizer(Summarizer):
+    """
+    Local summarizer keeping the sentences made of the most frequent words of the text,
+    in their original order. Runs offline.
+    """
+
+    def __init__(self, max_sentences: Optional[int] = None):
+        self.max_sentences = max_sentences or settings.CONTENT_SUMMARY_MAX_SENTENCES
+
+    @property
+    def name(self) -> str:
+        return f"extractive:{self.max_sentences}"
+
+    def summarize(self, text: str) -> str:
+        sentences = [sentence for sentence in SENTENCE_PATTERN.split(text.strip()) if sentence]
+        if len(sentences) <= self.max_sentences:
+            return text.strip()
+
+        sentence_words = [
+            [word for word in WORD_PATTERN.findall(sentence.lower()) if word not in STOP_WORDS]
+            for sentence in sentences
+        ]
+        word_counts = Counter(word for words in sentence_words for word in words)
+        scores = [
+            sum(word_counts[word] for word in words) / len(words) if words else 0.0
+            for words in sentence_words
+        ]
+        best_indexes = sorted(
+            sorted(range(len(sentences)), key=lambda index: -scores[index])[
+                : self.max_sentences
+            ]
+        )
+        return " ".join(sentences[index] for index in best_indexes)
+
+    def summarize_batch(self, texts: List[str]) -> List[str]:
+        return [self.summarize(text) for text in texts]
+
+
+class OpenAISummarizer(Summarizer):
+    """
+    Summarizer asking an OpenAI chat model for the summaries of a whole batch in one call.
+    """
+
+    def __init__(self, model: Optional[str] = None, api_key: Optional[str] = None):
+        # Optional dependency, only needed when this backend is configured
+        from openai import OpenAI
+
+        self.model = model or settings.OPENAI_SUMMARY_MODEL
+        self.client = OpenAI(
+            api_key=api_key or settings.OPENAI_API_KEY,
+            timeout=settings.OPENAI_TIMEOUT,
+        )
+
+    @property
+    def name(self) -> str:
+        return f"openai:{self.model}"
+
+    def summarize_batch(self, texts: List[str]) -> List[str]:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            temperature=0,
+            response_format={"type": "json_object"},
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "Summarize each text of the JSON array sent by the user in one or "
+                        "two sentences. Reply with a JSON object "
+                        '{"summaries": [...]} holding one summary per text, in order.'
+                    ),
+                },
+                {"role": "user", "content": json.dumps(texts)},
+            ],
+        )
+        summaries = json.loads(response.choices[0].message.content)["summaries"]
+        if not isinstance(summaries, list) or len(summaries) != len(texts):
+            raise ValueError("The model didn't return one summary per text.")
+        return [str(summary).strip() for summary in summaries]
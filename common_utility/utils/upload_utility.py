@@ -0,0 +1,209 @@
+import os
+import uuid
+import hashlib
+from typing import Callable, Dict, Optional
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import (
+    FileUploadHandler,
+    StopFutureHandlers,
+    StopUpload,
+)
+
+# Every PDF file starts with this header
+PDF_MAGIC_BYTES = b"%PDF-"
+
+# Size of the blocks files are hashed and copied with
+FILE_BLOCK_SIZE = 1024 * 1024
+
+
+class StreamedUploadedFile(UploadedFile):
+    """
+    An uploaded file already written to a partial file of its final storage.
+
+    Exposes `temporary_file_path` so `FileSystemStorage` moves the partial file in place
+    when the model is saved instead of copying it.
+
+    Attributes:
+        sha256 (str): Hex SHA-256 digest of the file.
+        delete_on_close (bool): Whether the partial file is removed when the file is closed
+            without having been saved, e.g. when the request fails validation.
+    """
+
+    def __init__(
+        self,
+        file,
+        name,
+        content_type,
+        size,
+        charset=None,
+        content_type_extra=None,
+        sha256=None,
+        delete_on_close=True,
+    ):
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+        self.sha256 = sha256
+        self.delete_on_close = delete_on_close
+
+    def temporary_file_path(self) -> str:
+        return self.file.name
+
+    def close(self):
+        try:
+            return self.file.close()
+        finally:
+            if self.delete_on_close:
+                # Already moved to its final name if the file was saved
+                try:
+                    os.remove(self.file.name)
+                except FileNotFoundError:
+                    pass
+
+
+class StreamingUploadHandler(FileUploadHandler):
+    """
+    Upload handler writing the chunks of the accepted files straight to a partial file
+    of a `FileSystemStorage`, hashing them and enforcing their size and type as they come.
+
+    A file failing a check stops the upload without reading the rest of the request and
+    its error is recorded in the `rejected_uploads` of the request, see
+    `get_rejected_uploads`. Files of other fields are left to the next handlers.
+    """
+
+    def __init__(
+        self,
+        request=None,
+        storage=None,
+        directory: str = "",
+        accept_field: Optional[Callable[[str], bool]] = None,
+        max_size: Optional[int] = None,
+        max_size_message: Optional[str] = None,
+        magic_bytes: Optional[bytes] = None,
+        magic_bytes_message: Optional[str] = None,
+    ):
+        super().__init__(request)
+        self.storage = storage
+        self.directory = directory
+        self.accept_field = accept_field
+        self.max_size = max_size
+        self.max_size_message = max_size_message or f"File exceeds {max_size} bytes."
+        self.magic_bytes = magic_bytes or b""
+        self.magic_bytes_message = magic_bytes_message or "Invalid file type."
+        self.activated = False
+
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        self.activated = self.accept_field is None or self.accept_field(field_name)
+        if not self.activated:
+            return
+
+        if self.max_size and self.content_length and self.content_length > self.max_size:
+            self.reject(self.max_size_message)
+
+        full_path = self.storage.path(
+            os.path.join(self.directory, f"{uuid.uuid4().hex}.part")
+        )
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        self.file = open(full_path, "w+b")
+        self.sha256 = hashlib.sha256()
+        self.header = b""
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.activated:
+            return raw_data
+
+        if len(self.header) < len(self.magic_bytes):
+            self.header += raw_data[: len(self.magic_bytes) - len(self.header)]
+            if not self.magic_bytes.startswith(self.header):
+                self.reject(self.magic_bytes_message)
+        if self.max_size and start + len(raw_data) > self.max_size:
+            self.reject(self.max_size_message)
+
+        self.sha256.update(raw_data)
+        self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        if not self.activated:
+            return None
+        self.activated = False
+
+        if self.header != self.magic_bytes:
+            # Shorter than the magic bytes
+            self.reject(self.magic_bytes_message)
+
+        # The file is handed over to the uploaded file, which closes it
+        file = self.file
+        del self.file
+        file.flush()
+        file.seek(0)
+        return StreamedUploadedFile(
+            file=file,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+            sha256=self.sha256.hexdigest(),
+        )
+
+    def upload_interrupted(self):
+        if self.activated:
+            self.discard_file()
+
+    def reject(self, message: str):
+        """
+        Record why the current file is rejected and stop reading the upload.
+
+        Raises:
+            StopUpload: Always, so the rest of the request body isn't read.
+        """
+        if self.request is not None:
+            rejected_uploads = getattr(self.request, "rejected_uploads", {})
+            rejected_uploads[self.field_name] = [message]
+            self.request.rejected_uploads = rejected_uploads
+        self.discard_file()
+        raise StopUpload(connection_reset=True)
+
+    def discard_file(self):
+        self.activated = False
+        file = getattr(self, "file", None)
+        if file is None:
+            return
+        del self.file
+        file.close()
+        try:
+            os.remove(file.name)
+        except FileNotFoundError:
+            pass
+
+
+def get_rejected_uploads(request) -> Dict[str, list]:
+    """
+    Parse the request body and return the files rejected by a `StreamingUploadHandler`.
+
+    Args:
+        request: The DRF request.
+
+    Returns:
+        dict: Error messages of the rejected files by field name.
+    """
+    request.data  # Parsing the body runs the upload handlers
+    return getattr(request._request, "rejected_uploads", {})
+
+
+def get_file_sha256(file) -> str:
+    """
+    Hash an open binary file block by block.
+
+    Args:
+        file: File object opened in binary mode, read from its start.
+
+    Returns:
+        str: Hex SHA-256 digest of the file.
+    """
+    sha256 = hashlib.sha256()
+    file.seek(0)
+    for block in iter(lambda: file.read(FILE_BLOCK_SIZE), b""):
+        sha256.update(block)
+    return sha256.hexdigest()
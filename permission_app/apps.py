@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PermissionAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'permission_app'
+
+    def ready(self):
+        # Connect the signal receivers
+        from permission_app import signals  # noqa: F401
@@ -1,6 +1,7 @@
 from django.db import transaction
 from django.core.management.base import BaseCommand
 from permission_app.models import RoleMaster
+from permission_app.roles import role_registry
 
 
 class Command(BaseCommand):
@@ -34,6 +35,8 @@ class Command(BaseCommand):
 
                 # Bulk create roles
                 RoleMaster.objects.bulk_create(roles_to_add_list)
+                # bulk_create doesn't send post_save
+                role_registry.refresh()
                 # Print success message
                 self.stdout.write(
                     self.style.SUCCESS("=====================================\n")
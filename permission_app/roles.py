@@ -0,0 +1,103 @@
+import time
+import threading
+from typing import Dict, Optional, Set, Tuple
+from django.conf import settings
+from permission_app.models import RoleMaster
+
+
+class RoleRegistry:
+    """
+    Process-wide registry of the roles, loaded in one query on first use so resolving a
+    role doesn't query the database on request paths.
+
+    The registry is refreshed when a role is saved or deleted (see
+    `permission_app.signals`) or seeded, and reloaded after ROLE_REGISTRY_TIMEOUT seconds
+    to pick up the changes made by other processes. A role missing from the registry
+    reloads it once before being reported missing, then is reported missing without
+    reloading until the registry is refreshed.
+
+    The returned roles are shared and must not be modified.
+    """
+
+    def __init__(self):
+        # Load time, roles by ID, roles by name, and the IDs and names found missing
+        self._roles: Optional[
+            Tuple[
+                float, Dict[int, RoleMaster], Dict[str, RoleMaster], Set[int], Set[str]
+            ]
+        ] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _is_stale(roles) -> bool:
+        return (
+            roles is None
+            or roles[0] + settings.ROLE_REGISTRY_TIMEOUT <= time.monotonic()
+        )
+
+    def _load(self, reload: bool = False):
+        roles = self._roles
+        if reload or self._is_stale(roles):
+            with self._lock:
+                # Loaded by another thread while this one was waiting
+                if self._roles is not roles and not self._is_stale(self._roles):
+                    return self._roles
+                role_list = list(RoleMaster.objects.all())
+                roles = (
+                    time.monotonic(),
+                    {role.id: role for role in role_list},
+                    {role.name: role for role in role_list},
+                    set(),
+                    set(),
+                )
+                self._roles = roles
+        return roles
+
+    def get(self, role_id: Optional[int]) -> Optional[RoleMaster]:
+        """
+        The role with an ID, None if there is none.
+        """
+        if role_id is None:
+            return None
+        roles = self._load()
+        role = roles[1].get(role_id)
+        if role is None and role_id not in roles[3]:
+            roles = self._load(reload=True)
+            role = roles[1].get(role_id)
+            if role is None:
+                roles[3].add(role_id)
+        return role
+
+    def get_name(self, role_id: Optional[int]) -> Optional[str]:
+        """
+        The name of the role with an ID, None if there is none.
+        """
+        role = self.get(role_id)
+        return role.name if role is not None else None
+
+    def get_by_name(self, name: str) -> RoleMaster:
+        """
+        The role with a name.
+
+        Raises:
+            RoleMaster.DoesNotExist: If there is no role with this name.
+        """
+        roles = self._load()
+        role = roles[2].get(name)
+        if role is None and name not in roles[4]:
+            roles = self._load(reload=True)
+            role = roles[2].get(name)
+            if role is None:
+                roles[4].add(name)
+        if role is None:
+            raise RoleMaster.DoesNotExist(f"Role {name} does not exist.")
+        return role
+
+    def refresh(self) -> None:
+        """
+        Drop the loaded roles, they are loaded again on next use.
+        """
+        self._roles = None
+
+
+role_registry = RoleRegistry()
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from permission_app.models import RoleMaster
+from permission_app.roles import role_registry
+
+
+@receiver(post_save, sender=RoleMaster)
+@receiver(post_delete, sender=RoleMaster)
+def refresh_role_registry(sender, instance, **kwargs):
+    """
+    Reload the role registry after a role is saved or deleted.
+    """
+    role_registry.refresh()
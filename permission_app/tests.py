@@ -1,3 +1,56 @@
+import io
+from django.core.management import call_command
 from django.test import TestCase
+from permission_app.models import RoleMaster
+from permission_app.roles import role_registry
+from common_utility.utils.constants import Role
 
-# Create your tests here.
+
+class RoleRegistryTest(TestCase):
+    """
+    Tests for the in-memory role registry.
+    """
+
+    def setUp(self):
+        self.role = RoleMaster.objects.create(name=Role.AUTHER)
+
+    def test_roles_are_loaded_once(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(role_registry.get_by_name(Role.AUTHER), self.role)
+        with self.assertNumQueries(0):
+            self.assertEqual(role_registry.get_name(self.role.id), Role.AUTHER)
+            self.assertIsNone(role_registry.get(None))
+
+    def test_saving_a_role_refreshes_the_registry(self):
+        role_registry.get_by_name(Role.AUTHER)
+
+        self.role.name = "EDITOR_ROLE"
+        self.role.save()
+        self.assertEqual(role_registry.get_name(self.role.id), "EDITOR_ROLE")
+        # A missing role reloads the registry once before being reported missing
+        with self.assertNumQueries(1), self.assertRaises(RoleMaster.DoesNotExist):
+            role_registry.get_by_name(Role.AUTHER)
+        with self.assertNumQueries(0), self.assertRaises(RoleMaster.DoesNotExist):
+            role_registry.get_by_name(Role.AUTHER)
+
+    def test_missing_role_id_is_reloaded_once(self):
+        role_registry.get(self.role.id)
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(role_registry.get(self.role.id + 1))
+        with self.assertNumQueries(0):
+            self.assertIsNone(role_registry.get(self.role.id + 1))
+
+        # Until the next refresh
+        RoleMaster.objects.create(id=self.role.id + 1, name=Role.SUPER_ADMIN)
+        self.assertEqual(role_registry.get_name(self.role.id + 1), Role.SUPER_ADMIN)
+
+    def test_seeded_roles_are_registered(self):
+        role_registry.get_by_name(Role.AUTHER)
+
+        call_command("seed_roles_and_tabs", stdout=io.StringIO())
+        # Reloaded, with the roles bulk created by the command
+        with self.assertNumQueries(1):
+            self.assertEqual(role_registry.get_by_name(Role.AUTHER), self.role)
+        with self.assertNumQueries(0):
+            self.assertEqual(role_registry.get_by_name(Role.SUPER_ADMIN).name, Role.SUPER_ADMIN)
@@ -1,6 +1,24 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class UsersInfoConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users_info'
+
+    def ready(self):
+        # Connect the signal receivers
+        from users_info import signals  # noqa: F401
+
+        from common_utility.utils.jwt_utility import ASYMMETRIC_ALGORITHMS
+
+        if settings.JWT_ALGORITHM in ASYMMETRIC_ALGORITHMS:
+            from django.utils.functional import SimpleLazyObject
+            from rest_framework_simplejwt.tokens import Token
+            from users_info.jwt_keys import build_token_backend, get_jwt_key_set
+
+            # All the token classes sign and verify with the key set, loaded on first use
+            # so commands like generate_jwt_key run before any key exists
+            Token._token_backend = SimpleLazyObject(
+                lambda: build_token_backend(get_jwt_key_set())
+            )
@@ -0,0 +1,107 @@
+from typing import Optional, Tuple
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from permission_app.roles import role_registry
+from users_info.models import UserDetails
+from common_utility.utils.cache_utility import get_cache_backend
+
+# Fields of a user snapshot, in the order of the model fields
+USER_SNAPSHOT_FIELDS = ["id", "role_id", "is_superuser", "is_active"]
+
+# User snapshots by user id. Uses an in-process LRU cache unless a Django cache alias is
+# configured, entries of other processes expire after AUTH_USER_CACHE_TIMEOUT.
+user_snapshot_cache = get_cache_backend(
+    alias=settings.AUTH_USER_CACHE_ALIAS,
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+)
+
+
+def get_user_snapshot_key(user_id) -> str:
+    return f"auth_user:{user_id}"
+
+
+def get_user_snapshot(user_id) -> Optional[Tuple]:
+    """
+    The snapshot of a user needed to authenticate and authorize a request, loaded in one
+    query on a cache miss.
+
+    Returns:
+        tuple: Values of USER_SNAPSHOT_FIELDS, None if the user doesn't exist.
+    """
+    cache_key = get_user_snapshot_key(user_id)
+    snapshot = user_snapshot_cache.get(cache_key)
+    if snapshot is None:
+        snapshot = (
+            UserDetails.objects.filter(id=user_id)
+            .values_list(*USER_SNAPSHOT_FIELDS)
+            .first()
+        )
+        if snapshot is None:
+            return None
+        user_snapshot_cache.set(cache_key, snapshot, settings.AUTH_USER_CACHE_TIMEOUT)
+    return snapshot
+
+
+def invalidate_user_snapshot(user_id) -> None:
+    """
+    Drop the cached snapshot of a user.
+    """
+    user_snapshot_cache.delete(get_user_snapshot_key(user_id))
+
+
+def build_snapshot_user(snapshot: Tuple) -> UserDetails:
+    """
+    A user instance holding the fields of a snapshot and its role from the role registry,
+    the other fields are deferred: they are loaded on access and saving it only writes the
+    loaded fields.
+    """
+    user = UserDetails.from_db(DEFAULT_DB_ALIAS, USER_SNAPSHOT_FIELDS, snapshot)
+    role = role_registry.get(user.role_id)
+    if role is not None:
+        user.role = role
+    return user
+
+
+def get_full_user(user: UserDetails) -> UserDetails:
+    """
+    The user with all its fields, a snapshot user is loaded in one query instead of one
+    query per deferred field.
+    """
+    if not user.get_deferred_fields():
+        return user
+    return UserDetails.objects.get(pk=user.pk)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    `JWTAuthentication` resolving the user of a token from a cached snapshot (id, active
+    and superuser flags, role) instead of loading it, so authenticating a request and
+    checking its role run no query once the snapshot is cached.
+
+    The request user only has the snapshot fields loaded, views needing the other fields
+    use `get_full_user`. Snapshots are invalidated when the user is saved or deleted, see
+    `users_info.signals`, and roles are resolved by the role registry.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN or api_settings.USER_ID_FIELD != "id":
+            # Needs the password hash or another lookup field
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        snapshot = get_user_snapshot(user_id)
+        if snapshot is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        user = build_snapshot_user(snapshot)
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
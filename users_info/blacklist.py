@@ -0,0 +1,240 @@
+import time
+import traceback
+import threading
+from datetime import timedelta
+from typing import Iterable, Iterator, Optional
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+from common_utility.utils.bloom_filter_utility import BloomFilter, RedisBloomFilter
+from common_utility.utils.cache_utility import get_cache_backend
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - optional dependency
+    # Without redis-py there is no Redis filter to fail
+    RedisError = ()
+
+# Tokens blacklisted by transactions still running when a filter is built are added to it
+# again once it's swapped in
+REBUILD_OVERLAP = timedelta(seconds=60)
+
+
+class TokenBlacklistFilter:
+    """
+    Negative lookup of the blacklisted refresh tokens, to check most tokens, the ones that
+    aren't blacklisted, without querying `BlacklistedToken`.
+
+    A bloom filter of the jtis of the unexpired blacklisted tokens answers "not
+    blacklisted" without a query, the other answers are checked in the DB and the
+    blacklisted jtis kept in a cache of recent positives.
+
+    Blacklisted tokens are added to the filter as soon as they are written (`add`, called
+    by the signal receivers and `blacklist_user_tokens`). The filter is built again every
+    `rebuild_interval` seconds to drop the expired tokens and, for a local filter, pick up
+    the tokens blacklisted by the other processes.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        rebuild_interval: int,
+        positive_cache,
+        positive_cache_timeout: Optional[int] = None,
+        redis_client=None,
+        key: str = "token_blacklist_filter",
+    ):
+        """
+        Args:
+            capacity (int): Blacklisted tokens the filter is sized for.
+            error_rate (float): False positive rate of the filter at `capacity` tokens.
+            rebuild_interval (int): Seconds after which the filter is built again.
+            positive_cache: Cache backend of the blacklisted jtis (`get_cache_backend`).
+            positive_cache_timeout (int, optional): Seconds the blacklisted jtis are cached.
+            redis_client (optional): A redis-py client sharing the filter between all the
+                processes, the filter is local to the process if None.
+            key (str, optional): Key of the Redis filter.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.positive_cache = positive_cache
+        self.positive_cache_timeout = positive_cache_timeout
+        self._redis_filter = (
+            RedisBloomFilter(redis_client, key, capacity, error_rate)
+            if redis_client is not None
+            else None
+        )
+        # Local filter and its build time
+        self._filter = None
+        self._built_at = 0.0
+        self._build_lock = threading.Lock()
+
+    @property
+    def is_shared(self) -> bool:
+        """
+        Whether the filter is shared by all the processes through Redis. A local filter
+        misses the tokens blacklisted by the other processes until it's built again.
+        """
+        return self._redis_filter is not None
+
+    def get_positive_key(self, jti: str) -> str:
+        return f"token_blacklist:{jti}"
+
+    def _get_blacklisted_jtis(self, since=None) -> Iterator[str]:
+        queryset = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        if since is not None:
+            queryset = queryset.filter(blacklisted_at__gte=since)
+        return queryset.values_list("token__jti", flat=True).iterator()
+
+    def rebuild(self) -> None:
+        """
+        Build the filter from the unexpired blacklisted tokens and swap it in.
+        """
+        started_at = timezone.now()
+        bloom_filter = BloomFilter(self.capacity, self.error_rate)
+        bloom_filter.add(self._get_blacklisted_jtis())
+        if self._redis_filter is not None:
+            self._redis_filter.replace(bloom_filter, timeout=self.rebuild_interval)
+        else:
+            self._filter, self._built_at = bloom_filter, time.monotonic()
+        # Added to the previous filter while this one was built
+        self.add(self._get_blacklisted_jtis(since=started_at - REBUILD_OVERLAP))
+
+    def _might_be_blacklisted(self, jti: str) -> Optional[bool]:
+        """
+        The answer of the filter, None when there is no built filter to ask or Redis
+        can't be reached.
+        """
+        if self._redis_filter is not None:
+            try:
+                might_be_blacklisted = self._redis_filter.contains(jti)
+                # Expired: one process builds it again, the others query the DB meanwhile
+                if (
+                    might_be_blacklisted is None
+                    and self._redis_filter.acquire_build_lock(self.rebuild_interval)
+                ):
+                    self.rebuild()
+                    might_be_blacklisted = self._redis_filter.contains(jti)
+            except RedisError as e:
+                print(e, traceback.format_exc())
+                return None
+            return might_be_blacklisted
+
+        if time.monotonic() - self._built_at >= self.rebuild_interval:
+            # The other threads use the previous filter meanwhile
+            if self._build_lock.acquire(blocking=False):
+                try:
+                    self.rebuild()
+                finally:
+                    self._build_lock.release()
+        bloom_filter = self._filter
+        return None if bloom_filter is None else jti in bloom_filter
+
+    def is_blacklisted(self, jti: str) -> bool:
+        """
+        Whether the token with a jti is blacklisted, without a query for most tokens.
+        """
+        if self.positive_cache.get(self.get_positive_key(jti)):
+            return True
+        if self._might_be_blacklisted(jti) is False:
+            return False
+        if not BlacklistedToken.objects.filter(token__jti=jti).exists():
+            return False
+        self.positive_cache.set(
+            self.get_positive_key(jti), True, timeout=self.positive_cache_timeout
+        )
+        return True
+
+    def add(self, jtis: Iterable[str]) -> None:
+        """
+        Add blacklisted jtis to the filter.
+
+        Called as soon as the tokens are blacklisted, before the transaction commits: a
+        rolled back blacklisting only leaves a false positive, checked in the DB.
+        """
+        jtis = list(jtis)
+        if self._redis_filter is not None:
+            self._redis_filter.add(jtis)
+        elif self._filter is not None:
+            self._filter.add(jtis)
+
+    def forget(self, jti: str) -> None:
+        """
+        Drop the cached positive of a jti removed from the blacklist. The filter keeps it
+        until it's built again, the lookups check it in the DB meanwhile.
+        """
+        self.positive_cache.delete(self.get_positive_key(jti))
+
+
+def get_token_blacklist_filter() -> TokenBlacklistFilter:
+    """
+    The token blacklist filter configured in the settings, shared through Redis when
+    TOKEN_BLACKLIST_FILTER_REDIS_URL is set.
+    """
+    redis_client = None
+    if settings.TOKEN_BLACKLIST_FILTER_REDIS_URL:
+        import redis
+
+        redis_client = redis.Redis.from_url(settings.TOKEN_BLACKLIST_FILTER_REDIS_URL)
+    return TokenBlacklistFilter(
+        capacity=settings.TOKEN_BLACKLIST_FILTER_CAPACITY,
+        error_rate=settings.TOKEN_BLACKLIST_FILTER_ERROR_RATE,
+        rebuild_interval=settings.TOKEN_BLACKLIST_FILTER_REBUILD_INTERVAL,
+        positive_cache=get_cache_backend(
+            alias=settings.TOKEN_BLACKLIST_CACHE_ALIAS,
+            max_entries=settings.TOKEN_BLACKLIST_CACHE_MAX_ENTRIES,
+        ),
+        positive_cache_timeout=settings.TOKEN_BLACKLIST_CACHE_TIMEOUT,
+        redis_client=redis_client,
+    )
+
+
+token_blacklist_filter = get_token_blacklist_filter()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """
+    Refresh token checking the blacklist through `token_blacklist_filter`.
+    """
+
+    def check_blacklist(self) -> None:
+        if token_blacklist_filter.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+
+def blacklist_user_tokens(user) -> int:
+    """
+    Blacklist the outstanding refresh tokens of a user, e.g. to log them out of every
+    session.
+
+    The tokens to blacklist are selected in SQL, expired and already blacklisted tokens
+    excluded, and inserted in one query: no token is decoded.
+
+    Args:
+        user: The user, or its ID.
+
+    Returns:
+        int: Number of tokens blacklisted.
+    """
+    tokens = list(
+        OutstandingToken.objects.filter(
+            user=user, expires_at__gt=timezone.now(), blacklistedtoken__isnull=True
+        ).values_list("id", "jti")
+    )
+    # Tokens blacklisted concurrently are skipped
+    BlacklistedToken.objects.bulk_create(
+        [BlacklistedToken(token_id=token_id) for token_id, jti in tokens],
+        ignore_conflicts=True,
+    )
+    # bulk_create sends no post_save signal
+    token_blacklist_filter.add(jti for token_id, jti in tokens)
+    return len(tokens)
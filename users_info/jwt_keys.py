@@ -0,0 +1,184 @@
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import jwt
+from jwt.algorithms import get_default_algorithms, has_crypto
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+from common_utility.utils.jwt_utility import ASYMMETRIC_ALGORITHMS
+
+KEY_FILE_SUFFIX = ".pem"
+
+
+def generate_private_key_pem(algorithm: str) -> bytes:
+    """
+    A new PKCS8 PEM encoded private key for an asymmetric algorithm: RSA 2048 for RS*,
+    Ed25519 for EdDSA.
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+    if algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+class JWTKeySet:
+    """
+    Private keys signing the JWTs, identified by the `kid` header of the tokens.
+
+    The active key signs the new tokens, the other keys only verify the tokens they
+    signed. Rotating the keys means adding a key, publishing it (JWKS endpoint) before
+    activating it, then removing the previous key once the tokens it signed expired.
+
+    Attributes:
+        algorithm (str): The signing algorithm, one of ASYMMETRIC_ALGORITHMS.
+        active_kid (str): The `kid` of the signing key.
+    """
+
+    def __init__(
+        self, algorithm: str, private_keys: Dict[str, Any], active_kid: Optional[str] = None
+    ):
+        """
+        Args:
+            algorithm (str): The signing algorithm.
+            private_keys (dict): Private keys by `kid`.
+            active_kid (str, optional): The `kid` of the signing key, defaults to the last
+                `kid` in sort order, e.g. the newest of timestamped `kid`s.
+        """
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ImproperlyConfigured(f"{algorithm} isn't an asymmetric JWT algorithm.")
+        if not private_keys:
+            raise ImproperlyConfigured(f"No private key to sign {algorithm} JWTs with.")
+        active_kid = active_kid or max(private_keys)
+        if active_kid not in private_keys:
+            raise ImproperlyConfigured(f"No private key with the kid {active_kid}.")
+
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self._private_keys = private_keys
+        # Parsed once, PyJWT accepts key objects instead of PEM strings
+        self._public_keys = {kid: key.public_key() for kid, key in private_keys.items()}
+        algorithm_object = get_default_algorithms()[algorithm]
+        self._jwks = {
+            "keys": [
+                {
+                    **algorithm_object.to_jwk(public_key, as_dict=True),
+                    "kid": kid,
+                    "alg": algorithm,
+                    "use": "sig",
+                }
+                for kid, public_key in sorted(self._public_keys.items())
+            ]
+        }
+
+    @classmethod
+    def from_directory(
+        cls, keys_dir: str, algorithm: str, active_kid: Optional[str] = None
+    ) -> "JWTKeySet":
+        """
+        Load the `<kid>.pem` private keys of a directory.
+        """
+        algorithm_object = get_default_algorithms()[algorithm]
+        private_keys = {}
+        if os.path.isdir(keys_dir):
+            for file_name in sorted(os.listdir(keys_dir)):
+                if not file_name.endswith(KEY_FILE_SUFFIX):
+                    continue
+                with open(os.path.join(keys_dir, file_name), "rb") as key_file:
+                    key = algorithm_object.prepare_key(key_file.read())
+                if not hasattr(key, "public_key"):
+                    raise ImproperlyConfigured(f"{file_name} isn't a private key.")
+                private_keys[file_name[: -len(KEY_FILE_SUFFIX)]] = key
+        return cls(algorithm, private_keys, active_kid=active_kid)
+
+    @property
+    def signing_key(self):
+        return self._private_keys[self.active_kid]
+
+    def get_public_key(self, kid: Optional[str]):
+        """
+        The public key with a `kid`, None if there is none.
+        """
+        return self._public_keys.get(kid)
+
+    def jwks(self) -> Dict[str, List[dict]]:
+        """
+        The public keys as a JWKS document.
+        """
+        return self._jwks
+
+
+@lru_cache(maxsize=None)
+def get_jwt_key_set() -> JWTKeySet:
+    """
+    The key set of JWT_KEYS_DIR, loaded once per process: rotated keys are picked up
+    when the workers restart.
+    """
+    return JWTKeySet.from_directory(
+        settings.JWT_KEYS_DIR, settings.JWT_ALGORITHM, active_kid=settings.JWT_ACTIVE_KID
+    )
+
+
+class KeySetTokenBackend(TokenBackend):
+    """
+    simplejwt token backend signing with the active key of a `JWTKeySet` and verifying
+    with the key named by the `kid` header of the token.
+    """
+
+    def __init__(self, key_set: JWTKeySet, **kwargs):
+        self.key_set = key_set
+        super().__init__(key_set.algorithm, key_set.signing_key, **kwargs)
+
+    def _validate_algorithm(self, algorithm: str) -> None:
+        # simplejwt doesn't list EdDSA
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise TokenBackendError(_("Unrecognized algorithm type '%s'") % algorithm)
+        if not has_crypto:
+            raise TokenBackendError(
+                _("You must have cryptography installed to use %s.") % algorithm
+            )
+
+    def get_verifying_key(self, token):
+        key = self.key_set.get_public_key(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise TokenBackendError(_("Token is invalid or expired"))
+        return key
+
+    def encode(self, payload: Dict[str, Any]) -> str:
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+
+        return jwt.encode(
+            jwt_payload,
+            self.signing_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.key_set.active_kid},
+            json_encoder=self.json_encoder,
+        )
+
+
+def build_token_backend(key_set: JWTKeySet) -> KeySetTokenBackend:
+    """
+    A token backend of a key set, with the claims settings of SIMPLE_JWT.
+    """
+    return KeySetTokenBackend(
+        key_set,
+        audience=api_settings.AUDIENCE,
+        issuer=api_settings.ISSUER,
+        leeway=api_settings.LEEWAY,
+        json_encoder=api_settings.JSON_ENCODER,
+    )
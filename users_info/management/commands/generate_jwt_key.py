@@ -0,0 +1,46 @@
+import os
+from datetime import datetime, timezone as dt_timezone
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from common_utility.utils.jwt_utility import ASYMMETRIC_ALGORITHMS
+from users_info.jwt_keys import KEY_FILE_SUFFIX, generate_private_key_pem
+
+
+class Command(BaseCommand):
+    help = (
+        "Add a private key signing the JWTs to JWT_KEYS_DIR. Named with a timestamp kid, "
+        "it becomes the active key once the workers restart, unless JWT_ACTIVE_KID is set. "
+        "Remove the previous key once the tokens it signed expired."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--algorithm",
+            default=settings.JWT_ALGORITHM,
+            choices=ASYMMETRIC_ALGORITHMS,
+            help="Signing algorithm, JWT_ALGORITHM by default.",
+        )
+        parser.add_argument(
+            "--kid", help="Key ID, the current UTC time (YYYYmmddTHHMMSS) by default."
+        )
+
+    def handle(self, *args, **options):
+        if options["algorithm"] not in ASYMMETRIC_ALGORITHMS:
+            raise CommandError(
+                f"{options['algorithm']} doesn't use keys, pass an --algorithm among "
+                f"{', '.join(ASYMMETRIC_ALGORITHMS)}."
+            )
+        kid = options["kid"] or datetime.now(dt_timezone.utc).strftime("%Y%m%dT%H%M%S")
+        key_path = os.path.join(settings.JWT_KEYS_DIR, f"{kid}{KEY_FILE_SUFFIX}")
+        if os.path.exists(key_path):
+            raise CommandError(f"The key {kid} already exists.")
+
+        os.makedirs(settings.JWT_KEYS_DIR, mode=0o700, exist_ok=True)
+        # Readable by the owner only
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as key_file:
+            key_file.write(generate_private_key_pem(options["algorithm"]))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Added the {options['algorithm']} key {kid} to {key_path}.")
+        )
@@ -1,5 +1,6 @@
 from django.contrib.auth.base_user import BaseUserManager
 from permission_app.models import RoleMaster
+from permission_app.roles import role_registry
 from common_utility.utils.constants import Role
 
 
@@ -30,7 +31,7 @@ class CustomManager(BaseUserManager):
         kwargs.setdefault("is_active", True)
         kwargs.setdefault("is_auther", True)
         try:
-            auther_role = RoleMaster.objects.get(name=Role.AUTHER)
+            auther_role = role_registry.get_by_name(Role.AUTHER)
         except RoleMaster.DoesNotExist:
             raise ValueError(f"Role {Role.AUTHER} does not exist in the database")
 
@@ -42,7 +43,7 @@ class CustomManager(BaseUserManager):
 
     def create_superuser(self, email: str, password: str, phone: str, **kwargs):
         try:
-            super_admin_role = RoleMaster.objects.get(name=Role.SUPER_ADMIN)
+            super_admin_role = role_registry.get_by_name(Role.SUPER_ADMIN)
         except RoleMaster.DoesNotExist:
             raise ValueError(f"Role {Role.SUPER_ADMIN} does not exist in the database")
         kwargs.setdefault("is_active", True)
@@ -0,0 +1,52 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import serializers
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+from users_info.blacklist import FilteredRefreshToken, token_blacklist_filter
+
+
+class TokenRefreshSerializer(serializers.TokenRefreshSerializer):
+    """
+    Refresh serializer checking the blacklist through the blacklist filter.
+
+    With BLACKLIST_AFTER_ROTATION, blacklisting the rotated token also rejects a token
+    blacklisted meanwhile, e.g. one refreshed concurrently or not yet in the filter of
+    this process. The new refresh token is added to the outstanding tokens of the user,
+    so logging out blacklists it as well. Without rotation, the blacklist is checked in
+    the DB unless the filter is shared through Redis.
+    """
+
+    token_class = FilteredRefreshToken
+
+    def validate(self, attrs):
+        if not (
+            api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION
+        ):
+            if not token_blacklist_filter.is_shared:
+                # The local filter misses the tokens blacklisted by the other processes
+                self.token_class = RefreshToken
+            return super().validate(attrs)
+
+        refresh = self.token_class(attrs["refresh"])
+        data = {"access": str(refresh.access_token)}
+
+        blacklisted_token, created = refresh.blacklist()
+        if not created:
+            raise TokenError(_("Token is blacklisted"))
+
+        refresh.set_jti()
+        refresh.set_exp()
+        refresh.set_iat()
+        data["refresh"] = str(refresh)
+
+        OutstandingToken.objects.create(
+            user_id=blacklisted_token.token.user_id,
+            jti=refresh[api_settings.JTI_CLAIM],
+            token=data["refresh"],
+            created_at=refresh.current_time,
+            expires_at=datetime_from_epoch(refresh["exp"]),
+        )
+        return data
@@ -8,13 +8,13 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from users_info.models import UserDetails
-from permission_app.models import RoleMaster
+from permission_app.roles import role_registry
 from permission_app.serializers.role_serializer import RolemasterSerializer
 from common_utility.utils.constants import Role
-from common_utility.utils.date_time_util import get_date_time_dict_in_ist
+from common_utility.utils.date_time_util import IstDateTimeSerializerMixin
 
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+class UserRegistrationSerializer(IstDateTimeSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for user registration functionality.
     """
@@ -164,9 +164,9 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
         # Check if role is present in validated data else set role as GUEST
         validated_data["role_id"] = (
-            RoleMaster.objects.get(name=role).id
+            role_registry.get_by_name(role).id
             if role
-            else RoleMaster.objects.get(name=Role.AUTHER).id
+            else role_registry.get_by_name(Role.AUTHER).id
         )
         # Remove password and confirm_password from validated data
         confirm_password = validated_data.pop("confirm_password", None)
@@ -186,11 +186,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         """
         representation = super().to_representation(instance)
 
-        representation["role"] = RolemasterSerializer(instance.role).data
-        representation["created_at"] = get_date_time_dict_in_ist(
-            datetime_utc_object=instance.created_at, noon_format=True
-        )
-        representation["updated_at"] = get_date_time_dict_in_ist(
-            datetime_utc_object=instance.updated_at, noon_format=True
-        )
+        representation["role"] = RolemasterSerializer(
+            role_registry.get(instance.role_id)
+        ).data
         return representation
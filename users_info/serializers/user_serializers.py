@@ -1,7 +1,11 @@
 from rest_framework import serializers
 from users_info.models import UserDetails
-from common_utility.utils.date_time_util import get_date_time_dict_in_ist
+from common_utility.utils.date_time_util import (
+    IstDateTimeListSerializer,
+    IstDateTimeSerializerMixin,
+)
 from permission_app.serializers.role_serializer import RolemasterSerializer
+from permission_app.roles import role_registry
 
 
 class UserMinimalDetailSerializer(serializers.ModelSerializer):
@@ -25,7 +29,7 @@ class UserMinimalDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(IstDateTimeSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for detailed user information.
 
@@ -51,6 +55,7 @@ class UserSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        list_serializer_class = IstDateTimeListSerializer
 
     def to_representation(self, instance):
         """
@@ -60,11 +65,7 @@ class UserSerializer(serializers.ModelSerializer):
         """
         representation = super().to_representation(instance)
 
-        representation["role"] = RolemasterSerializer(instance.role).data
-        representation["created_at"] = get_date_time_dict_in_ist(
-            datetime_utc_object=instance.created_at, noon_format=True
-        )
-        representation["updated_at"] = get_date_time_dict_in_ist(
-            datetime_utc_object=instance.updated_at, noon_format=True
-        )
+        representation["role"] = RolemasterSerializer(
+            role_registry.get(instance.role_id)
+        ).data
         return representation
@@ -0,0 +1,39 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from users_info.models import UserDetails
+from users_info.authentication import invalidate_user_snapshot
+from users_info.blacklist import token_blacklist_filter
+
+
+@receiver(post_save, sender=UserDetails)
+@receiver(post_delete, sender=UserDetails)
+def invalidate_user_snapshot_cache(sender, instance, **kwargs):
+    """
+    Drop the cached snapshot of a saved or deleted user, e.g. after a role or password
+    change or a deactivation.
+    """
+    invalidate_user_snapshot(instance.id)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def add_to_token_blacklist_filter(sender, instance, created, **kwargs):
+    """
+    Add a blacklisted token to the blacklist filter, e.g. a refresh token rotated or
+    blacklisted from the admin.
+    """
+    if created:
+        token_blacklist_filter.add([instance.token.jti])
+
+
+@receiver(post_delete, sender=BlacklistedToken)
+def forget_token_blacklist_filter_positive(sender, instance, **kwargs):
+    """
+    Drop the cached positive of a token removed from the blacklist.
+
+    Only when its outstanding token is loaded, not to run a query per token when the
+    expired tokens are flushed: the cached positives of the others expire after
+    TOKEN_BLACKLIST_CACHE_TIMEOUT seconds, rejecting the token until then.
+    """
+    if BlacklistedToken.token.is_cached(instance):
+        token_blacklist_filter.forget(instance.token.jti)
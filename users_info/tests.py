@@ -1,3 +1,350 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+import jwt
+from django.test import override_settings
+from django.utils import timezone
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+from cms_app.permission import BaseAdminPermission
+from permission_app.models import RoleMaster
+from users_info.authentication import (
+    CachedJWTAuthentication,
+    get_full_user,
+    user_snapshot_cache,
+)
+from users_info.blacklist import blacklist_user_tokens, token_blacklist_filter
+from users_info.jwt_keys import (
+    build_token_backend,
+    generate_private_key_pem,
+    get_jwt_key_set,
+)
+from users_info.models import UserDetails
+from common_utility.utils.constants import Role
+from common_utility.utils.jwt_utility import CachedKeyVerifier
 
-# Create your tests here.
+
+class CachedJWTAuthenticationTest(APITestCase):
+    """
+    Tests for the authentication resolving users from cached snapshots.
+    """
+
+    def setUp(self):
+        user_snapshot_cache.clear()
+        RoleMaster.objects.create(name=Role.AUTHER)
+        self.super_admin_role = RoleMaster.objects.create(name=Role.SUPER_ADMIN)
+        self.user = UserDetails.objects.create_user(
+            email="author@example.com",
+            password="Author@123",
+            phone="9999999999",
+            full_name="Author",
+        )
+        self.access_token = str(RefreshToken.for_user(self.user).access_token)
+
+    def authenticate(self):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {self.access_token}"
+        )
+        user, _ = CachedJWTAuthentication().authenticate(request)
+        return user
+
+    def has_permission(self, user):
+        return BaseAdminPermission().has_permission(SimpleNamespace(user=user), None)
+
+    def test_cached_snapshot_runs_no_query(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(self.has_permission(self.authenticate()))
+
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+            self.assertTrue(self.has_permission(user))
+
+        self.assertEqual(user.id, self.user.id)
+        self.assertEqual(user.role.name, Role.AUTHER)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_full_user(user).email, "author@example.com")
+
+    def test_saving_the_user_invalidates_the_snapshot(self):
+        self.authenticate()
+
+        self.user.role = self.super_admin_role
+        self.user.save()
+        self.assertEqual(self.authenticate().role.name, Role.SUPER_ADMIN)
+        # A super admin role without the superuser flag
+        self.assertFalse(self.has_permission(self.authenticate()))
+
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_views_needing_the_full_user(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+
+        response = self.client.get("/api/v1/user/authenticate/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["success"]["email"], "author@example.com")
+        self.assertEqual(response.data["success"]["role"]["name"], Role.AUTHER)
+
+        response = self.client.post(
+            "/api/v1/user/authenticate/change-password/",
+            {"current_password": "Author@123", "new_password": "Author@456"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user = UserDetails.objects.get(id=self.user.id)
+        self.assertTrue(user.check_password("Author@456"))
+        self.assertEqual(user.full_name, "Author")
+
+
+class JWTKeyRotationTest(APITestCase):
+    """
+    Tests for the asymmetric JWT signing keys, their rotation and the local verification.
+    """
+
+    def setUp(self):
+        RoleMaster.objects.create(name=Role.AUTHER)
+        self.user = UserDetails.objects.create_user(
+            email="author@example.com",
+            password="Author@123",
+            phone="9999999999",
+            full_name="Author",
+        )
+        self.keys_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.keys_dir)
+
+    def add_key(self, kid, algorithm):
+        with open(os.path.join(self.keys_dir, f"{kid}.pem"), "wb") as key_file:
+            key_file.write(generate_private_key_pem(algorithm))
+
+    @contextmanager
+    def use_keys(self, algorithm):
+        """
+        Sign and verify the tokens with the keys of the directory, like on startup.
+        """
+        get_jwt_key_set.cache_clear()
+        with override_settings(JWT_ALGORITHM=algorithm, JWT_KEYS_DIR=self.keys_dir):
+            with mock.patch.object(
+                Token, "_token_backend", build_token_backend(get_jwt_key_set())
+            ):
+                yield
+        get_jwt_key_set.cache_clear()
+
+    def get_user_details(self, access_token):
+        return self.client.get(
+            "/api/v1/user/authenticate/", HTTP_AUTHORIZATION=f"Bearer {access_token}"
+        )
+
+    def test_tokens_verified_locally_with_the_published_keys(self):
+        for algorithm in ["EdDSA", "RS256"]:
+            with self.subTest(algorithm=algorithm):
+                self.add_key(algorithm, algorithm)
+                with self.use_keys(algorithm):
+                    access_token = str(RefreshToken.for_user(self.user).access_token)
+                    response = self.get_user_details(access_token)
+                    jwks = self.client.get("/api/v1/user/authenticate/jwks/").json()
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(jwt.get_unverified_header(access_token)["kid"], algorithm)
+                self.assertEqual([key["alg"] for key in jwks["keys"]], [algorithm])
+
+                valid, tampered = CachedKeyVerifier(lambda: jwks).verify_many(
+                    [access_token, access_token[:-4] + "AAAA"]
+                )
+                self.assertEqual(valid.claims["user_id"], self.user.id)
+                self.assertIsNone(valid.error)
+                self.assertIsNone(tampered.claims)
+                os.remove(os.path.join(self.keys_dir, f"{algorithm}.pem"))
+
+    def test_key_rotation(self):
+        self.add_key("20240101T000000", "EdDSA")
+        with self.use_keys("EdDSA"):
+            old_token = str(RefreshToken.for_user(self.user).access_token)
+            jwks = self.client.get("/api/v1/user/authenticate/jwks/").json()
+        fetch_jwks = mock.Mock(return_value=jwks)
+        verifier = CachedKeyVerifier(fetch_jwks, min_refresh_interval=0)
+        self.assertIsNone(verifier.verify_many([old_token, old_token])[1].error)
+
+        # The newest key signs, the previous key still verifies its tokens
+        self.add_key("20240201T000000", "EdDSA")
+        with self.use_keys("EdDSA"):
+            new_token = str(RefreshToken.for_user(self.user).access_token)
+            fetch_jwks.return_value = self.client.get("/api/v1/user/authenticate/jwks/").json()
+            self.assertEqual(self.get_user_details(old_token).status_code, status.HTTP_200_OK)
+        self.assertEqual(jwt.get_unverified_header(new_token)["kid"], "20240201T000000")
+
+        # The unknown kid fetches the keys again
+        self.assertEqual(fetch_jwks.call_count, 1)
+        self.assertEqual(verifier.verify(new_token)["user_id"], self.user.id)
+        self.assertEqual(fetch_jwks.call_count, 2)
+
+        # A removed key no longer verifies its tokens
+        os.remove(os.path.join(self.keys_dir, "20240101T000000.pem"))
+        with self.use_keys("EdDSA"):
+            response = self.get_user_details(old_token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class UserLogoutTest(APITestCase):
+    """
+    Tests for the bulk blacklisting of the refresh tokens on logout.
+    """
+
+    def setUp(self):
+        RoleMaster.objects.create(name=Role.AUTHER)
+        self.user = UserDetails.objects.create_user(
+            email="author@example.com",
+            password="Author@123",
+            phone="9999999999",
+            full_name="Author",
+        )
+        self.other_user = UserDetails.objects.create_user(
+            email="other@example.com",
+            password="Other@123",
+            phone="8888888888",
+            full_name="Other",
+        )
+
+    def test_blacklists_the_live_tokens_in_bulk(self):
+        refresh_tokens = [RefreshToken.for_user(self.user) for _ in range(3)]
+        refresh_tokens[0].blacklist()
+        OutstandingToken.objects.filter(jti=refresh_tokens[1]["jti"]).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        other_refresh_token = RefreshToken.for_user(self.other_user)
+
+        # Selection and insert
+        with self.assertNumQueries(2):
+            self.assertEqual(blacklist_user_tokens(self.user), 1)
+        self.assertEqual(blacklist_user_tokens(self.user), 0)
+
+        with self.assertRaises(TokenError):
+            RefreshToken(str(refresh_tokens[2]))
+        RefreshToken(str(other_refresh_token))
+        self.assertEqual(BlacklistedToken.objects.count(), 2)
+
+    def test_logout(self):
+        refresh_token = RefreshToken.for_user(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {refresh_token.access_token}"
+        )
+
+        response = self.client.get("/api/v1/user/authenticate/logout/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.assertRaises(TokenError):
+            RefreshToken(str(refresh_token))
+        # Already logged out of every session
+        response = self.client.get("/api/v1/user/authenticate/logout/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        OutstandingToken.objects.all().delete()
+        response = self.client.get("/api/v1/user/authenticate/logout/")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TokenRefreshTest(APITestCase):
+    """
+    Tests for the refresh of the tokens through the blacklist filter.
+    """
+
+    def setUp(self):
+        RoleMaster.objects.create(name=Role.AUTHER)
+        self.user = UserDetails.objects.create_user(
+            email="author@example.com",
+            password="Author@123",
+            phone="9999999999",
+            full_name="Author",
+        )
+        token_blacklist_filter.positive_cache.clear()
+        token_blacklist_filter.rebuild()
+
+    def refresh(self, refresh_token):
+        return self.client.post(
+            "/api/v1/user/authenticate/refresh/", {"refresh": str(refresh_token)}
+        )
+
+    def test_filter_lookups(self):
+        refresh_token, blacklisted_token = (
+            RefreshToken.for_user(self.user) for _ in range(2)
+        )
+        blacklisted_token.blacklist()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(token_blacklist_filter.is_blacklisted(refresh_token["jti"]))
+        # Checked once, then cached
+        with self.assertNumQueries(1):
+            self.assertTrue(token_blacklist_filter.is_blacklisted(blacklisted_token["jti"]))
+        with self.assertNumQueries(0):
+            self.assertTrue(token_blacklist_filter.is_blacklisted(blacklisted_token["jti"]))
+
+        BlacklistedToken.objects.select_related("token").get().delete()
+        self.assertFalse(token_blacklist_filter.is_blacklisted(blacklisted_token["jti"]))
+
+    def test_refresh_without_rotation_checks_the_db_with_a_local_filter(self):
+        refresh_token = RefreshToken.for_user(self.user)
+        refresh_token.blacklist()
+
+        # Blacklisted by another process, unknown to the local filter
+        with mock.patch.object(
+            api_settings, "ROTATE_REFRESH_TOKENS", False
+        ), mock.patch.object(token_blacklist_filter, "is_blacklisted", return_value=False):
+            response = self.refresh(refresh_token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_redis_errors_fall_back_to_the_db(self):
+        refresh_token, blacklisted_token = (
+            RefreshToken.for_user(self.user) for _ in range(2)
+        )
+        blacklisted_token.blacklist()
+        redis_filter = mock.Mock()
+        redis_filter.contains.side_effect = RedisConnectionError("Connection refused")
+
+        with mock.patch.object(token_blacklist_filter, "_redis_filter", redis_filter):
+            self.assertFalse(token_blacklist_filter.is_blacklisted(refresh_token["jti"]))
+            self.assertTrue(token_blacklist_filter.is_blacklisted(blacklisted_token["jti"]))
+
+    def test_rotation(self):
+        refresh_token = RefreshToken.for_user(self.user)
+
+        response = self.refresh(refresh_token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            jwt.decode(response.data["access"], options={"verify_signature": False})[
+                "user_id"
+            ],
+            self.user.id,
+        )
+        # The rotated token is rejected, the new one is outstanding
+        self.assertEqual(
+            self.refresh(refresh_token).status_code, status.HTTP_401_UNAUTHORIZED
+        )
+        new_refresh_token = response.data["refresh"]
+        self.assertEqual(
+            OutstandingToken.objects.get(token=new_refresh_token).user_id, self.user.id
+        )
+
+        # Rejected by the write when the filter doesn't know the token yet, e.g. the
+        # filter of another process
+        with mock.patch.object(
+            token_blacklist_filter, "is_blacklisted", return_value=False
+        ):
+            self.assertEqual(
+                self.refresh(refresh_token).status_code, status.HTTP_401_UNAUTHORIZED
+            )
+
+        self.assertEqual(blacklist_user_tokens(self.user), 1)
+        self.assertEqual(
+            self.refresh(new_refresh_token).status_code, status.HTTP_401_UNAUTHORIZED
+        )
@@ -5,6 +5,7 @@ from users_info.views import (
     user_login_viewset,
     user_logout_viewset,
     user_change_password_viewset,
+    jwks_viewset,
 )
 
 urlpatterns = [
@@ -64,5 +65,13 @@ urlpatterns = [
             }
         ),
     ),
-   
+    path(
+        "authenticate/jwks/",
+        jwks_viewset.JWKSViewset.as_view(
+            {
+                "get": "get_jwks",
+            }
+        ),
+    ),
+    path("authenticate/refresh/", TokenRefreshView.as_view()),
 ]
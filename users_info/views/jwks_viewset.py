@@ -0,0 +1,56 @@
+import traceback
+from django.conf import settings
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from common_utility.utils.jwt_utility import ASYMMETRIC_ALGORITHMS
+from users_info.jwt_keys import get_jwt_key_set
+
+
+class JWKSViewset(viewsets.ViewSet):
+    """
+    ViewSet publishing the public keys verifying the JWTs.
+
+    - get_jwks: Method to return the JWKS document of the signing keys.
+    """
+
+    authentication_classes = []
+    permission_classes = (AllowAny,)
+
+    def get_jwks(self, request):
+        """
+        Endpoint returning the public keys of the JWT signing keys as a JWKS document.
+
+        Args:
+            request: HTTP request object.
+
+        Returns:
+            Response: The JWKS document, `{"keys": [...]}` as expected by JWT libraries,
+                without keys when the tokens are signed with a shared secret (HS256).
+
+        Other services verify the tokens locally with these keys, e.g. with
+        `common_utility.utils.jwt_utility.CachedKeyVerifier`, selecting the key by the
+        `kid` header of the token. The document can be cached for JWKS_CACHE_TIMEOUT
+        seconds.
+
+        In case of any exceptions during the process, it catches them, logs the error, and returns
+        a 500 Internal Server Error response with the error message.
+        """
+        try:
+            jwks = (
+                get_jwt_key_set().jwks()
+                if settings.JWT_ALGORITHM in ASYMMETRIC_ALGORITHMS
+                else {"keys": []}
+            )
+            response = Response(data=jwks, status=status.HTTP_200_OK)
+            response["Cache-Control"] = f"public, max-age={settings.JWKS_CACHE_TIMEOUT}"
+            return response
+        except Exception as e:
+            print(e, traceback.format_exc())
+            return Response(
+                data={
+                    "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "error": str(e),
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
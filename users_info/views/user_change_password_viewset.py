@@ -2,7 +2,7 @@ import traceback
 from rest_framework import status, viewsets
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from users_info.authentication import CachedJWTAuthentication, get_full_user
 
 
 class UserPasswordViewset(viewsets.ViewSet):
@@ -20,7 +20,7 @@ class UserPasswordViewset(viewsets.ViewSet):
         """
         authentication_classes = []
         if self.request.method in ["GET", "POST"]:
-            authentication_classes = [JWTAuthentication()]
+            authentication_classes = [CachedJWTAuthentication()]
         return authentication_classes
 
     def get_permissions(self):
@@ -92,7 +92,7 @@ class UserPasswordViewset(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            user = request.user
+            user = get_full_user(request.user)
 
             if not user.check_password(current_password):
                 return Response(
@@ -3,7 +3,7 @@ from rest_framework import status, viewsets
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from users_info.authentication import CachedJWTAuthentication, get_full_user
 from users_info.models import UserDetails
 from users_info.serializers.user_login_serializer import UserLoginSeriaizer
 from users_info.serializers.user_serializers import UserSerializer
@@ -26,7 +26,7 @@ class UserLoginViewset(viewsets.ViewSet):
         """
         authentication_classes = []
         if self.request.method in ["GET", "POST"]:
-            authentication_classes = [JWTAuthentication()]
+            authentication_classes = [CachedJWTAuthentication()]
         return authentication_classes
 
     def get_permissions(self):
@@ -142,7 +142,7 @@ class UserLoginViewset(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            serializer = UserSerializer(user)
+            serializer = UserSerializer(get_full_user(user))
             if serializer.data:
                 return Response(
                     data={
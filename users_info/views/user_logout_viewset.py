@@ -3,10 +3,9 @@ from django.contrib.auth import logout
 from django.contrib.auth.models import AnonymousUser
 from rest_framework import status, viewsets
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from users_info.authentication import CachedJWTAuthentication
+from users_info.blacklist import blacklist_user_tokens
 from rest_framework_simplejwt.tokens import OutstandingToken
 
 
@@ -25,7 +24,7 @@ class UserLogoutViewset(viewsets.ViewSet):
         """
         authentication_classes = []
         if self.request.method in ["GET", "POST"]:
-            authentication_classes = [JWTAuthentication()]
+            authentication_classes = [CachedJWTAuthentication()]
         return authentication_classes
 
     def get_permissions(self):
@@ -56,8 +55,8 @@ class UserLogoutViewset(viewsets.ViewSet):
         It then retrieves the outstanding refresh tokens associated with the user. If no outstanding
         tokens are found, it returns a 400 Bad Request response with an error message.
 
-        For each outstanding token, it attempts to blacklist the token using the RefreshToken module.
-        If any token is invalid, it continues to the next token.
+        The unexpired outstanding tokens that aren't blacklisted yet are blacklisted in bulk, selected
+        and inserted in two queries without decoding them.
 
         After blacklisting all outstanding tokens, it logs out the user using the `logout` function.
 
@@ -76,42 +75,28 @@ class UserLogoutViewset(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            try:
-                outstanding_tokens = OutstandingToken.objects.filter(user=user)
-
-                if not outstanding_tokens:
-                    return Response(
-                        data={
-                            "status": status.HTTP_400_BAD_REQUEST,
-                            "error": "Refresh token not found.",
-                        },
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-
-                for token in outstanding_tokens:
-                    try:
-                        refresh_token = RefreshToken(token.token)
-                        refresh_token.blacklist()
-                    except TokenError as e:
-                        print(str(e))
-                        continue
-
-                logout(request)
-                return Response(
-                    {
-                        "status": status.HTTP_200_OK,
-                        "message": "Logout successful.",
-                    },
-                    status=status.HTTP_200_OK,
-                )
-            except TokenError:
+            blacklisted_count = blacklist_user_tokens(user)
+
+            if (
+                not blacklisted_count
+                and not OutstandingToken.objects.filter(user=user).exists()
+            ):
                 return Response(
                     data={
                         "status": status.HTTP_400_BAD_REQUEST,
-                        "error": "Invalid refresh token.",
+                        "error": "Refresh token not found.",
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+
+            logout(request)
+            return Response(
+                {
+                    "status": status.HTTP_200_OK,
+                    "message": "Logout successful.",
+                },
+                status=status.HTTP_200_OK,
+            )
         except Exception as e:
             print(e, traceback.format_exc())
             return Response(